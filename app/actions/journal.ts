@@ -281,6 +281,8 @@ export async function analyzeAllUnanalyzedJournals(): Promise<{
   let skipped = 0;
   let errors = 0;
 
+  const batchEntries: { journal_date: string; texts: string[] }[] = [];
+
   for (const journalDoc of unanalyzed) {
     const date = journalDoc.id;
 
@@ -300,23 +302,47 @@ export async function analyzeAllUnanalyzedJournals(): Promise<{
       continue;
     }
 
-    try {
-      const response = await fetch(
-        "http://localhost:8000/api/v1/journals/analyze",
-        {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({ user_id: uid, journal_date: date, texts: [text] }),
-          cache: "no-store",
-        },
-      );
+    batchEntries.push({ journal_date: date, texts: [text] });
+  }
 
-      if (!response.ok) {
-        const message = await response.text().catch(() => "");
-        throw new Error(`Analysis failed (${response.status}): ${message}`);
-      }
+  if (batchEntries.length === 0) {
+    return { analyzed, skipped, errors };
+  }
 
-      const data = (await response.json()) as BurnoutAnalysisResult;
+  // One batch request: the engine extracts every day together and folds the
+  // cumulative BRI in date order, so we no longer POST one day at a time.
+  let results: { journal_date: string; result: BurnoutAnalysisResult | null }[];
+  try {
+    const response = await fetch(
+      "http://localhost:8000/api/v1/journals/analyze/batch",
+      {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ user_id: uid, entries: batchEntries }),
+        cache: "no-store",
+      },
+    );
+
+    if (!response.ok) {
+      const message = await response.text().catch(() => "");
+      throw new Error(`Analysis failed (${response.status}): ${message}`);
+    }
+
+    results = (await response.json()).results ?? [];
+  } catch (e) {
+    console.error("Failed to analyze unanalyzed journals:", e);
+    return { analyzed, skipped, errors: errors + batchEntries.length };
+  }
+
+  for (const item of results) {
+    const date = item.journal_date;
+    const data = item.result;
+    if (!data) {
+      skipped++;
+      continue;
+    }
+
+    try {
       const baseBriRaw = data.base_score;
       const baseBri =
         baseBriRaw === undefined || baseBriRaw === null
@@ -355,7 +381,7 @@ export async function analyzeAllUnanalyzedJournals(): Promise<{
 
       analyzed++;
     } catch (e) {
-      console.error(`Failed to analyze journal ${date}:`, e);
+      console.error(`Failed to save analysis for journal ${date}:`, e);
       errors++;
     }
   }
@@ -0,0 +1,255 @@
+"""
+End-to-end benchmark of the analysis pipeline with a stubbed extractor.
+
+Drives BurnoutAnalysisService.analyze (and the /journals/analyze route when
+the app can be imported) over synthetic journals from 100 chars to 50 KB,
+and times each stage separately: preprocess_text, extraction,
+_calculate_mbi_scores, BurnoutRiskIndex construction and JSON
+serialization. No network access is needed.
+
+Run from the engine root:
+
+    python -m benchmarks.bench_analysis_pipeline --output results.json
+    python -m benchmarks.bench_analysis_pipeline --baseline results.json --tolerance 0.25
+
+With --baseline the run exits non-zero when any stage's p50 or p95 is more
+than `tolerance` slower than the baseline.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+from models.burnout import BurnoutRiskIndex, MBIDimension
+from services.burnout_analysis import BurnoutAnalysisService
+from services.extraction_backends import ExtractionBackend
+from services.preprocessing import preprocess_text
+
+SIZES = (100, 1_000, 5_000, 20_000, 50_000)
+STAGES = ("preprocess", "extraction", "mbi_scores", "model", "serialize", "analyze", "route")
+COMPARED_PERCENTILES = ("p50", "p95")
+
+SENTENCES = [
+    "I'm so exhausted after another long day at work.",
+    "The deadline pressure never seems to stop.",
+    "Honestly I don't care about the meetings anymore.",
+    "Today I finished the report and felt proud of it.",
+    "My family has been supportive this week.",
+    "I can't sleep and I wake up tired.",
+    "A short walk at lunch helped me feel calm.",
+    "Everything feels pointless when the inbox keeps growing.",
+    "We shipped the feature and the team celebrated.",
+    "I feel overwhelmed and running on empty.",
+]
+
+
+class SyntheticBackend(ExtractionBackend):
+    """Deterministic stand-in for LangExtract: one extraction per sentence."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def extract(self, texts: Sequence[str], *, max_workers: int = 1):
+        if self.latency > 0:
+            time.sleep(self.latency)
+        results = []
+        for text in texts:
+            count = max(1, text.count("."))
+            results.append([
+                {
+                    "emotion_type": "negative" if index % 3 else "positive",
+                    "stress_level": 0.6,
+                    "cynical_thoughts": index % 4 == 0,
+                    "mbi_dimension": "emotional_exhaustion",
+                    "confidence": 0.8,
+                    "ee_score": 40 + index % 50,
+                    "dp_score": 20 + index % 30,
+                    "pa_score": 10 + index % 40,
+                }
+                for index in range(count)
+            ])
+        return results
+
+
+def build_corpus(size: int, count: int, seed: int) -> List[str]:
+    """Synthetic journals of roughly `size` characters."""
+    rng = random.Random(seed + size)
+    corpus = []
+    for _ in range(count):
+        parts: List[str] = []
+        total = 0
+        while total < size:
+            sentence = rng.choice(SENTENCES)
+            parts.append(sentence)
+            total += len(sentence) + 1
+        corpus.append(" ".join(parts)[:size])
+    return corpus
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile (q in 0-100)."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    total_s = sum(samples_ms) / 1000.0
+    return {
+        "count": len(samples_ms),
+        "mean_ms": sum(samples_ms) / len(samples_ms),
+        "p50": percentile(samples_ms, 50),
+        "p95": percentile(samples_ms, 95),
+        "p99": percentile(samples_ms, 99),
+        "throughput_per_s": (len(samples_ms) / total_s) if total_s > 0 else 0.0,
+    }
+
+
+def timed(func: Callable[[], object]) -> tuple[object, float]:
+    started = time.perf_counter()
+    value = func()
+    return value, (time.perf_counter() - started) * 1000.0
+
+
+def load_route_client():
+    """TestClient for the app, or None when Firestore cannot be initialised here."""
+    try:
+        from fastapi.testclient import TestClient
+        from main import app
+        from controllers import journal_controller
+    except Exception as e:
+        print(f"Skipping route benchmark: {e}", file=sys.stderr)
+        return None, None
+    return TestClient(app), journal_controller
+
+
+def run(iterations: int, seed: int, latency: float, include_route: bool) -> Dict[str, Dict[str, Dict[str, float]]]:
+    service = BurnoutAnalysisService(backend=SyntheticBackend(latency))
+    client, journal_controller = load_route_client() if include_route else (None, None)
+    if journal_controller is not None:
+        journal_controller._analysis_service = service
+
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for size in SIZES:
+        samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        for text in build_corpus(size, iterations, seed):
+            (cleaned_text, sentences), ms = timed(lambda: preprocess_text(text))
+            samples["preprocess"].append(ms)
+
+            features, ms = timed(lambda: service._extract_features_with_langextract(cleaned_text, [cleaned_text]))
+            samples["extraction"].append(ms)
+
+            mbi_scores, ms = timed(lambda: service._calculate_mbi_scores(features, cleaned_text, len(cleaned_text)))
+            samples["mbi_scores"].append(ms)
+
+            result, ms = timed(lambda: BurnoutRiskIndex(
+                base_score=50.0,
+                overall_score=50.0,
+                emotional_exhaustion=mbi_scores[MBIDimension.EMOTIONAL_EXHAUSTION],
+                depersonalization=mbi_scores[MBIDimension.DEPERSONALIZATION],
+                personal_accomplishment=mbi_scores[MBIDimension.PERSONAL_ACCOMPLISHMENT],
+                features=features,
+                text_length=len(cleaned_text),
+                sentence_count=len(sentences),
+                risk_level="high",
+            ))
+            samples["model"].append(ms)
+
+            _, ms = timed(result.model_dump_json)
+            samples["serialize"].append(ms)
+
+            _, ms = timed(lambda: service.analyze(text, mode="llm"))
+            samples["analyze"].append(ms)
+
+            if client is not None:
+                _, ms = timed(lambda: client.post("/api/v1/journals/analyze", json={"text": text, "mode": "llm"}))
+                samples["route"].append(ms)
+
+        results[str(size)] = {stage: summarize(values) for stage, values in samples.items() if values}
+    return results
+
+
+def find_regressions(
+    current: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    tolerance: float,
+) -> List[str]:
+    """Describe every stage/percentile slower than baseline by more than `tolerance`."""
+    regressions = []
+    for size, stages in current.items():
+        for stage, stats in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if not base:
+                continue
+            for key in COMPARED_PERCENTILES:
+                if base[key] > 0 and stats[key] > base[key] * (1.0 + tolerance):
+                    regressions.append(
+                        f"{size} chars {stage} {key}: {stats[key]:.3f} ms vs {base[key]:.3f} ms baseline"
+                    )
+    return regressions
+
+
+def print_table(results: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+    print(f"{'chars':>7} {'stage':<11} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'ops/s':>10}")
+    for size, stages in results.items():
+        for stage, stats in stages.items():
+            print(
+                f"{size:>7} {stage:<11} {stats['p50']:>10.3f} {stats['p95']:>10.3f} "
+                f"{stats['p99']:>10.3f} {stats['throughput_per_s']:>10.1f}"
+            )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=30, help="journals per size")
+    parser.add_argument("--seed", type=int, default=7, help="corpus seed")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated model latency per call")
+    parser.add_argument("--no-route", action="store_true", help="skip the /journals/analyze route")
+    parser.add_argument("--output", help="write results JSON to this path")
+    parser.add_argument("--baseline", help="results JSON from a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    results = run(args.iterations, args.seed, args.latency_ms / 1000.0, not args.no_route)
+    print_table(results)
+
+    if args.output:
+        payload = {
+            "meta": {
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "iterations": args.iterations,
+                "seed": args.seed,
+                "latency_ms": args.latency_ms,
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            print("Regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} of baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Benchmark: Firestore RPCs per update/delete, read-modify-read vs. guarded writes.
+
+Counts the RPCs the Firestore client actually sends (batch_get_documents,
+commit, run_query, ...) for the controllers' update and delete methods and
+for the previous get/update/get and get/delete pattern, and times both.
+Uses the Firestore configured for the engine; run it against the emulator:
+
+    USE_EMULATOR=true python -m benchmarks.bench_firestore_round_trips
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+from controllers.journal_controller import JournalController
+from controllers.user_controller import UserController
+from database import db, JOURNALS_COLLECTION
+from models.journal import JournalCreate, JournalUpdate
+from models.user import UserCreate
+
+RPC_METHODS = ("batch_get_documents", "commit", "run_query", "begin_transaction", "rollback", "batch_write")
+
+
+class CountingApi:
+    """Proxy over the client's GAPIC stub counting each RPC it issues."""
+
+    def __init__(self, api: Any):
+        self._api = api
+        self.calls: Counter = Counter()
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if name not in RPC_METHODS:
+            return attr
+
+        def counted(*args, **kwargs):
+            self.calls[name] += 1
+            return attr(*args, **kwargs)
+
+        return counted
+
+
+def legacy_update_journal(journal_id: str, journal_data: JournalUpdate) -> Optional[Dict[str, Any]]:
+    """Baseline: read, update, read again, as update_journal used to do."""
+    journal_ref = db.collection(JOURNALS_COLLECTION).document(journal_id)
+    if not journal_ref.get().exists:
+        return None
+    journal_ref.update({"title": journal_data.title})
+    return journal_ref.get().to_dict()
+
+
+def legacy_delete_journal(journal_id: str) -> bool:
+    """Baseline: read, then delete, as delete_journal used to do."""
+    journal_ref = db.collection(JOURNALS_COLLECTION).document(journal_id)
+    if not journal_ref.get().exists:
+        return False
+    journal_ref.delete()
+    return True
+
+
+def measure(api: CountingApi, operation: Callable[[str], Any], journal_ids: List[str]) -> Dict[str, float]:
+    """RPCs and milliseconds per call of `operation` over `journal_ids`."""
+    api.calls.clear()
+    start = time.perf_counter()
+    for journal_id in journal_ids:
+        operation(journal_id)
+    elapsed = time.perf_counter() - start
+    return {
+        "rpcs": sum(api.calls.values()) / len(journal_ids),
+        "ms": elapsed * 1000 / len(journal_ids),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--journals", type=int, default=50, help="journals created per variant")
+    args = parser.parse_args()
+
+    api = CountingApi(db._firestore_api)
+    db._firestore_api_internal = api
+
+    user = UserController.create_user(UserCreate(email=f"bench-{time.time_ns()}@example.com", name="Bench"))
+    try:
+        def create_journals() -> List[str]:
+            return [
+                JournalController.create_journal(JournalCreate(user_id=user.id, title=f"Bench {i}", content="Benchmark entry")).id
+                for i in range(args.journals)
+            ]
+
+        patch = JournalUpdate(title="Updated")
+        legacy_ids, guarded_ids = create_journals(), create_journals()
+        rows = [
+            ("update (get/update/get)", measure(api, lambda j: legacy_update_journal(j, patch), legacy_ids)),
+            ("update (guarded)", measure(api, lambda j: JournalController.update_journal(j, patch), guarded_ids)),
+            ("delete (get/delete)", measure(api, legacy_delete_journal, legacy_ids)),
+            ("delete (guarded)", measure(api, JournalController.delete_journal, guarded_ids)),
+            ("delete missing (guarded)", measure(api, JournalController.delete_journal, guarded_ids)),
+        ]
+    finally:
+        UserController.delete_user(user.id)
+
+    print(f"{'operation':<26} {'rpcs/op':>8} {'ms/op':>8}")
+    for name, result in rows:
+        print(f"{name:<26} {result['rpcs']:>8.2f} {result['ms']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
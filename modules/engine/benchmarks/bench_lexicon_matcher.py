@@ -0,0 +1,76 @@
+"""
+Microbenchmark: compiled lexicon matcher vs. the per-term regex loop.
+
+Run from the engine root:
+
+    python -m benchmarks.bench_lexicon_matcher
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import timeit
+from typing import Dict, List
+
+from services.lexicon_matcher import LEXICON_MATCHER, PROTECTIVE, default_lexicons
+
+SAMPLE_SENTENCES = [
+    "I'm so exhausted and overwhelmed with work, and the deadline pressure is constant.",
+    "Honestly I don't care anymore about the meetings; it all feels pointless.",
+    "Today I accomplished something and felt proud of the progress we made.",
+    "My family has been supportive and a short break helped me feel calm.",
+    "I can't sleep, I wake up tired and running on empty most days.",
+]
+
+
+def per_term_counts(text: str, lexicons: Dict[str, List[str]]) -> Dict[str, int]:
+    """Baseline: one re.search per term, as _compute_coach_modifier used to do."""
+    counts = {}
+    for category, terms in lexicons.items():
+        counts[category] = sum(
+            1
+            for term in terms
+            if re.search(rf"\b{re.escape(term)}\b", text, flags=re.IGNORECASE)
+        )
+    return counts
+
+
+def build_text(target_chars: int) -> str:
+    parts: List[str] = []
+    total = 0
+    index = 0
+    while total < target_chars:
+        sentence = SAMPLE_SENTENCES[index % len(SAMPLE_SENTENCES)]
+        parts.append(sentence)
+        total += len(sentence) + 1
+        index += 1
+    return " ".join(parts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    lexicons = default_lexicons()
+    protective_only = {PROTECTIVE: lexicons[PROTECTIVE]}
+    term_count = sum(len(terms) for terms in lexicons.values())
+
+    print(f"Lexicon terms: {term_count} across {len(lexicons)} categories")
+    print(f"{'chars':>8} {'loop(all) ms':>14} {'loop(prot) ms':>14} {'matcher ms':>12} {'speedup(all)':>13}")
+    for size in (100, 1_000, 10_000, 50_000):
+        text = build_text(size)
+        number = max(1, 20_000 // size)
+
+        loop_all = min(timeit.repeat(lambda: per_term_counts(text, lexicons), number=number, repeat=args.repeat)) / number
+        loop_protective = min(timeit.repeat(lambda: per_term_counts(text, protective_only), number=number, repeat=args.repeat)) / number
+        matcher = min(timeit.repeat(lambda: LEXICON_MATCHER.match(text), number=number, repeat=args.repeat)) / number
+
+        print(
+            f"{len(text):>8} {loop_all * 1000:>14.3f} {loop_protective * 1000:>14.3f} "
+            f"{matcher * 1000:>12.3f} {loop_all / matcher:>12.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,10 @@ class Settings:
     
     # API Configuration
     API_V1_PREFIX: str = "/api/v1"
+    # Query users by email when the user_emails index has no valid entry.
+    # Needed while users are also written outside this API (the Next.js app);
+    # costs one extra round trip on every index miss, e.g. each new sign-up.
+    USER_EMAIL_QUERY_FALLBACK: bool = os.getenv("USER_EMAIL_QUERY_FALLBACK", "False").lower() == "true"
     
     # Gemini/LangExtract Configuration
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
@@ -31,6 +35,67 @@ class Settings:
     )
     GEMINI_LIVE_VOICE: str = os.getenv("GEMINI_LIVE_VOICE", "Kore")
     LIVE_SESSION_SECRET: str = os.getenv("LIVE_SESSION_SECRET", "")
+
+    # Analysis Cache Configuration
+    ANALYSIS_CACHE_ENABLED: bool = os.getenv("ANALYSIS_CACHE_ENABLED", "True").lower() == "true"
+    ANALYSIS_CACHE_MAX_ENTRIES: int = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "512"))
+    ANALYSIS_CACHE_TTL_SECONDS: float = float(os.getenv("ANALYSIS_CACHE_TTL_SECONDS", "86400"))
+    # Optional SQLite file for a cache tier that survives restarts
+    ANALYSIS_CACHE_PATH: str = os.getenv("ANALYSIS_CACHE_PATH", "")
+    # LRU size of the per-sentence feature cache used by incremental analysis
+    ANALYSIS_SEGMENT_CACHE_MAX_ENTRIES: int = int(os.getenv("ANALYSIS_SEGMENT_CACHE_MAX_ENTRIES", "4096"))
+
+    # Worker threads for blocking analysis work (LangExtract + Firestore)
+    ANALYSIS_MAX_WORKERS: int = int(os.getenv("ANALYSIS_MAX_WORKERS", "4"))
+    # Threads for concurrent LangExtract calls (journal + coach branches)
+    ANALYSIS_EXTRACTION_WORKERS: int = int(os.getenv("ANALYSIS_EXTRACTION_WORKERS", "8"))
+    # Parallel model calls per batch analysis request
+    ANALYSIS_BATCH_MAX_WORKERS: int = int(os.getenv("ANALYSIS_BATCH_MAX_WORKERS", "4"))
+    # Seconds auto mode waits for LangExtract before using lexicon scores (0 = no limit)
+    ANALYSIS_LLM_LATENCY_BUDGET_SECONDS: float = float(os.getenv("ANALYSIS_LLM_LATENCY_BUDGET_SECONDS", "20"))
+    # Extraction backend: langextract (live), record (live + save fixture) or replay (offline)
+    ANALYSIS_BACKEND: str = os.getenv("ANALYSIS_BACKEND", "langextract")
+    ANALYSIS_FIXTURE_PATH: str = os.getenv("ANALYSIS_FIXTURE_PATH", "")
+    # Simulated model latency per replayed call
+    ANALYSIS_REPLAY_LATENCY_MS: float = float(os.getenv("ANALYSIS_REPLAY_LATENCY_MS", "0"))
+    # Client-side pacing of Gemini calls (process-wide)
+    ANALYSIS_RATE_LIMIT_RPS: float = float(os.getenv("ANALYSIS_RATE_LIMIT_RPS", "10"))
+    ANALYSIS_RATE_LIMIT_BURST: float = float(os.getenv("ANALYSIS_RATE_LIMIT_BURST", "20"))
+    # Adaptive (AIMD) concurrency for Gemini calls: starting and maximum limit
+    ANALYSIS_CONCURRENCY_INITIAL: int = int(os.getenv("ANALYSIS_CONCURRENCY_INITIAL", "4"))
+    ANALYSIS_CONCURRENCY_MAX: int = int(os.getenv("ANALYSIS_CONCURRENCY_MAX", "16"))
+    # Calls slower than this shrink the concurrency limit like a 429 does (0 = ignore latency)
+    ANALYSIS_LATENCY_TARGET_SECONDS: float = float(os.getenv("ANALYSIS_LATENCY_TARGET_SECONDS", "15"))
+    ANALYSIS_RETRY_ATTEMPTS: int = int(os.getenv("ANALYSIS_RETRY_ATTEMPTS", "4"))
+    # Seconds one extraction call may spend waiting for capacity and retrying
+    ANALYSIS_RETRY_BUDGET_SECONDS: float = float(os.getenv("ANALYSIS_RETRY_BUDGET_SECONDS", "45"))
+    # Circuit breaker: open after N consecutive failed or slow calls, probe again after the reset time
+    ANALYSIS_BREAKER_FAILURES: int = int(os.getenv("ANALYSIS_BREAKER_FAILURES", "5"))
+    ANALYSIS_BREAKER_SLOW_CALL_SECONDS: float = float(os.getenv("ANALYSIS_BREAKER_SLOW_CALL_SECONDS", "30"))
+    ANALYSIS_BREAKER_RESET_SECONDS: float = float(os.getenv("ANALYSIS_BREAKER_RESET_SECONDS", "30"))
+    # Model calls admitted at once by the priority scheduler; bulk work never uses the reserved slots
+    ANALYSIS_SCHEDULER_SLOTS: int = int(os.getenv("ANALYSIS_SCHEDULER_SLOTS", "8"))
+    ANALYSIS_SCHEDULER_INTERACTIVE_RESERVE: int = int(os.getenv("ANALYSIS_SCHEDULER_INTERACTIVE_RESERVE", "2"))
+    # Per-user cumulative BRI series kept in memory for previous-journal lookups
+    ANALYSIS_BRI_CACHE_USERS: int = int(os.getenv("ANALYSIS_BRI_CACHE_USERS", "1024"))
+    ANALYSIS_BRI_CACHE_TTL_SECONDS: float = float(os.getenv("ANALYSIS_BRI_CACHE_TTL_SECONDS", "300"))
+    # SQLite file for background analysis jobs (empty = in memory, lost on restart)
+    ANALYSIS_JOB_DB_PATH: str = os.getenv("ANALYSIS_JOB_DB_PATH", "analysis_jobs.db")
+    ANALYSIS_JOB_WORKERS: int = int(os.getenv("ANALYSIS_JOB_WORKERS", "2"))
+    # Running jobs not renewed within the lease are retried, up to MAX_ATTEMPTS claims
+    ANALYSIS_JOB_LEASE_SECONDS: float = float(os.getenv("ANALYSIS_JOB_LEASE_SECONDS", "60"))
+    ANALYSIS_JOB_MAX_ATTEMPTS: int = int(os.getenv("ANALYSIS_JOB_MAX_ATTEMPTS", "3"))
+    # Estimated tokens per LangExtract request; longer texts are chunked and extracted in parallel (0 = off)
+    ANALYSIS_CHUNK_TOKENS: int = int(os.getenv("ANALYSIS_CHUNK_TOKENS", "1500"))
+    # Extract per sentence and reuse features of unchanged sentences on re-analysis
+    ANALYSIS_INCREMENTAL: bool = os.getenv("ANALYSIS_INCREMENTAL", "False").lower() == "true"
+    # Scorer for API requests that send no mode: llm, auto (lexicon-first cascade) or lexicon
+    ANALYSIS_DEFAULT_MODE: str = os.getenv("ANALYSIS_DEFAULT_MODE", "llm")
+    # Auto mode escalates local scores inside [LOW, HIGH] to LangExtract
+    ANALYSIS_CASCADE_LOW: float = float(os.getenv("ANALYSIS_CASCADE_LOW", "20"))
+    ANALYSIS_CASCADE_HIGH: float = float(os.getenv("ANALYSIS_CASCADE_HIGH", "55"))
+    # Fraction of confident local results also scored by LangExtract to measure agreement
+    ANALYSIS_CASCADE_SHADOW_RATE: float = float(os.getenv("ANALYSIS_CASCADE_SHADOW_RATE", "0"))
     
     class Config:
         case_sensitive = True
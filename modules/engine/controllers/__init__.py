@@ -1,5 +1,6 @@
 """Controllers package."""
 from .user_controller import UserController
 from .journal_controller import JournalController
+from .job_controller import JobController
 
-__all__ = ["UserController", "JournalController"]
+__all__ = ["UserController", "JournalController", "JobController"]
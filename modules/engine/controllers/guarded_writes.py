@@ -0,0 +1,139 @@
+"""Update and delete helpers that use Firestore preconditions to save round trips."""
+from typing import Any, Callable, Dict, Optional
+from google.api_core.exceptions import FailedPrecondition, NotFound
+
+# Reads retried when a concurrent write invalidates the update_time precondition.
+WRITE_ATTEMPTS = 3
+
+# Adds writes that must commit atomically with the guarded one, given the
+# document's current data, e.g. maintaining an index collection.
+SideWrites = Callable[[Any, Dict[str, Any]], None]
+
+
+def update_existing(
+    client: Any,
+    doc_ref: Any,
+    patch: Dict[str, Any],
+    side_writes: Optional[SideWrites] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Apply `patch` to an existing document and return its new data.
+
+    The document is read once and written with that read's update_time as
+    precondition, so the merged read and patch are exactly what was stored.
+    That is two round trips, or one when `patch` is empty. If another write
+    lands in between, the read is retried. `side_writes` are committed in
+    the same batch as the update.
+
+    Returns:
+        The updated document data, or None if the document does not exist
+
+    Raises:
+        FailedPrecondition: The document kept changing for WRITE_ATTEMPTS reads
+        AlreadyExists: A side write created a document that already exists
+    """
+    for attempt in range(WRITE_ATTEMPTS):
+        snapshot = doc_ref.get()
+        if not snapshot.exists:
+            return None
+        data = snapshot.to_dict()
+        if not patch:
+            return data
+        batch = client.batch()
+        if side_writes is not None:
+            side_writes(batch, data)
+        batch.update(doc_ref, patch, option=client.write_option(last_update_time=snapshot.update_time))
+        try:
+            batch.commit()
+        except NotFound:
+            return None
+        except FailedPrecondition:
+            if attempt == WRITE_ATTEMPTS - 1:
+                raise
+            continue
+        return {**data, **patch}
+
+
+async def update_existing_async(
+    client: Any,
+    doc_ref: Any,
+    patch: Dict[str, Any],
+    side_writes: Optional[SideWrites] = None,
+) -> Optional[Dict[str, Any]]:
+    """update_existing for AsyncClient document references."""
+    for attempt in range(WRITE_ATTEMPTS):
+        snapshot = await doc_ref.get()
+        if not snapshot.exists:
+            return None
+        data = snapshot.to_dict()
+        if not patch:
+            return data
+        batch = client.batch()
+        if side_writes is not None:
+            side_writes(batch, data)
+        batch.update(doc_ref, patch, option=client.write_option(last_update_time=snapshot.update_time))
+        try:
+            await batch.commit()
+        except NotFound:
+            return None
+        except FailedPrecondition:
+            if attempt == WRITE_ATTEMPTS - 1:
+                raise
+            continue
+        return {**data, **patch}
+
+
+def delete_existing(client: Any, doc_ref: Any, side_writes: Optional[SideWrites] = None) -> bool:
+    """
+    Delete a document; False if it did not exist.
+
+    Without `side_writes` this is one round trip guarded by an exists
+    precondition. Otherwise the document is read first so `side_writes` can
+    see its data, and the delete is guarded by that read's update_time.
+    """
+    if side_writes is None:
+        try:
+            doc_ref.delete(option=client.write_option(exists=True))
+        except NotFound:
+            return False
+        return True
+
+    for attempt in range(WRITE_ATTEMPTS):
+        snapshot = doc_ref.get()
+        if not snapshot.exists:
+            return False
+        batch = client.batch()
+        side_writes(batch, snapshot.to_dict())
+        batch.delete(doc_ref, option=client.write_option(last_update_time=snapshot.update_time))
+        try:
+            batch.commit()
+        except FailedPrecondition:
+            if attempt == WRITE_ATTEMPTS - 1:
+                raise
+            continue
+        return True
+
+
+async def delete_existing_async(client: Any, doc_ref: Any, side_writes: Optional[SideWrites] = None) -> bool:
+    """delete_existing for AsyncClient document references."""
+    if side_writes is None:
+        try:
+            await doc_ref.delete(option=client.write_option(exists=True))
+        except NotFound:
+            return False
+        return True
+
+    for attempt in range(WRITE_ATTEMPTS):
+        snapshot = await doc_ref.get()
+        if not snapshot.exists:
+            return False
+        batch = client.batch()
+        side_writes(batch, snapshot.to_dict())
+        batch.delete(doc_ref, option=client.write_option(last_update_time=snapshot.update_time))
+        try:
+            await batch.commit()
+        except FailedPrecondition:
+            if attempt == WRITE_ATTEMPTS - 1:
+                raise
+            continue
+        return True
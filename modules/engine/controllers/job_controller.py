@@ -0,0 +1,102 @@
+"""Background analysis job controller."""
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from models.job import AnalysisJob
+from controllers.journal_controller import JournalController, get_analysis_service
+from services.executor import run_blocking
+from services.job_queue import Job, JobQueue, JobStore
+from services.scheduler import PRIORITY_BULK, priority_scope
+from config import settings
+
+JOB_ANALYZE_JOURNAL = "analyze_journal"
+
+_job_queue: Optional[JobQueue] = None
+
+
+def _run_job(kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Execute one job; JournalController persists the burnout_analysis fields."""
+    if kind != JOB_ANALYZE_JOURNAL:
+        raise ValueError(f"Unknown job kind: {kind}")
+    # Nobody is waiting on a background job; its model calls yield to interactive ones.
+    with priority_scope(PRIORITY_BULK, tenant=payload.get("user_id") or payload["journal_id"]):
+        result = JournalController.analyze_journal(payload["journal_id"], mode=payload.get("mode"))
+    if result is None:
+        raise LookupError(f"Journal with ID {payload['journal_id']} not found")
+    return result.model_dump(mode="json")
+
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide job queue (workers start with the app)."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue(
+            JobStore(
+                settings.ANALYSIS_JOB_DB_PATH or ":memory:",
+                lease_seconds=settings.ANALYSIS_JOB_LEASE_SECONDS,
+                max_attempts=settings.ANALYSIS_JOB_MAX_ATTEMPTS,
+            ),
+            _run_job,
+            workers=settings.ANALYSIS_JOB_WORKERS,
+        )
+    return _job_queue
+
+
+def _to_model(job: Job) -> AnalysisJob:
+    return AnalysisJob(
+        id=job["id"],
+        status=job["status"],
+        journal_id=job["payload"]["journal_id"],
+        mode=job["payload"].get("mode") or settings.ANALYSIS_DEFAULT_MODE,
+        result=job["result"],
+        error=job["error"],
+        attempts=job["attempts"],
+        created_at=datetime.fromtimestamp(job["created_at"], tz=timezone.utc),
+        updated_at=datetime.fromtimestamp(job["updated_at"], tz=timezone.utc),
+    )
+
+class JobController:
+    """Controller for background analysis jobs."""
+
+    @staticmethod
+    def start_workers() -> None:
+        """Start job workers; they also resume jobs whose worker died."""
+        get_job_queue().start()
+
+    @staticmethod
+    def stop_workers() -> None:
+        """Stop job workers after their current job."""
+        if _job_queue is not None:
+            _job_queue.stop(timeout=5.0)
+
+    @staticmethod
+    def submit_analysis(journal_id: str, mode: Optional[str] = None, user_id: Optional[str] = None) -> AnalysisJob:
+        """Queue analysis of a journal entry and return the job right away; `user_id` groups it for fair scheduling."""
+        job = get_job_queue().submit(
+            JOB_ANALYZE_JOURNAL,
+            {"journal_id": journal_id, "mode": mode or settings.ANALYSIS_DEFAULT_MODE, "user_id": user_id},
+        )
+        return _to_model(job)
+
+    @staticmethod
+    def get_job(job_id: str) -> Optional[AnalysisJob]:
+        """Get a job's status and, once finished, its result or error."""
+        job = get_job_queue().get(job_id)
+        return _to_model(job) if job else None
+
+    @staticmethod
+    async def submit_analysis_async(
+        journal_id: str, mode: Optional[str] = None, user_id: Optional[str] = None
+    ) -> AnalysisJob:
+        """Awaitable `submit_analysis`; the SQLite write runs on the analysis pool."""
+        return await run_blocking(
+            get_analysis_service().executor,
+            JobController.submit_analysis,
+            journal_id,
+            mode=mode,
+            user_id=user_id,
+        )
+
+    @staticmethod
+    async def get_job_async(job_id: str) -> Optional[AnalysisJob]:
+        """Awaitable `get_job`; the SQLite read runs on the analysis pool."""
+        return await run_blocking(get_analysis_service().executor, JobController.get_job, job_id)
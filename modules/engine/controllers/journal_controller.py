@@ -1,13 +1,199 @@
 """Journal controller with business logic."""
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from datetime import datetime, timezone
 from firebase_admin import firestore
-from database import db, JOURNALS_COLLECTION, USERS_COLLECTION
-from models.journal import Journal, JournalCreate, JournalUpdate
-from models.burnout import BurnoutRiskIndex
-from services.burnout_analysis import BurnoutAnalysisService
+from database import db, get_async_db, JOURNALS_COLLECTION, USERS_COLLECTION
+from models.journal import Journal, JournalCreate, JournalUpdate, JournalListItem
+from models.burnout import (
+    CUMULATIVE_BRI_ALPHA,
+    BurnoutRiskIndex,
+    BatchAnalysisEntry,
+    BatchAnalysisItem,
+    BatchAnalysisResponse,
+    CumulativeRecomputeResult,
+    CumulativeRecomputeResponse,
+)
+from services.burnout_analysis import (
+    BurnoutAnalysisService,
+    EXTRACTION_PROMPT,
+    MODEL_ID,
+    PROMPT_VERSION,
+)
+from services.extraction_backends import ExtractionBackend, build_backend
+from services.rate_limiter import (
+    AdaptiveConcurrencyLimiter,
+    ExtractionGovernor,
+    RateLimitedBackend,
+    RetryPolicy,
+    TokenBucket,
+)
+from services.analysis_cache import AnalysisCache
+from services.cascade import CascadePolicy
+from services.circuit_breaker import CircuitBreaker
+from services.deadline import DeadlineExceeded, expired, remaining
+from controllers.guarded_writes import (
+    delete_existing,
+    delete_existing_async,
+    update_existing,
+    update_existing_async,
+)
+from controllers.pagination import fetch_page, fetch_page_async, parse_fields
+from services.executor import run_blocking
+from services.bri_series_cache import BriSeries, CumulativeBriCache
+from services.scheduler import PRIORITY_BULK, PriorityScheduler, ScheduledBackend, priority_scope
 from config import settings
 
+_analysis_service: Optional[BurnoutAnalysisService] = None
+_bri_series_cache: Optional[CumulativeBriCache] = None
+
+# Fields a journal list can be projected to with `fields=`.
+JOURNAL_LIST_FIELDS = ("user_id", "title", "content", "created_at", "updated_at")
+
+# Firestore allows at most 500 writes per batch.
+_WRITE_BATCH_SIZE = 500
+
+
+def _rate_limited(backend: ExtractionBackend) -> ExtractionBackend:
+    """Put live Gemini calls behind the process-wide limiter and retry policy."""
+    governor = ExtractionGovernor(
+        bucket=TokenBucket(settings.ANALYSIS_RATE_LIMIT_RPS, settings.ANALYSIS_RATE_LIMIT_BURST)
+        if settings.ANALYSIS_RATE_LIMIT_RPS > 0
+        else None,
+        concurrency=AdaptiveConcurrencyLimiter(
+            initial=settings.ANALYSIS_CONCURRENCY_INITIAL,
+            max_limit=settings.ANALYSIS_CONCURRENCY_MAX,
+            latency_target=settings.ANALYSIS_LATENCY_TARGET_SECONDS or None,
+        ),
+        retry=RetryPolicy(max_attempts=settings.ANALYSIS_RETRY_ATTEMPTS),
+    )
+    return RateLimitedBackend(
+        backend,
+        governor,
+        call_budget=settings.ANALYSIS_RETRY_BUDGET_SECONDS or None,
+    )
+
+
+def get_analysis_service() -> BurnoutAnalysisService:
+    """Return the process-wide analysis service so its cache is shared across requests."""
+    global _analysis_service
+    if _analysis_service is None:
+        cache = None
+        segment_cache = None
+        if settings.ANALYSIS_CACHE_ENABLED:
+            cache = AnalysisCache(
+                max_entries=settings.ANALYSIS_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.ANALYSIS_CACHE_TTL_SECONDS,
+                db_path=settings.ANALYSIS_CACHE_PATH or None,
+            )
+            segment_cache = AnalysisCache(
+                max_entries=settings.ANALYSIS_SEGMENT_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.ANALYSIS_CACHE_TTL_SECONDS,
+                db_path=settings.ANALYSIS_CACHE_PATH or None,
+                table="segment_cache",
+            )
+        backend = build_backend(
+            settings.ANALYSIS_BACKEND,
+            api_key=settings.GEMINI_API_KEY,
+            model_id=MODEL_ID,
+            prompt_version=PROMPT_VERSION,
+            prompt_description=EXTRACTION_PROMPT,
+            examples_factory=BurnoutAnalysisService._build_examples,
+            fixture_path=settings.ANALYSIS_FIXTURE_PATH,
+            replay_latency=settings.ANALYSIS_REPLAY_LATENCY_MS / 1000.0,
+            wrap_live=_rate_limited,
+        )
+        if backend is not None:
+            # Interactive analyses get model capacity ahead of bulk backfills.
+            backend = ScheduledBackend(
+                backend,
+                PriorityScheduler(
+                    settings.ANALYSIS_SCHEDULER_SLOTS,
+                    interactive_reserve=settings.ANALYSIS_SCHEDULER_INTERACTIVE_RESERVE,
+                ),
+            )
+        _analysis_service = BurnoutAnalysisService(
+            api_key=settings.GEMINI_API_KEY,
+            backend=backend,
+            cache=cache,
+            segment_cache=segment_cache,
+            max_workers=settings.ANALYSIS_MAX_WORKERS,
+            extraction_workers=settings.ANALYSIS_EXTRACTION_WORKERS,
+            llm_latency_budget=settings.ANALYSIS_LLM_LATENCY_BUDGET_SECONDS or None,
+            incremental=settings.ANALYSIS_INCREMENTAL,
+            chunk_token_budget=settings.ANALYSIS_CHUNK_TOKENS or None,
+            breaker=CircuitBreaker(
+                failure_threshold=settings.ANALYSIS_BREAKER_FAILURES,
+                reset_timeout=settings.ANALYSIS_BREAKER_RESET_SECONDS,
+                slow_call_seconds=settings.ANALYSIS_BREAKER_SLOW_CALL_SECONDS or None,
+            ),
+            cascade=CascadePolicy(
+                low=settings.ANALYSIS_CASCADE_LOW,
+                high=settings.ANALYSIS_CASCADE_HIGH,
+                shadow_rate=settings.ANALYSIS_CASCADE_SHADOW_RATE,
+            ),
+            default_mode=settings.ANALYSIS_DEFAULT_MODE,
+        )
+    return _analysis_service
+
+
+def get_bri_series_cache() -> CumulativeBriCache:
+    """Return the process-wide cache of per-user cumulative BRI series."""
+    global _bri_series_cache
+    if _bri_series_cache is None:
+        _bri_series_cache = CumulativeBriCache(
+            max_users=settings.ANALYSIS_BRI_CACHE_USERS,
+            ttl_seconds=settings.ANALYSIS_BRI_CACHE_TTL_SECONDS,
+        )
+    return _bri_series_cache
+
+
+def _epoch_seconds(value: datetime) -> float:
+    """Epoch seconds of a Firestore timestamp; naive datetimes are UTC, as Firestore stores them."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+def _json_ready(value: Any) -> Any:
+    """Convert Firestore values (timestamps, nested maps) to JSON-serializable ones."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: _json_ready(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_json_ready(item) for item in value]
+    return value
+
+def _journal_from_doc(journal_doc) -> Journal:
+    return _journal_from_data(journal_doc.id, journal_doc.to_dict())
+
+def _journal_from_data(journal_id: str, journal_data: Dict[str, Any]) -> Journal:
+    return Journal(
+        id=journal_id,
+        user_id=journal_data["user_id"],
+        title=journal_data["title"],
+        content=journal_data["content"],
+        created_at=journal_data["created_at"],
+        updated_at=journal_data["updated_at"]
+    )
+
+def _journal_list_item(journal_doc, selected: Optional[List[str]]) -> JournalListItem:
+    journal_data = journal_doc.to_dict()
+    return JournalListItem(
+        id=journal_doc.id,
+        **{field: journal_data[field] for field in (selected or JOURNAL_LIST_FIELDS) if field in journal_data}
+    )
+
+def _journal_update_fields(journal_data: JournalUpdate) -> Dict[str, Any]:
+    """Firestore fields to write for a journal update; empty when nothing changes."""
+    update_data = {}
+    if journal_data.title is not None:
+        update_data["title"] = journal_data.title
+    if journal_data.content is not None:
+        update_data["content"] = journal_data.content
+    if update_data:
+        update_data["updated_at"] = datetime.utcnow()
+    return update_data
+
 class JournalController:
     """Controller for journal operations."""
     
@@ -97,57 +283,160 @@ class JournalController:
         
         return journals
     
+    @staticmethod
+    def list_journals(
+        *,
+        user_id: Optional[str] = None,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> Tuple[List[JournalListItem], Optional[str]]:
+        """
+        Get journals, optionally for one user, all at once or one page at a time.
+
+        Args:
+            user_id: Only list this user's journals
+            page_size: Journals per page, newest first (None returns all,
+                including journals without created_at)
+            cursor: Cursor returned with the previous page
+            fields: Comma-separated fields to read (e.g. "title,created_at")
+
+        Returns:
+            (journals, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: Unknown field or malformed cursor
+        """
+        selected = parse_fields(fields, JOURNAL_LIST_FIELDS)
+        collection = db.collection(JOURNALS_COLLECTION)
+        query = collection.where("user_id", "==", user_id) if user_id else collection
+        docs, next_cursor = fetch_page(query, collection, page_size=page_size, cursor=cursor, fields=selected)
+
+        return [_journal_list_item(journal_doc, selected) for journal_doc in docs], next_cursor
+    
+    @staticmethod
+    def export_journals(user_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield a user's journals, oldest first, as JSON-ready dicts.
+
+        Documents are read lazily from the Firestore stream, so memory stays
+        constant regardless of history size. Each record includes the
+        stored burnout_analysis (None when the journal was never analyzed).
+        """
+        journals_ref = (
+            db.collection(JOURNALS_COLLECTION)
+            .where("user_id", "==", user_id)
+            .order_by("created_at")
+            .stream()
+        )
+        for journal_doc in journals_ref:
+            journal_data = journal_doc.to_dict()
+            yield _json_ready({
+                "id": journal_doc.id,
+                "user_id": journal_data.get("user_id"),
+                "title": journal_data.get("title"),
+                "content": journal_data.get("content"),
+                "created_at": journal_data.get("created_at"),
+                "updated_at": journal_data.get("updated_at"),
+                "burnout_analysis": journal_data.get("burnout_analysis"),
+            })
+    
     @staticmethod
     def update_journal(journal_id: str, journal_data: JournalUpdate) -> Optional[Journal]:
-        """Update a journal entry."""
+        """
+        Update a journal entry.
+
+        The response is built from the pre-update read merged with the
+        patch; the write is guarded by that read's update_time.
+        """
         journal_ref = db.collection(JOURNALS_COLLECTION).document(journal_id)
-        journal_doc = journal_ref.get()
-        
-        if not journal_doc.exists:
+        updated_data = update_existing(db, journal_ref, _journal_update_fields(journal_data))
+        if updated_data is None:
             return None
-        
-        update_data = {}
-        if journal_data.title is not None:
-            update_data["title"] = journal_data.title
-        
-        if journal_data.content is not None:
-            update_data["content"] = journal_data.content
-        
-        if update_data:
-            update_data["updated_at"] = datetime.utcnow()
-            journal_ref.update(update_data)
-        
-        # Return updated journal
-        updated_doc = journal_ref.get()
-        updated_data = updated_doc.to_dict()
-        return Journal(
-            id=updated_doc.id,
-            user_id=updated_data["user_id"],
-            title=updated_data["title"],
-            content=updated_data["content"],
-            created_at=updated_data["created_at"],
-            updated_at=updated_data["updated_at"]
-        )
+        return _journal_from_data(journal_id, updated_data)
     
     @staticmethod
     def delete_journal(journal_id: str) -> bool:
-        """Delete a journal entry."""
-        journal_ref = db.collection(JOURNALS_COLLECTION).document(journal_id)
-        journal_doc = journal_ref.get()
-        
+        """Delete a journal entry (one round trip, guarded by an exists precondition)."""
+        return delete_existing(db, db.collection(JOURNALS_COLLECTION).document(journal_id))
+
+    # Async variants on the Firestore AsyncClient, awaited directly by the
+    # routers so Firestore RPCs do not block the event loop.
+
+    @staticmethod
+    async def create_journal_async(journal_data: JournalCreate) -> Journal:
+        """Async variant of create_journal."""
+        async_db = get_async_db()
+        user_doc = await async_db.collection(USERS_COLLECTION).document(journal_data.user_id).get()
+        if not user_doc.exists:
+            raise ValueError(f"User with ID {journal_data.user_id} does not exist")
+
+        journal_ref = async_db.collection(JOURNALS_COLLECTION).document()
+        now = datetime.utcnow()
+        journal_dict = {
+            "user_id": journal_data.user_id,
+            "title": journal_data.title,
+            "content": journal_data.content,
+            "created_at": now,
+            "updated_at": now
+        }
+        await journal_ref.set(journal_dict)
+        return Journal(id=journal_ref.id, **journal_dict)
+
+    @staticmethod
+    async def get_journal_async(journal_id: str) -> Optional[Journal]:
+        """Async variant of get_journal."""
+        journal_doc = await get_async_db().collection(JOURNALS_COLLECTION).document(journal_id).get()
         if not journal_doc.exists:
-            return False
-        
-        journal_ref.delete()
-        return True
+            return None
+        return _journal_from_doc(journal_doc)
+
+    @staticmethod
+    async def list_journals_async(
+        *,
+        user_id: Optional[str] = None,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> Tuple[List[JournalListItem], Optional[str]]:
+        """Async variant of list_journals."""
+        selected = parse_fields(fields, JOURNAL_LIST_FIELDS)
+        collection = get_async_db().collection(JOURNALS_COLLECTION)
+        query = collection.where("user_id", "==", user_id) if user_id else collection
+        docs, next_cursor = await fetch_page_async(query, collection, page_size=page_size, cursor=cursor, fields=selected)
+        return [_journal_list_item(journal_doc, selected) for journal_doc in docs], next_cursor
+
+    @staticmethod
+    async def update_journal_async(journal_id: str, journal_data: JournalUpdate) -> Optional[Journal]:
+        """Async variant of update_journal."""
+        async_db = get_async_db()
+        journal_ref = async_db.collection(JOURNALS_COLLECTION).document(journal_id)
+        updated_data = await update_existing_async(async_db, journal_ref, _journal_update_fields(journal_data))
+        if updated_data is None:
+            return None
+        return _journal_from_data(journal_id, updated_data)
+
+    @staticmethod
+    async def delete_journal_async(journal_id: str) -> bool:
+        """Async variant of delete_journal."""
+        async_db = get_async_db()
+        return await delete_existing_async(async_db, async_db.collection(JOURNALS_COLLECTION).document(journal_id))
     
     @staticmethod
-    def analyze_journal(journal_id: str) -> Optional[BurnoutRiskIndex]:
+    def analyze_journal(
+        journal_id: str,
+        mode: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        deadline_at: Optional[float] = None,
+    ) -> Optional[BurnoutRiskIndex]:
         """
         Analyze a journal entry for burnout risk.
         
         Args:
             journal_id: ID of the journal entry to analyze
+            mode: Analysis mode (auto, llm or lexicon)
+            incremental: Re-extract only new or edited sentences (None uses the default)
+            deadline_at: Absolute time.monotonic() deadline for the request
         
         Returns:
             BurnoutRiskIndex with analysis results, or None if journal not found
@@ -156,14 +445,15 @@ class JournalController:
         if not journal:
             return None
         
-        # Initialize analysis service
-        analysis_service = BurnoutAnalysisService(api_key=settings.GEMINI_API_KEY) #use your own gemini api key if u need to
+        analysis_service = get_analysis_service()
         
         # Combine title and content for analysis
         text_to_analyze = f"{journal.title}\n{journal.content}"
         
         # Perform analysis
-        result = analysis_service.analyze(text_to_analyze)
+        result = analysis_service.analyze(
+            text_to_analyze, mode=mode, incremental=incremental, deadline_at=deadline_at
+        )
         
         # Update journal entry with analysis results (optional)
         journal_ref = db.collection(JOURNALS_COLLECTION).document(journal_id)
@@ -182,21 +472,123 @@ class JournalController:
         return result
     
     @staticmethod
-    def analyze_text(text: str) -> BurnoutRiskIndex:
+    def analyze_text(
+        text: str,
+        mode: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        deadline_at: Optional[float] = None,
+    ) -> BurnoutRiskIndex:
         """
         Analyze raw text for burnout risk.
         
         Args:
             text: Text to analyze
+            mode: Analysis mode (auto, llm or lexicon)
+            incremental: Re-extract only new or edited sentences (None uses the default)
+            deadline_at: Absolute time.monotonic() deadline for the request
         
         Returns:
             BurnoutRiskIndex with analysis results
         """
-        # Initialize analysis service
-        analysis_service = BurnoutAnalysisService(api_key=settings.GEMINI_API_KEY) #use your own gemini api key if u need to
+        analysis_service = get_analysis_service()
         
         # Perform analysis
-        return analysis_service.analyze(text)
+        return analysis_service.analyze(text, mode=mode, incremental=incremental, deadline_at=deadline_at)
+
+    @staticmethod
+    def combine_inputs(texts: List[str]) -> str:
+        """Join a day's journal inputs into the single text that is analyzed."""
+        return "\n\n---\n\n".join([t for t in texts if (t or "").strip()])
+
+    @staticmethod
+    def _load_bri_series(user_id: str, deadline_at: Optional[float] = None) -> BriSeries:
+        """Read a user's journals (createdAt, cumulativeBri) in one projected query."""
+        journals_col = db.collection("users").document(user_id).collection("journals")
+        docs = (
+            journals_col.order_by("createdAt")
+            .select(["createdAt", "cumulativeBri"])
+            .stream(timeout=remaining(deadline_at) if deadline_at is not None else None)
+        )
+        entries = []
+        for doc in docs:
+            data = doc.to_dict() or {}
+            created_at = data.get("createdAt")
+            if created_at is None:
+                continue
+            entries.append((_epoch_seconds(created_at), doc.id, data.get("cumulativeBri")))
+        return BriSeries(entries)
+
+    @staticmethod
+    def _bri_series(user_id: str, deadline_at: Optional[float] = None) -> BriSeries:
+        """Return the user's cached series, loading it from Firestore on a miss."""
+        cache = get_bri_series_cache()
+        series = cache.get(user_id)
+        if series is None:
+            series = JournalController._load_bri_series(user_id, deadline_at=deadline_at)
+            cache.put(user_id, series)
+        return series
+
+    @staticmethod
+    def _previous_cumulative_bri(
+        user_id: str,
+        journal_date: str,
+        deadline_at: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Read the cumulative BRI of the user's journal preceding `journal_date`.
+
+        The previous journal (by createdAt) is found by bisecting the user's
+        cached series; Firestore is only read when the series is not cached.
+
+        Raises:
+            DeadlineExceeded: The lookup could not finish before `deadline_at`
+        """
+        try:
+            before = _epoch_seconds(datetime.strptime(journal_date, "%Y-%m-%d"))
+            series = JournalController._bri_series(user_id, deadline_at=deadline_at)
+        except Exception as e:
+            # A missing previous value would restart the running average, so a
+            # timed-out lookup is reported rather than treated as "no history".
+            if expired(deadline_at):
+                raise DeadlineExceeded("Previous journal lookup did not finish before the deadline.") from e
+            return None
+
+        return series.previous(before)
+
+    @staticmethod
+    def _attach_cumulative_bri(
+        result: BurnoutRiskIndex,
+        *,
+        user_id: str,
+        journal_date: str,
+        deadline_at: Optional[float] = None,
+    ) -> BurnoutRiskIndex:
+        """Set cumulative_bri on `result`, or flag it skipped when the deadline leaves no time."""
+        try:
+            if expired(deadline_at):
+                raise DeadlineExceeded("No time left for the previous journal lookup.")
+            prev_cumulative_bri = JournalController._previous_cumulative_bri(
+                user_id, journal_date, deadline_at=deadline_at
+            )
+        except DeadlineExceeded:
+            return result.model_copy(
+                update={"partial": True, "skipped_stages": [*result.skipped_stages, "cumulative_bri"]}
+            )
+
+        cumulative = BurnoutAnalysisService.compute_cumulative_bri(
+            previous_cumulative_bri=prev_cumulative_bri,
+            new_final_bri=result.overall_score,
+        )
+        get_bri_series_cache().record(user_id, journal_date, cumulative)
+
+        # Put cumulative value onto response (and let callers persist it).
+        try:
+            result.cumulative_bri = cumulative
+        except Exception:
+            # Pydantic may be configured immutable; recreate if needed.
+            result = BurnoutRiskIndex(**result.model_dump(), cumulative_bri=cumulative)
+
+        return result
 
     @staticmethod
     def analyze_journal_inputs(
@@ -206,53 +598,327 @@ class JournalController:
         texts: List[str],
         coach_transcript: Optional[str] = None,
         coach_transcript_embedded: bool = False,
+        mode: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        deadline_at: Optional[float] = None,
     ) -> BurnoutRiskIndex:
         """
         Analyze one or more journal input texts and compute cumulative BRI.
 
         The frontend currently sends a single text (the active entry content),
-        but this accepts a list to keep the API flexible.
+        but this accepts a list to keep the API flexible. With `deadline_at`,
+        a cumulative BRI lookup that would overrun the deadline is skipped
+        and flagged in `skipped_stages`.
         """
-        analysis_service = BurnoutAnalysisService(api_key=settings.GEMINI_API_KEY)
-        combined = "\n\n---\n\n".join([t for t in texts if (t or "").strip()])
+        analysis_service = get_analysis_service()
+        combined = JournalController.combine_inputs(texts)
         result = analysis_service.analyze(
             combined,
             coach_transcript=coach_transcript,
             coach_transcript_embedded=coach_transcript_embedded,
+            mode=mode,
+            incremental=incremental,
+            deadline_at=deadline_at,
         )
 
         if not user_id or not journal_date:
             return result
 
-        # Look up previous journal in the user's collection to compute cumulative BRI.
-        journals_col = db.collection("users").document(user_id).collection("journals")
+        return JournalController._attach_cumulative_bri(
+            result, user_id=user_id, journal_date=journal_date, deadline_at=deadline_at
+        )
 
-        # Previous journal (by createdAt timestamp)
-        try:
-            target_date = datetime.strptime(journal_date, "%Y-%m-%d")
-            prev_query = (
-                journals_col.where("createdAt", "<", target_date)
-                .order_by("createdAt", direction=firestore.Query.DESCENDING)
-                .limit(1)
-                .stream()
-            )
-            prev_doc = next(prev_query, None)
-            prev_data = prev_doc.to_dict() if prev_doc else {}
-        except Exception:
-            prev_data = {}
+    @staticmethod
+    async def analyze_journal_async(
+        journal_id: str,
+        mode: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        deadline_at: Optional[float] = None,
+    ) -> Optional[BurnoutRiskIndex]:
+        """Awaitable `analyze_journal`; Firestore and LangExtract run on the analysis pool."""
+        return await run_blocking(
+            get_analysis_service().executor,
+            JournalController.analyze_journal,
+            journal_id,
+            mode=mode,
+            incremental=incremental,
+            deadline_at=deadline_at,
+        )
 
-        prev_cumulative_bri = prev_data.get("cumulativeBri")
+    @staticmethod
+    async def analyze_text_async(
+        text: str,
+        mode: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        deadline_at: Optional[float] = None,
+    ) -> BurnoutRiskIndex:
+        """Awaitable `analyze_text` that keeps the event loop free."""
+        return await get_analysis_service().analyze_async(
+            text, mode=mode, incremental=incremental, deadline_at=deadline_at
+        )
 
-        cumulative = BurnoutAnalysisService.compute_cumulative_bri(
-            previous_cumulative_bri=prev_cumulative_bri,
-            new_final_bri=result.overall_score,
+    @staticmethod
+    async def analyze_journal_inputs_async(
+        *,
+        user_id: Optional[str],
+        journal_date: Optional[str],
+        texts: List[str],
+        coach_transcript: Optional[str] = None,
+        coach_transcript_embedded: bool = False,
+        mode: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        deadline_at: Optional[float] = None,
+    ) -> BurnoutRiskIndex:
+        """Awaitable `analyze_journal_inputs`, including the previous-journal lookup."""
+        return await run_blocking(
+            get_analysis_service().executor,
+            JournalController.analyze_journal_inputs,
+            user_id=user_id,
+            journal_date=journal_date,
+            texts=texts,
+            coach_transcript=coach_transcript,
+            coach_transcript_embedded=coach_transcript_embedded,
+            mode=mode,
+            incremental=incremental,
+            deadline_at=deadline_at,
         )
 
-        # Put cumulative value onto response (and let callers persist it).
-        try:
+    @staticmethod
+    def analyze_journal_batch(
+        *,
+        user_id: str,
+        entries: List[BatchAnalysisEntry],
+        mode: Optional[str] = None,
+    ) -> BatchAnalysisResponse:
+        """
+        Analyze a user's backlog of journal days in one pass.
+
+        All days are extracted together, then cumulative BRI is folded in
+        date order over the user's stored series merged with the batch days:
+        each day chains off the journal immediately before it, stored or
+        batch, so the values match what sequential per-day analysis would
+        produce.
+        Model calls run in the bulk priority class, fair-queued per user,
+        so backfills do not delay interactive analyses.
+        """
+        analysis_service = get_analysis_service()
+        ordered = sorted(entries, key=lambda entry: entry.journal_date)
+
+        combined_texts: List[str] = []
+        analyzed_entries: List[BatchAnalysisEntry] = []
+        items: List[BatchAnalysisItem] = []
+        for entry in ordered:
+            combined = "\n\n---\n\n".join([t for t in entry.texts if (t or "").strip()])
+            if combined.strip():
+                combined_texts.append(combined)
+                analyzed_entries.append(entry)
+            else:
+                items.append(BatchAnalysisItem(journal_date=entry.journal_date, skipped=True))
+
+        with priority_scope(PRIORITY_BULK, tenant=user_id):
+            results = analysis_service.analyze_batch(
+                combined_texts,
+                max_workers=settings.ANALYSIS_BATCH_MAX_WORKERS,
+                mode=mode,
+            )
+
+        timeline = JournalController._batch_timeline(user_id, analyzed_entries)
+        for entry, result in zip(analyzed_entries, results):
+            before = _epoch_seconds(datetime.strptime(entry.journal_date, "%Y-%m-%d"))
+            cumulative = BurnoutAnalysisService.compute_cumulative_bri(
+                previous_cumulative_bri=timeline.previous(before),
+                new_final_bri=result.overall_score,
+            )
+            timeline.set_value(entry.journal_date, cumulative)
             result.cumulative_bri = cumulative
+            get_bri_series_cache().record(user_id, entry.journal_date, cumulative)
+            items.append(BatchAnalysisItem(journal_date=entry.journal_date, result=result))
+
+        items.sort(key=lambda item: item.journal_date)
+        return BatchAnalysisResponse(user_id=user_id, results=items)
+
+    @staticmethod
+    def _batch_timeline(user_id: str, entries: List[BatchAnalysisEntry]) -> BriSeries:
+        """
+        The user's stored series with the batch days merged in by date.
+
+        Batch days start without a value and are filled in as they are
+        folded; a day already stored keeps its createdAt.
+        """
+        try:
+            stored = JournalController._bri_series(user_id)
         except Exception:
-            # Pydantic may be configured immutable; recreate if needed.
-            result = BurnoutRiskIndex(**result.model_dump(), cumulative_bri=cumulative)
+            # Same fallback as a failed single-day lookup: no history.
+            stored = BriSeries([])
+        created = dict(zip(stored.journal_ids, stored.timestamps))
+        batch_days = {entry.journal_date for entry in entries}
+        merged = [
+            (timestamp, journal_id, value)
+            for timestamp, journal_id, value in zip(stored.timestamps, stored.journal_ids, stored.values)
+            if journal_id not in batch_days
+        ]
+        for journal_date in batch_days:
+            timestamp = created.get(journal_date)
+            if timestamp is None:
+                timestamp = _epoch_seconds(datetime.strptime(journal_date, "%Y-%m-%d"))
+            merged.append((timestamp, journal_date, None))
+        return BriSeries(merged)
+
+    @staticmethod
+    async def analyze_journal_batch_async(
+        *,
+        user_id: str,
+        entries: List[BatchAnalysisEntry],
+        mode: Optional[str] = None,
+    ) -> BatchAnalysisResponse:
+        """Awaitable `analyze_journal_batch` that keeps the event loop free."""
+        return await run_blocking(
+            get_analysis_service().executor,
+            JournalController.analyze_journal_batch,
+            user_id=user_id,
+            entries=entries,
+            mode=mode,
+        )
 
+    @staticmethod
+    def recompute_cumulative_bri(
+        user_id: str,
+        *,
+        alphas: Sequence[float] = (CUMULATIVE_BRI_ALPHA,),
+        dry_run: bool = False,
+        include_timelines: bool = False,
+    ) -> CumulativeRecomputeResult:
+        """
+        Recompute a user's cumulative BRI timeline and write back changed values.
+
+        Reads the user's analyzed journals (createdAt order, the order used
+        for the previous-journal lookup) in one query, folds every alpha's
+        timeline in one pass, and stores the first alpha's values as
+        cumulativeBri with batched writes. Journals without a bri are left
+        out of the timeline. With `dry_run` nothing is written and the
+        changed journals are counted in `would_update` instead of `updated`.
+        """
+        journals_col = db.collection("users").document(user_id).collection("journals")
+        docs = [
+            doc
+            for doc in journals_col.order_by("createdAt").select(["bri", "cumulativeBri"]).stream()
+            if isinstance((doc.to_dict() or {}).get("bri"), (int, float))
+        ]
+        timelines = BurnoutAnalysisService.cumulative_bri_timeline(
+            [float(doc.to_dict()["bri"]) for doc in docs],
+            alphas,
+        )
+
+        changed = [
+            (doc, value)
+            for doc, value in zip(docs, timelines[alphas[0]])
+            if not isinstance(doc.to_dict().get("cumulativeBri"), (int, float))
+            or abs(doc.to_dict()["cumulativeBri"] - value) > 1e-9
+        ]
+        if not dry_run:
+            for start in range(0, len(changed), _WRITE_BATCH_SIZE):
+                batch = db.batch()
+                for doc, value in changed[start:start + _WRITE_BATCH_SIZE]:
+                    batch.update(doc.reference, {"cumulativeBri": value})
+                batch.commit()
+            if changed:
+                get_bri_series_cache().invalidate(user_id)
+
+        if dry_run:
+            result = CumulativeRecomputeResult(user_id=user_id, journals=len(docs), would_update=len(changed))
+        else:
+            result = CumulativeRecomputeResult(user_id=user_id, journals=len(docs), updated=len(changed))
+        if include_timelines:
+            result.journal_ids = [doc.id for doc in docs]
+            result.timelines = {str(alpha): series for alpha, series in timelines.items()}
         return result
+
+    @staticmethod
+    def recompute_all_cumulative_bri(
+        *,
+        user_id: Optional[str] = None,
+        alphas: Sequence[float] = (CUMULATIVE_BRI_ALPHA,),
+        dry_run: bool = False,
+        include_timelines: bool = False,
+    ) -> CumulativeRecomputeResponse:
+        """Recompute cumulative BRI for one user, or every user when `user_id` is None (e.g. after changing alpha)."""
+        if user_id:
+            user_ids = [user_id]
+        else:
+            user_ids = [doc.id for doc in db.collection("users").select([]).stream()]
+
+        results = [
+            JournalController.recompute_cumulative_bri(
+                uid,
+                alphas=alphas,
+                dry_run=dry_run,
+                include_timelines=include_timelines,
+            )
+            for uid in user_ids
+        ]
+        return CumulativeRecomputeResponse(
+            results=results,
+            updated=sum(result.updated for result in results),
+            would_update=sum(result.would_update for result in results),
+        )
+
+    @staticmethod
+    async def recompute_all_cumulative_bri_async(
+        *,
+        user_id: Optional[str] = None,
+        alphas: Sequence[float] = (CUMULATIVE_BRI_ALPHA,),
+        dry_run: bool = False,
+        include_timelines: bool = False,
+    ) -> CumulativeRecomputeResponse:
+        """Awaitable `recompute_all_cumulative_bri` that keeps the event loop free."""
+        return await run_blocking(
+            get_analysis_service().executor,
+            JournalController.recompute_all_cumulative_bri,
+            user_id=user_id,
+            alphas=alphas,
+            dry_run=dry_run,
+            include_timelines=include_timelines,
+        )
+
+    @staticmethod
+    def analysis_metrics() -> dict:
+        """Return cache, cascade routing and scheduler queue metrics for the analysis service."""
+        return {**get_analysis_service().metrics(), "bri_series_cache": get_bri_series_cache().stats()}
+
+    @staticmethod
+    def analyze_stream(
+        *,
+        text: str,
+        user_id: Optional[str] = None,
+        journal_date: Optional[str] = None,
+        coach_transcript: Optional[str] = None,
+        coach_transcript_embedded: bool = False,
+        mode: Optional[str] = None,
+        deadline_at: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream analysis events for `text` (see BurnoutAnalysisService.analyze_stream).
+
+        The final "result" event carries the BurnoutRiskIndex as JSON-ready
+        data, with cumulative_bri when user_id and journal_date are given.
+        Failures after streaming has started are reported as an "error"
+        event, since the response status is already sent.
+        """
+        try:
+            for event in get_analysis_service().analyze_stream(
+                text,
+                coach_transcript=coach_transcript,
+                coach_transcript_embedded=coach_transcript_embedded,
+                mode=mode,
+                deadline_at=deadline_at,
+            ):
+                if event["event"] == "result":
+                    result = event["data"]
+                    if user_id and journal_date:
+                        result = JournalController._attach_cumulative_bri(
+                            result, user_id=user_id, journal_date=journal_date, deadline_at=deadline_at
+                        )
+                    event = {"event": "result", "data": result.model_dump(mode="json")}
+                yield event
+        except Exception as e:
+            yield {"event": "error", "data": {"detail": f"Analysis failed: {str(e)}"}}
@@ -0,0 +1,122 @@
+"""Keyset pagination and field projection for Firestore list queries."""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from firebase_admin import firestore
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Pages are ordered newest first by created_at, with the document ID as tie-breaker.
+# Firestore leaves documents without the field out of ordered queries, so
+# they only appear in unpaginated listings.
+CURSOR_FIELD = "created_at"
+
+
+def encode_cursor(created_at: datetime, doc_id: str) -> str:
+    """Opaque cursor pointing just past (created_at, doc_id)."""
+    raw = json.dumps({"t": created_at.isoformat(), "id": doc_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(data["t"]), str(data["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid page cursor") from e
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Optional[List[str]]:
+    """Parse a comma-separated `fields=` value; None means all fields."""
+    if not fields:
+        return None
+    selected = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = sorted(set(selected) - set(allowed))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}")
+    return selected
+
+
+def _page_query(query: Any, collection: Any, page_size: int, cursor: Optional[str], fields: Optional[Sequence[str]]) -> Any:
+    document_id = firestore.FieldPath.document_id()
+    query = (
+        query.order_by(CURSOR_FIELD, direction=firestore.Query.DESCENDING)
+        .order_by(document_id, direction=firestore.Query.DESCENDING)
+    )
+    if fields is not None:
+        query = query.select(sorted(set(fields) | {CURSOR_FIELD}))
+    if cursor:
+        created_at, doc_id = decode_cursor(cursor)
+        query = query.start_after({CURSOR_FIELD: created_at, document_id: collection.document(doc_id)})
+    # One extra document tells whether another page exists.
+    return query.limit(page_size + 1)
+
+
+def _all_query(query: Any, fields: Optional[Sequence[str]]) -> Any:
+    """Unordered query for every document, so none is dropped for lacking created_at."""
+    return query.select(sorted(set(fields))) if fields is not None else query
+
+
+def _page_size(page_size: Optional[int], cursor: Optional[str]) -> Optional[int]:
+    """Effective page size; None (unpaginated) unless a page size or cursor was given."""
+    if page_size is None and not cursor:
+        return None
+    return max(1, min(page_size or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+
+
+def _split_page(docs: list, page_size: int) -> Tuple[list, Optional[str]]:
+    if len(docs) <= page_size:
+        return docs, None
+    docs = docs[:page_size]
+    last = docs[-1]
+    return docs, encode_cursor(last.get(CURSOR_FIELD), last.id)
+
+
+def fetch_page(
+    query: Any,
+    collection: Any,
+    *,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> Tuple[list, Optional[str]]:
+    """
+    Fetch one page of `query` (a query or collection reference).
+
+    Pagination is opt-in: without `page_size` or `cursor` every document is
+    returned, unordered, and the next cursor is None. Pages are ordered by
+    created_at and skip documents without it (see CURSOR_FIELD); a cursor
+    alone pages by DEFAULT_PAGE_SIZE.
+
+    Only `fields` (plus the cursor field when paging) are read when given,
+    using Firestore select(). Returns the document snapshots and the cursor
+    of the next page, or None on the last page.
+
+    Raises:
+        ValueError: `cursor` is malformed
+    """
+    page_size = _page_size(page_size, cursor)
+    if page_size is None:
+        return list(_all_query(query, fields).stream()), None
+    docs = list(_page_query(query, collection, page_size, cursor, fields).stream())
+    return _split_page(docs, page_size)
+
+
+async def fetch_page_async(
+    query: Any,
+    collection: Any,
+    *,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> Tuple[list, Optional[str]]:
+    """fetch_page for AsyncClient queries."""
+    page_size = _page_size(page_size, cursor)
+    if page_size is None:
+        return [doc async for doc in _all_query(query, fields).stream()], None
+    docs = [doc async for doc in _page_query(query, collection, page_size, cursor, fields).stream()]
+    return _split_page(docs, page_size)
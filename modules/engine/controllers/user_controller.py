@@ -1,23 +1,209 @@
 """User controller with business logic."""
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
+from urllib.parse import quote
 from firebase_admin import firestore
-from database import db, USERS_COLLECTION
-from models.user import User, UserCreate, UserUpdate
+from google.api_core.exceptions import AlreadyExists, FailedPrecondition, NotFound
+from database import db, get_async_db, USERS_COLLECTION, USER_EMAILS_COLLECTION
+from models.user import User, UserCreate, UserUpdate, UserListItem
+from controllers.guarded_writes import (
+    WRITE_ATTEMPTS,
+    SideWrites,
+    delete_existing,
+    delete_existing_async,
+    update_existing,
+    update_existing_async,
+)
+from controllers.pagination import fetch_page, fetch_page_async, parse_fields
+from config import settings
+
+# Fields a user list can be projected to with `fields=`.
+USER_LIST_FIELDS = ("email", "name", "created_at", "updated_at")
+
+def _user_from_doc(user_doc) -> User:
+    return _user_from_data(user_doc.id, user_doc.to_dict())
+
+def _user_from_data(user_id: str, user_data: dict) -> User:
+    return User(
+        id=user_id,
+        email=user_data["email"],
+        name=user_data["name"],
+        created_at=user_data["created_at"],
+        updated_at=user_data["updated_at"]
+    )
+
+def _email_ref(client: Any, email: str) -> Any:
+    """Email index entry for `email` ('/' is not allowed in document IDs)."""
+    return client.collection(USER_EMAILS_COLLECTION).document(quote(email, safe="@"))
+
+def _holds_email(user_doc: Any, email: str) -> bool:
+    return user_doc.exists and user_doc.to_dict().get("email") == email
+
+def _find_email_holder(client: Any, email: str) -> Tuple[Optional[Any], Any]:
+    """
+    Return (user document holding `email` or None, the email's index entry).
+
+    An entry is trusted only if its user still has that email. Users written
+    outside this API have no entry; with USER_EMAIL_QUERY_FALLBACK a missing
+    or stale entry falls back to querying users by email.
+    """
+    index_doc = _email_ref(client, email).get()
+    if index_doc.exists:
+        user_doc = client.collection(USERS_COLLECTION).document(index_doc.get("uid")).get()
+        if _holds_email(user_doc, email):
+            return user_doc, index_doc
+    if not settings.USER_EMAIL_QUERY_FALLBACK:
+        return None, index_doc
+    matches = client.collection(USERS_COLLECTION).where("email", "==", email).limit(1).get()
+    return (matches[0] if matches else None), index_doc
+
+async def _find_email_holder_async(client: Any, email: str) -> Tuple[Optional[Any], Any]:
+    """_find_email_holder for the AsyncClient."""
+    index_doc = await _email_ref(client, email).get()
+    if index_doc.exists:
+        user_doc = await client.collection(USERS_COLLECTION).document(index_doc.get("uid")).get()
+        if _holds_email(user_doc, email):
+            return user_doc, index_doc
+    if not settings.USER_EMAIL_QUERY_FALLBACK:
+        return None, index_doc
+    matches = await client.collection(USERS_COLLECTION).where("email", "==", email).limit(1).get()
+    return (matches[0] if matches else None), index_doc
+
+def _claim_email(batch: Any, client: Any, email: str, user_id: str, index_doc: Any) -> None:
+    """
+    Point the email's index entry at `user_id`.
+
+    A stale entry is taken over only if unchanged since it was read; a
+    concurrent claim makes the commit fail (AlreadyExists/FailedPrecondition).
+    """
+    email_ref = _email_ref(client, email)
+    if index_doc.exists:
+        batch.update(email_ref, {"uid": user_id}, option=client.write_option(last_update_time=index_doc.update_time))
+    else:
+        batch.create(email_ref, {"uid": user_id})
+
+def _release_own_entry(batch: Any, client: Any, user_id: str, index_doc: Any) -> None:
+    """Delete an index entry if it still points at `user_id` and is unchanged since read."""
+    if index_doc.exists and index_doc.get("uid") == user_id:
+        batch.delete(index_doc.reference, option=client.write_option(last_update_time=index_doc.update_time))
+
+def _email_change_batch(
+    client: Any,
+    user_snapshot: Any,
+    patch: Dict[str, Any],
+    index_doc: Any,
+    old_index_doc: Optional[Any],
+) -> Any:
+    """
+    Batch updating the user and moving its index entry to patch["email"].
+
+    Every write is guarded by the update_time of the read it was based on,
+    so a concurrent change to the user or either entry fails the commit.
+    """
+    batch = client.batch()
+    user_id = user_snapshot.id
+    if user_snapshot.to_dict().get("email") != patch["email"]:
+        _claim_email(batch, client, patch["email"], user_id, index_doc)
+        if old_index_doc is not None:
+            _release_own_entry(batch, client, user_id, old_index_doc)
+    batch.update(
+        user_snapshot.reference, patch, option=client.write_option(last_update_time=user_snapshot.update_time)
+    )
+    return batch
+
+def _update_email(client: Any, user_id: str, patch: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Apply a patch that sets "email", re-reading the index on each attempt.
+
+    Returns:
+        The updated user data, or None if the user does not exist
+
+    Raises:
+        ValueError: The email is held by another user, or kept being claimed
+            concurrently for WRITE_ATTEMPTS attempts
+    """
+    email = patch["email"]
+    user_ref = client.collection(USERS_COLLECTION).document(user_id)
+    for attempt in range(WRITE_ATTEMPTS):
+        snapshot = user_ref.get()
+        if not snapshot.exists:
+            return None
+        holder, index_doc = _find_email_holder(client, email)
+        if holder is not None and holder.id != user_id:
+            raise ValueError(f"User with email {email} already exists")
+        old_email = snapshot.to_dict().get("email")
+        old_index_doc = _email_ref(client, old_email).get() if old_email and old_email != email else None
+        try:
+            _email_change_batch(client, snapshot, patch, index_doc, old_index_doc).commit()
+        except NotFound:
+            return None
+        except (AlreadyExists, FailedPrecondition):
+            if attempt == WRITE_ATTEMPTS - 1:
+                raise ValueError(f"User with email {email} already exists")
+            continue
+        return {**snapshot.to_dict(), **patch}
+
+async def _update_email_async(client: Any, user_id: str, patch: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """_update_email for the AsyncClient."""
+    email = patch["email"]
+    user_ref = client.collection(USERS_COLLECTION).document(user_id)
+    for attempt in range(WRITE_ATTEMPTS):
+        snapshot = await user_ref.get()
+        if not snapshot.exists:
+            return None
+        holder, index_doc = await _find_email_holder_async(client, email)
+        if holder is not None and holder.id != user_id:
+            raise ValueError(f"User with email {email} already exists")
+        old_email = snapshot.to_dict().get("email")
+        old_index_doc = await _email_ref(client, old_email).get() if old_email and old_email != email else None
+        try:
+            await _email_change_batch(client, snapshot, patch, index_doc, old_index_doc).commit()
+        except NotFound:
+            return None
+        except (AlreadyExists, FailedPrecondition):
+            if attempt == WRITE_ATTEMPTS - 1:
+                raise ValueError(f"User with email {email} already exists")
+            continue
+        return {**snapshot.to_dict(), **patch}
+
+def _release_email_writes(client: Any) -> SideWrites:
+    """Remove a deleted user's index entry."""
+    def side_writes(batch: Any, current: Dict[str, Any]) -> None:
+        if current.get("email"):
+            batch.delete(_email_ref(client, current["email"]))
+    return side_writes
+
+def _new_user_batch(client: Any, user_ref: Any, user_dict: Dict[str, Any], index_doc: Any) -> Any:
+    """Batch creating the user and claiming its email."""
+    batch = client.batch()
+    _claim_email(batch, client, user_dict["email"], user_ref.id, index_doc)
+    batch.create(user_ref, user_dict)
+    return batch
+
+def _user_list_item(user_doc, selected: Optional[List[str]]) -> UserListItem:
+    user_data = user_doc.to_dict()
+    return UserListItem(
+        id=user_doc.id,
+        **{field: user_data[field] for field in (selected or USER_LIST_FIELDS) if field in user_data}
+    )
 
 class UserController:
     """Controller for user operations."""
     
     @staticmethod
     def create_user(user_data: UserCreate) -> User:
-        """Create a new user in Firestore."""
-        user_ref = db.collection(USERS_COLLECTION).document()
-        
-        # Check if email already exists
-        existing_users = db.collection(USERS_COLLECTION).where("email", "==", user_data.email).limit(1).get()
-        if existing_users:
+        """
+        Create a new user in Firestore.
+
+        The user document and its email index entry are written in one
+        atomic batch, so of two concurrent sign-ups with the same email
+        through this API only one succeeds.
+        """
+        holder, index_doc = _find_email_holder(db, user_data.email)
+        if holder is not None:
             raise ValueError(f"User with email {user_data.email} already exists")
         
+        user_ref = db.collection(USERS_COLLECTION).document()
         now = datetime.utcnow()
         user_dict = {
             "email": user_data.email,
@@ -26,15 +212,12 @@ class UserController:
             "updated_at": now
         }
         
-        user_ref.set(user_dict)
+        try:
+            _new_user_batch(db, user_ref, user_dict, index_doc).commit()
+        except (AlreadyExists, FailedPrecondition):
+            raise ValueError(f"User with email {user_data.email} already exists")
         
-        return User(
-            id=user_ref.id,
-            email=user_dict["email"],
-            name=user_dict["name"],
-            created_at=user_dict["created_at"],
-            updated_at=user_dict["updated_at"]
-        )
+        return User(id=user_ref.id, **user_dict)
     
     @staticmethod
     def get_user(user_id: str) -> Optional[User]:
@@ -55,21 +238,13 @@ class UserController:
     
     @staticmethod
     def get_user_by_email(email: str) -> Optional[User]:
-        """Get a user by email."""
-        users = db.collection(USERS_COLLECTION).where("email", "==", email).limit(1).get()
+        """Get a user by email, via the email index (querying users if it has no valid entry)."""
+        holder, _index_doc = _find_email_holder(db, email)
         
-        if not users:
+        if holder is None:
             return None
         
-        user_doc = users[0]
-        user_data = user_doc.to_dict()
-        return User(
-            id=user_doc.id,
-            email=user_data["email"],
-            name=user_data["name"],
-            created_at=user_data["created_at"],
-            updated_at=user_data["updated_at"]
-        )
+        return _user_from_doc(holder)
     
     @staticmethod
     def get_all_users() -> List[User]:
@@ -89,22 +264,50 @@ class UserController:
         
         return users
     
+    @staticmethod
+    def list_users(
+        *,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> Tuple[List[UserListItem], Optional[str]]:
+        """
+        Get users, all at once or one page at a time.
+
+        Args:
+            page_size: Users per page, newest first (None returns all,
+                including users without created_at)
+            cursor: Cursor returned with the previous page
+            fields: Comma-separated fields to read (e.g. "name,email")
+
+        Returns:
+            (users, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: Unknown field or malformed cursor
+        """
+        selected = parse_fields(fields, USER_LIST_FIELDS)
+        collection = db.collection(USERS_COLLECTION)
+        docs, next_cursor = fetch_page(collection, collection, page_size=page_size, cursor=cursor, fields=selected)
+
+        return [_user_list_item(user_doc, selected) for user_doc in docs], next_cursor
+    
     @staticmethod
     def update_user(user_id: str, user_data: UserUpdate) -> Optional[User]:
-        """Update a user."""
-        user_ref = db.collection(USERS_COLLECTION).document(user_id)
-        user_doc = user_ref.get()
-        
-        if not user_doc.exists:
-            return None
-        
+        """
+        Update a user.
+
+        The response is built from the pre-update read merged with the
+        patch; the write is guarded by that read's update_time. A new email
+        moves the user's email index entry in the same batch; the old entry
+        is only removed if it still points at this user. A concurrent change
+        to either entry re-reads the index and retries.
+
+        Raises:
+            ValueError: The new email belongs to another user
+        """
         update_data = {}
         if user_data.email is not None:
-            # Check if email already exists for another user
-            existing_users = db.collection(USERS_COLLECTION).where("email", "==", user_data.email).get()
-            for existing_user in existing_users:
-                if existing_user.id != user_id:
-                    raise ValueError(f"User with email {user_data.email} already exists")
             update_data["email"] = user_data.email
         
         if user_data.name is not None:
@@ -112,27 +315,138 @@ class UserController:
         
         if update_data:
             update_data["updated_at"] = datetime.utcnow()
-            user_ref.update(update_data)
         
-        # Return updated user
-        updated_doc = user_ref.get()
-        updated_data = updated_doc.to_dict()
-        return User(
-            id=updated_doc.id,
-            email=updated_data["email"],
-            name=updated_data["name"],
-            created_at=updated_data["created_at"],
-            updated_at=updated_data["updated_at"]
-        )
+        if user_data.email is not None:
+            updated_data = _update_email(db, user_id, update_data)
+        else:
+            updated_data = update_existing(db, db.collection(USERS_COLLECTION).document(user_id), update_data)
+        if updated_data is None:
+            return None
+        return _user_from_data(user_id, updated_data)
     
     @staticmethod
     def delete_user(user_id: str) -> bool:
-        """Delete a user."""
+        """Delete a user and their email index entry."""
         user_ref = db.collection(USERS_COLLECTION).document(user_id)
-        user_doc = user_ref.get()
-        
+        return delete_existing(db, user_ref, _release_email_writes(db))
+    
+    @staticmethod
+    def backfill_email_index() -> Dict[str, int]:
+        """
+        Add email index entries for users written without one.
+
+        Covers users created before the index existed or by the Next.js
+        app; run it (POST /api/v1/users/email-index/backfill) before turning
+        USER_EMAIL_QUERY_FALLBACK off.
+
+        Returns:
+            Counts of entries "created" and of "conflicts": emails already
+            held by another user, which need to be resolved by hand
+        """
+        created = conflicts = 0
+        for user_doc in db.collection(USERS_COLLECTION).select(["email"]).stream():
+            email = user_doc.to_dict().get("email")
+            if not email:
+                continue
+            index_ref = _email_ref(db, email)
+            try:
+                index_ref.create({"uid": user_doc.id})
+                created += 1
+            except AlreadyExists:
+                if index_ref.get().get("uid") != user_doc.id:
+                    conflicts += 1
+        return {"created": created, "conflicts": conflicts}
+
+    @staticmethod
+    async def backfill_email_index_async() -> Dict[str, int]:
+        """Async variant of backfill_email_index."""
+        async_db = get_async_db()
+        created = conflicts = 0
+        async for user_doc in async_db.collection(USERS_COLLECTION).select(["email"]).stream():
+            email = user_doc.to_dict().get("email")
+            if not email:
+                continue
+            index_ref = _email_ref(async_db, email)
+            try:
+                await index_ref.create({"uid": user_doc.id})
+                created += 1
+            except AlreadyExists:
+                if (await index_ref.get()).get("uid") != user_doc.id:
+                    conflicts += 1
+        return {"created": created, "conflicts": conflicts}
+
+    # Async variants on the Firestore AsyncClient, awaited directly by the
+    # routers so Firestore RPCs do not block the event loop.
+
+    @staticmethod
+    async def create_user_async(user_data: UserCreate) -> User:
+        """Async variant of create_user."""
+        async_db = get_async_db()
+        holder, index_doc = await _find_email_holder_async(async_db, user_data.email)
+        if holder is not None:
+            raise ValueError(f"User with email {user_data.email} already exists")
+
+        user_ref = async_db.collection(USERS_COLLECTION).document()
+        now = datetime.utcnow()
+        user_dict = {
+            "email": user_data.email,
+            "name": user_data.name,
+            "created_at": now,
+            "updated_at": now
+        }
+        try:
+            await _new_user_batch(async_db, user_ref, user_dict, index_doc).commit()
+        except (AlreadyExists, FailedPrecondition):
+            raise ValueError(f"User with email {user_data.email} already exists")
+        return User(id=user_ref.id, **user_dict)
+
+    @staticmethod
+    async def get_user_async(user_id: str) -> Optional[User]:
+        """Async variant of get_user."""
+        user_doc = await get_async_db().collection(USERS_COLLECTION).document(user_id).get()
         if not user_doc.exists:
-            return False
-        
-        user_ref.delete()
-        return True
+            return None
+        return _user_from_doc(user_doc)
+
+    @staticmethod
+    async def list_users_async(
+        *,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> Tuple[List[UserListItem], Optional[str]]:
+        """Async variant of list_users."""
+        selected = parse_fields(fields, USER_LIST_FIELDS)
+        collection = get_async_db().collection(USERS_COLLECTION)
+        docs, next_cursor = await fetch_page_async(collection, collection, page_size=page_size, cursor=cursor, fields=selected)
+        return [_user_list_item(user_doc, selected) for user_doc in docs], next_cursor
+
+    @staticmethod
+    async def update_user_async(user_id: str, user_data: UserUpdate) -> Optional[User]:
+        """Async variant of update_user."""
+        async_db = get_async_db()
+        update_data = {}
+        if user_data.email is not None:
+            update_data["email"] = user_data.email
+
+        if user_data.name is not None:
+            update_data["name"] = user_data.name
+
+        if update_data:
+            update_data["updated_at"] = datetime.utcnow()
+
+        if user_data.email is not None:
+            updated_data = await _update_email_async(async_db, user_id, update_data)
+        else:
+            user_ref = async_db.collection(USERS_COLLECTION).document(user_id)
+            updated_data = await update_existing_async(async_db, user_ref, update_data)
+        if updated_data is None:
+            return None
+        return _user_from_data(user_id, updated_data)
+
+    @staticmethod
+    async def delete_user_async(user_id: str) -> bool:
+        """Async variant of delete_user."""
+        async_db = get_async_db()
+        user_ref = async_db.collection(USERS_COLLECTION).document(user_id)
+        return await delete_existing_async(async_db, user_ref, _release_email_writes(async_db))
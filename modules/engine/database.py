@@ -1,7 +1,10 @@
 """Firebase Firestore database connection and utilities."""
+import asyncio
 import os
+import weakref
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.cloud.firestore import AsyncClient
 from pathlib import Path
 from config import settings
 
@@ -43,6 +46,25 @@ def initialize_firebase():
 # Initialize database connection
 db = initialize_firebase()
 
+# Async clients keyed by event loop: gRPC asyncio channels belong to the loop
+# that created them (test clients may run each request on a new loop).
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient]" = weakref.WeakKeyDictionary()
+
+def get_async_db() -> AsyncClient:
+    """Return an AsyncClient for the running event loop, sharing the Admin SDK app's credentials."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        app = firebase_admin.get_app()
+        client = AsyncClient(
+            credentials=app.credential.get_credential(),
+            project=app.project_id or settings.FIREBASE_PROJECT_ID,
+        )
+        _async_clients[loop] = client
+    return client
+
 # Collection names
 USERS_COLLECTION = "users"
+# Email -> {"uid": user ID}; keeps emails unique (see controllers/user_controller.py)
+USER_EMAILS_COLLECTION = "user_emails"
 JOURNALS_COLLECTION = "journals"
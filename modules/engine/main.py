@@ -1,13 +1,27 @@
 """FastAPI main application."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from config import settings
-from routers import users_router, journals_router, live_router
+from routers import users_router, journals_router, live_router, jobs_router
+from controllers import JobController
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run background analysis workers for the life of the app."""
+    # Workers also resume jobs whose worker died; on shutdown they finish
+    # their current job.
+    JobController.start_workers()
+    try:
+        yield
+    finally:
+        JobController.stop_workers()
 
 app = FastAPI(
     title="Burnout Journaling Assistant API",
     description="Backend API for managing users and journal entries",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -23,6 +37,7 @@ app.add_middleware(
 app.include_router(users_router, prefix=settings.API_V1_PREFIX)
 app.include_router(journals_router, prefix=settings.API_V1_PREFIX)
 app.include_router(live_router, prefix=settings.API_V1_PREFIX)
+app.include_router(jobs_router, prefix=settings.API_V1_PREFIX)
 
 @app.get("/")
 async def root():
@@ -1,6 +1,6 @@
 """Models package."""
-from .user import User, UserCreate, UserUpdate, UserBase
-from .journal import Journal, JournalCreate, JournalUpdate, JournalBase
+from .user import User, UserCreate, UserUpdate, UserBase, UserListItem
+from .journal import Journal, JournalCreate, JournalUpdate, JournalBase, JournalListItem
 from .burnout import (
     BurnoutRiskIndex,
     BurnoutFeature,
@@ -8,21 +8,39 @@ from .burnout import (
     MBIDimension,
     EmotionType,
     AnalysisRequest,
+    BatchAnalysisEntry,
+    BatchAnalysisRequest,
+    BatchAnalysisItem,
+    BatchAnalysisResponse,
+    CumulativeRecomputeRequest,
+    CumulativeRecomputeResult,
+    CumulativeRecomputeResponse,
 )
+from .job import AnalysisJob
 
 __all__ = [
     "User",
     "UserCreate",
     "UserUpdate",
     "UserBase",
+    "UserListItem",
     "Journal",
     "JournalCreate",
     "JournalUpdate",
     "JournalBase",
+    "JournalListItem",
     "BurnoutRiskIndex",
     "BurnoutFeature",
     "MBIScore",
     "MBIDimension",
     "EmotionType",
     "AnalysisRequest",
+    "BatchAnalysisEntry",
+    "BatchAnalysisRequest",
+    "BatchAnalysisItem",
+    "BatchAnalysisResponse",
+    "CumulativeRecomputeRequest",
+    "CumulativeRecomputeResult",
+    "CumulativeRecomputeResponse",
+    "AnalysisJob",
 ]
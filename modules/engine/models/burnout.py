@@ -1,8 +1,11 @@
 """Burnout risk analysis models."""
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from typing import Annotated, List, Optional, Dict, Literal
 from enum import Enum
 
+# Smoothing factor of the cumulative BRI moving average (higher = shorter horizon).
+CUMULATIVE_BRI_ALPHA = 0.35
+
 class MBIDimension(str, Enum):
     """Maslach Burnout Inventory dimensions."""
     EMOTIONAL_EXHAUSTION = "EE"
@@ -44,6 +47,11 @@ class BurnoutFeature(BaseModel):
         default=False,
         description="Whether this sentence appears to come from a poor writer (for weighting)",
     )
+    weight: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Aggregation weight; chunked extractions weight features by their chunk's share of the text",
+    )
 
 class MBIScore(BaseModel):
     """MBI dimension score."""
@@ -79,6 +87,46 @@ class BurnoutRiskIndex(BaseModel):
     text_length: int = Field(ge=0, description="Length of processed text")
     sentence_count: int = Field(ge=0, description="Number of sentences")
     risk_level: str = Field(default="low", description="Risk level: low, moderate, high, severe")
+    cache_hit: bool = Field(
+        default=False,
+        description="Whether this result was served from the analysis cache without calling LangExtract",
+    )
+    timings_ms: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Wall time per analysis stage in milliseconds (preprocess, journal_extraction, coach_extraction, total)",
+    )
+    analysis_mode: str = Field(
+        default="llm",
+        description="Scorer that produced this result: llm (LangExtract) or lexicon (offline dictionary)",
+    )
+    degraded: bool = Field(
+        default=False,
+        description="Whether auto mode fell back to lexicon scoring because LangExtract was unavailable or too slow",
+    )
+    escalated: bool = Field(
+        default=False,
+        description="Whether auto mode escalated an ambiguous lexicon score to LangExtract",
+    )
+    coalesced: bool = Field(
+        default=False,
+        description="Whether this result was shared from an identical request already in flight",
+    )
+    segments_reused: int = Field(
+        default=0,
+        description="Sentences whose features were reused from a previous analysis (incremental mode)",
+    )
+    segments_extracted: int = Field(
+        default=0,
+        description="Sentences sent to LangExtract because they were new or edited (incremental mode)",
+    )
+    partial: bool = Field(
+        default=False,
+        description="Whether stages were skipped to meet the request deadline (see skipped_stages)",
+    )
+    skipped_stages: List[str] = Field(
+        default_factory=list,
+        description="Stages left out to meet the request deadline, e.g. coach_modifier or cumulative_bri",
+    )
     
     def model_post_init(self, __context):
         """Calculate risk level based on overall score."""
@@ -106,3 +154,70 @@ class AnalysisRequest(BaseModel):
         default=False,
         description="Whether the coach transcript is already embedded in the journal text",
     )
+    mode: Optional[Literal["auto", "llm", "lexicon"]] = Field(
+        default=None,
+        description="Scorer selection: llm (LangExtract only), lexicon (offline), or auto (lexicon first, LangExtract when ambiguous); defaults to the server setting (llm)",
+    )
+    incremental: Optional[bool] = Field(
+        default=None,
+        description="Re-extract only new or edited sentences (defaults to the server setting)",
+    )
+    deadline_ms: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Time budget in milliseconds; stages that would overrun it are skipped (X-Request-Deadline-Ms header also accepted)",
+    )
+
+class BatchAnalysisEntry(BaseModel):
+    """One journal day in a batch analysis request."""
+    journal_date: str = Field(description="Journal date (yyyy-mm-dd)")
+    texts: List[str] = Field(default_factory=list, description="Journal input texts for this date")
+
+class BatchAnalysisRequest(BaseModel):
+    """Request model for analyzing a user's backlog of journals in one call."""
+    user_id: str = Field(description="User ID (for cumulative BRI calculation)")
+    entries: List[BatchAnalysisEntry] = Field(description="Journal days to analyze, in chronological order")
+    mode: Optional[Literal["auto", "llm", "lexicon"]] = Field(
+        default=None,
+        description="Scorer selection (defaults to the server setting, llm); lexicon is suited to fast bulk recomputation",
+    )
+
+class BatchAnalysisItem(BaseModel):
+    """Analysis outcome for one journal day of a batch."""
+    journal_date: str
+    result: Optional[BurnoutRiskIndex] = Field(default=None, description="Analysis result, or None if skipped")
+    skipped: bool = Field(default=False, description="Whether the day had no text to analyze")
+
+class BatchAnalysisResponse(BaseModel):
+    """Response model for batch analysis."""
+    user_id: str
+    results: List[BatchAnalysisItem] = Field(default_factory=list, description="Per-day results in date order")
+
+class CumulativeRecomputeRequest(BaseModel):
+    """Request model for recomputing cumulative BRI timelines."""
+    user_id: Optional[str] = Field(default=None, description="User to recompute; all users when omitted")
+    alphas: List[Annotated[float, Field(gt=0.0, le=1.0)]] = Field(
+        default_factory=lambda: [CUMULATIVE_BRI_ALPHA],
+        min_length=1,
+        description="Smoothing factors in (0, 1]; the first one is written to cumulativeBri",
+    )
+    dry_run: bool = Field(default=False, description="Compute and report without writing to Firestore")
+    include_timelines: bool = Field(default=False, description="Return each user's recomputed series per alpha")
+
+class CumulativeRecomputeResult(BaseModel):
+    """Recomputed cumulative BRI timeline for one user."""
+    user_id: str
+    journals: int = Field(default=0, description="Analyzed journals in the timeline")
+    updated: int = Field(default=0, description="Journals whose stored cumulativeBri was rewritten")
+    would_update: int = Field(default=0, description="Journals whose stored cumulativeBri differs (with dry_run)")
+    journal_ids: List[str] = Field(default_factory=list, description="Journal IDs in timeline order (with include_timelines)")
+    timelines: Dict[str, List[float]] = Field(
+        default_factory=dict,
+        description="Cumulative BRI per journal keyed by alpha (with include_timelines)",
+    )
+
+class CumulativeRecomputeResponse(BaseModel):
+    """Response model for cumulative BRI recomputation."""
+    results: List[CumulativeRecomputeResult] = Field(default_factory=list)
+    updated: int = Field(default=0, description="Total journals written")
+    would_update: int = Field(default=0, description="Total journals a real run would write (with dry_run)")
@@ -0,0 +1,17 @@
+"""Background analysis job models."""
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+from datetime import datetime
+from .burnout import BurnoutRiskIndex
+
+class AnalysisJob(BaseModel):
+    """Status of a background journal analysis."""
+    id: str
+    status: Literal["queued", "running", "succeeded", "failed"]
+    journal_id: str
+    mode: Literal["auto", "llm", "lexicon"] = "llm"
+    result: Optional[BurnoutRiskIndex] = Field(default=None, description="Analysis result once the job succeeded")
+    error: Optional[str] = Field(default=None, description="Failure reason once the job failed")
+    attempts: int = Field(default=0, description="Times a worker picked the job up (jobs whose worker died are picked up again)")
+    created_at: datetime
+    updated_at: datetime
@@ -26,3 +26,12 @@ class Journal(JournalBase):
     
     class Config:
         from_attributes = True
+
+class JournalListItem(BaseModel):
+    """Journal in a list response; only requested fields are set when `fields=` is used."""
+    id: str
+    user_id: Optional[str] = None
+    title: Optional[str] = None
+    content: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -25,3 +25,11 @@ class User(UserBase):
     
     class Config:
         from_attributes = True
+
+class UserListItem(BaseModel):
+    """User in a list response; only requested fields are set when `fields=` is used."""
+    id: str
+    email: Optional[str] = None
+    name: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -2,5 +2,6 @@
 from .users import router as users_router
 from .journals import router as journals_router
 from .live import router as live_router
+from .jobs import router as jobs_router
 
-__all__ = ["users_router", "journals_router", "live_router"]
+__all__ = ["users_router", "journals_router", "live_router", "jobs_router"]
@@ -0,0 +1,17 @@
+"""Background job router endpoints."""
+from fastapi import APIRouter, HTTPException, status
+from models.job import AnalysisJob
+from controllers.job_controller import JobController
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+@router.get("/{job_id}", response_model=AnalysisJob)
+async def get_job(job_id: str):
+    """Get a background analysis job's status and result."""
+    job = await JobController.get_job_async(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with ID {job_id} not found"
+        )
+    return job
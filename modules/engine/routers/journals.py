@@ -1,37 +1,129 @@
 """Journal router endpoints."""
-from fastapi import APIRouter, HTTPException, status
-from typing import List
-from models.journal import Journal, JournalCreate, JournalUpdate
-from models.burnout import BurnoutRiskIndex, AnalysisRequest
+import json
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Any, Dict, Iterator, List, Optional
+from models.journal import Journal, JournalCreate, JournalUpdate, JournalListItem
+from models.burnout import (
+    BurnoutRiskIndex,
+    AnalysisRequest,
+    BatchAnalysisRequest,
+    BatchAnalysisResponse,
+    CumulativeRecomputeRequest,
+    CumulativeRecomputeResponse,
+)
 from controllers.journal_controller import JournalController
+from controllers.job_controller import JobController
+from controllers.pagination import MAX_PAGE_SIZE
+from config import settings
+from services.deadline import DeadlineExceeded, deadline_after_ms
 
 router = APIRouter(prefix="/journals", tags=["journals"])
 
+CACHE_HEADER = "X-Analysis-Cache"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEADLINE_HEADER = "X-Request-Deadline-Ms"
+
+
+def _set_cache_header(response: Response, result: BurnoutRiskIndex) -> BurnoutRiskIndex:
+    response.headers[CACHE_HEADER] = "hit" if result.cache_hit else "miss"
+    return result
+
+
+def _request_deadline(request: AnalysisRequest, http_request: Request) -> Optional[float]:
+    """Absolute deadline from the body's deadline_ms or the deadline header, whichever is tighter."""
+    budgets = [request.deadline_ms] if request.deadline_ms else []
+    header = http_request.headers.get(DEADLINE_HEADER)
+    if header:
+        try:
+            budgets.append(float(header))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{DEADLINE_HEADER} must be a number of milliseconds"
+            )
+    return deadline_after_ms(min(budgets)) if budgets else None
+
+
+def _ndjson_events(events: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    for event in events:
+        yield json.dumps(event) + "\n"
+
+
+def _sse_events(events: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    for event in events:
+        yield f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+
 @router.post("/", response_model=Journal, status_code=status.HTTP_201_CREATED)
 async def create_journal(journal: JournalCreate):
     """Create a new journal entry."""
     try:
-        return JournalController.create_journal(journal)
+        return await JournalController.create_journal_async(journal)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+async def _journal_page(response: Response, **kwargs) -> List[JournalListItem]:
+    try:
+        journals, next_cursor = await JournalController.list_journals_async(**kwargs)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return journals
 
-@router.get("/", response_model=List[Journal])
-async def get_all_journals():
-    """Get all journals."""
-    return JournalController.get_all_journals()
+@router.get("/", response_model=List[JournalListItem], response_model_exclude_unset=True)
+async def get_all_journals(
+    response: Response,
+    page_size: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    """
+    Get journals, all of them unless `page_size` is given.
 
-@router.get("/user/{user_id}", response_model=List[Journal])
-async def get_journals_by_user(user_id: str):
-    """Get all journals for a specific user."""
-    return JournalController.get_journals_by_user(user_id)
+    With `page_size`, journals come newest first, one page at a time: pass
+    the X-Next-Cursor response header back as `cursor` for the next page
+    (no header on the last page). Paged listings skip journals without
+    created_at. `fields` (e.g. "title,created_at") limits which fields are
+    read and returned.
+    """
+    return await _journal_page(response, page_size=page_size, cursor=cursor, fields=fields)
+
+@router.get("/user/{user_id}", response_model=List[JournalListItem], response_model_exclude_unset=True)
+async def get_journals_by_user(
+    user_id: str,
+    response: Response,
+    page_size: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    """Get a user's journals, optionally paginated like GET /journals/."""
+    return await _journal_page(response, user_id=user_id, page_size=page_size, cursor=cursor, fields=fields)
+
+@router.get("/user/{user_id}/export")
+async def export_journals_by_user(user_id: str):
+    """
+    Export a user's journals and their burnout analyses as NDJSON.
+
+    One JSON object per line, oldest first, streamed straight from
+    Firestore so large histories start downloading immediately.
+    """
+    return StreamingResponse(
+        _ndjson_events(JournalController.export_journals(user_id)),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="journals-{user_id}.ndjson"'},
+    )
 
 @router.get("/{journal_id}", response_model=Journal)
 async def get_journal(journal_id: str):
     """Get a journal by ID."""
-    journal = JournalController.get_journal(journal_id)
+    journal = await JournalController.get_journal_async(journal_id)
     if not journal:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -42,7 +134,7 @@ async def get_journal(journal_id: str):
 @router.put("/{journal_id}", response_model=Journal)
 async def update_journal(journal_id: str, journal: JournalUpdate):
     """Update a journal entry."""
-    updated_journal = JournalController.update_journal(journal_id, journal)
+    updated_journal = await JournalController.update_journal_async(journal_id, journal)
     if not updated_journal:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -53,7 +145,7 @@ async def update_journal(journal_id: str, journal: JournalUpdate):
 @router.delete("/{journal_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_journal(journal_id: str):
     """Delete a journal entry."""
-    deleted = JournalController.delete_journal(journal_id)
+    deleted = await JournalController.delete_journal_async(journal_id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -61,56 +153,190 @@ async def delete_journal(journal_id: str):
         )
 
 @router.post("/analyze", response_model=BurnoutRiskIndex)
-async def analyze_journal(request: AnalysisRequest):
+async def analyze_journal(request: AnalysisRequest, response: Response, http_request: Request):
     """
     Analyze a journal entry or text for burnout risk.
     
     If journal_id is provided, analyzes that journal entry.
     If text is provided, analyzes the text directly.
+
+    With a deadline (deadline_ms or the X-Request-Deadline-Ms header),
+    stages that would overrun it are skipped and listed in skipped_stages;
+    if not even the journal score fits, responds 504.
     """
+    deadline_at = _request_deadline(request, http_request)
     try:
         if request.journal_id:
             # Analyze existing journal entry
-            result = JournalController.analyze_journal(request.journal_id)
+            result = await JournalController.analyze_journal_async(
+                request.journal_id,
+                mode=request.mode,
+                incremental=request.incremental,
+                deadline_at=deadline_at,
+            )
             if not result:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Journal with ID {request.journal_id} not found"
                 )
-            return result
+            return _set_cache_header(response, result)
         elif request.texts:
-            return JournalController.analyze_journal_inputs(
+            result = await JournalController.analyze_journal_inputs_async(
                 user_id=request.user_id,
                 journal_date=request.journal_date,
                 texts=request.texts,
                 coach_transcript=request.coach_transcript,
                 coach_transcript_embedded=request.coach_transcript_embedded,
+                mode=request.mode,
+                incremental=request.incremental,
+                deadline_at=deadline_at,
             )
+            return _set_cache_header(response, result)
         elif request.text:
             # Analyze provided text directly (no cumulative)
-            return JournalController.analyze_text(request.text)
+            result = await JournalController.analyze_text_async(
+                request.text,
+                mode=request.mode,
+                incremental=request.incremental,
+                deadline_at=deadline_at,
+            )
+            return _set_cache_header(response, result)
         else:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Either journal_id or text must be provided"
             )
+    except DeadlineExceeded as e:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Analysis deadline exceeded: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Analysis failed: {str(e)}"
+        )
+
+@router.post("/analyze/batch", response_model=BatchAnalysisResponse)
+async def analyze_journal_batch(request: BatchAnalysisRequest):
+    """
+    Analyze an ordered backlog of journal days for one user.
+
+    Extraction runs for all days together; cumulative BRI is then applied
+    in date order in a single pass.
+    """
+    try:
+        return await JournalController.analyze_journal_batch_async(
+            user_id=request.user_id,
+            entries=request.entries,
+            mode=request.mode,
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Analysis failed: {str(e)}"
         )
 
+@router.post("/cumulative/recompute", response_model=CumulativeRecomputeResponse)
+async def recompute_cumulative_bri(request: CumulativeRecomputeRequest):
+    """
+    Recompute cumulative BRI timelines from the stored per-journal BRI.
+
+    Covers one user, or all users when user_id is omitted; use after
+    changing the smoothing factor. Several alphas can be computed at once;
+    the first is written back as cumulativeBri unless dry_run is set.
+    """
+    try:
+        return await JournalController.recompute_all_cumulative_bri_async(
+            user_id=request.user_id,
+            alphas=request.alphas,
+            dry_run=request.dry_run,
+            include_timelines=request.include_timelines,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Recomputation failed: {str(e)}"
+        )
+
+@router.post("/analyze/stream")
+async def analyze_journal_stream(request: AnalysisRequest, http_request: Request):
+    """
+    Analyze a journal entry or text, streaming progress events.
+
+    Emits preprocessing stats, provisional scores, per-chunk features and
+    finally the BurnoutRiskIndex (with cumulative_bri when user_id and
+    journal_date are given). Responds with Server-Sent Events when the
+    client accepts text/event-stream, otherwise with NDJSON. A deadline
+    (deadline_ms or the X-Request-Deadline-Ms header) applies as for
+    /analyze.
+    """
+    deadline_at = _request_deadline(request, http_request)
+    if request.texts:
+        text = JournalController.combine_inputs(request.texts)
+    elif request.text:
+        text = request.text
+    elif request.journal_id:
+        journal = await JournalController.get_journal_async(request.journal_id)
+        if not journal:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Journal with ID {request.journal_id} not found"
+            )
+        text = f"{journal.title}\n{journal.content}"
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either journal_id or text must be provided"
+        )
+
+    events = JournalController.analyze_stream(
+        text=text,
+        user_id=request.user_id,
+        journal_date=request.journal_date,
+        coach_transcript=request.coach_transcript,
+        coach_transcript_embedded=request.coach_transcript_embedded,
+        mode=request.mode,
+        deadline_at=deadline_at,
+    )
+    if "text/event-stream" in http_request.headers.get("accept", ""):
+        return StreamingResponse(_sse_events(events), media_type="text/event-stream")
+    return StreamingResponse(_ndjson_events(events), media_type="application/x-ndjson")
+
+@router.get("/analyze/metrics")
+async def get_analysis_metrics():
+    """Cache hit rate, cascade escalation rate, lexicon/LLM agreement and scheduler queues."""
+    return JournalController.analysis_metrics()
+
 @router.post("/{journal_id}/analyze", response_model=BurnoutRiskIndex)
-async def analyze_journal_by_id(journal_id: str):
-    """Analyze a specific journal entry by ID for burnout risk."""
+async def analyze_journal_by_id(journal_id: str, response: Response, background: bool = False):
+    """
+    Analyze a specific journal entry by ID for burnout risk.
+
+    With ?background=true the analysis is queued instead: responds 202 with
+    the job right away, and GET /jobs/{job_id} reports its status and result.
+    """
+    if background:
+        journal = await JournalController.get_journal_async(journal_id)
+        if not journal:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Journal with ID {journal_id} not found"
+            )
+        job = await JobController.submit_analysis_async(journal_id, user_id=journal.user_id)
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=job.model_dump(mode="json"),
+            headers={"Location": f"{settings.API_V1_PREFIX}/jobs/{job.id}"},
+        )
     try:
-        result = JournalController.analyze_journal(journal_id)
+        result = await JournalController.analyze_journal_async(journal_id)
         if not result:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Journal with ID {journal_id} not found"
             )
-        return result
+        return _set_cache_header(response, result)
     except HTTPException:
         raise
     except Exception as e:
@@ -1,31 +1,66 @@
 """User router endpoints."""
-from fastapi import APIRouter, HTTPException, status
-from typing import List
-from models.user import User, UserCreate, UserUpdate
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from typing import List, Optional
+from models.user import User, UserCreate, UserUpdate, UserListItem
 from controllers.user_controller import UserController
+from controllers.pagination import MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 @router.post("/", response_model=User, status_code=status.HTTP_201_CREATED)
 async def create_user(user: UserCreate):
     """Create a new user."""
     try:
-        return UserController.create_user(user)
+        return await UserController.create_user_async(user)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/", response_model=List[UserListItem], response_model_exclude_unset=True)
+async def get_all_users(
+    response: Response,
+    page_size: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    """
+    Get users, all of them unless `page_size` is given.
+
+    With `page_size`, users come newest first, one page at a time: pass the
+    X-Next-Cursor response header back as `cursor` for the next page (no
+    header on the last page). Paged listings skip users without created_at,
+    such as those written by the Next.js app (which uses createdAt).
+    `fields` (e.g. "name,email") limits which fields are read and returned.
+    """
+    try:
+        users, next_cursor = await UserController.list_users_async(page_size=page_size, cursor=cursor, fields=fields)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return users
+
+@router.post("/email-index/backfill")
+async def backfill_email_index():
+    """
+    Add email index entries for users written without one (e.g. by the Next.js app).
 
-@router.get("/", response_model=List[User])
-async def get_all_users():
-    """Get all users."""
-    return UserController.get_all_users()
+    Returns the number of entries created and of conflicts: emails already
+    held by another user, which need to be resolved by hand.
+    """
+    return await UserController.backfill_email_index_async()
 
 @router.get("/{user_id}", response_model=User)
 async def get_user(user_id: str):
     """Get a user by ID."""
-    user = UserController.get_user(user_id)
+    user = await UserController.get_user_async(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -37,7 +72,7 @@ async def get_user(user_id: str):
 async def update_user(user_id: str, user: UserUpdate):
     """Update a user."""
     try:
-        updated_user = UserController.update_user(user_id, user)
+        updated_user = await UserController.update_user_async(user_id, user)
         if not updated_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -53,7 +88,7 @@ async def update_user(user_id: str, user: UserUpdate):
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(user_id: str):
     """Delete a user."""
-    deleted = UserController.delete_user(user_id)
+    deleted = await UserController.delete_user_async(user_id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
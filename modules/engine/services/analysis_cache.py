@@ -0,0 +1,140 @@
+"""Content-addressed cache for burnout analysis results."""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class AnalysisCache:
+    """
+    Two-tier (memory + optional SQLite) cache keyed by content hash.
+
+    The memory tier is an LRU bounded by `max_entries`; both tiers expire
+    entries after `ttl_seconds`. Values are opaque strings (serialized JSON),
+    so the same cache can hold whole analyses or smaller feature payloads.
+    Caches sharing one SQLite file keep their entries apart by `table`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 512,
+        ttl_seconds: float = 24 * 60 * 60,
+        db_path: Optional[str] = None,
+        table: str = "analysis_cache",
+    ):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path or None
+        self.table = table
+
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.db_path:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                f"DELETE FROM {self.table} WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """Build a stable SHA-256 key from the given parts."""
+        digest = hashlib.sha256()
+        for part in parts:
+            encoded = ("" if part is None else str(part)).encode("utf-8")
+            # Length-prefix each part so ("ab", "c") and ("a", "bc") differ.
+            digest.update(len(encoded).to_bytes(8, "big"))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and (now - created_at) > self.ttl_seconds
+
+    def _remember(self, key: str, created_at: float, value: str) -> None:
+        """Insert into the memory tier (lock must be held)."""
+        self._entries[key] = (created_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for `key`, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if not self._is_expired(created_at, now):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    f"SELECT value, created_at FROM {self.table} WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None:
+                    value, created_at = row
+                    if not self._is_expired(created_at, now):
+                        self._remember(key, created_at, value)
+                        self.hits += 1
+                        self.disk_hits += 1
+                        return value
+                    self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                    self._conn.commit()
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store `value` under `key` in every configured tier."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._conn is not None:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, value, now),
+                )
+                self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop every cached entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                self._conn.execute(f"DELETE FROM {self.table}")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
@@ -0,0 +1,112 @@
+"""In-memory cache of each user's dated cumulative BRI series."""
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# One journal of a series: (createdAt as epoch seconds, journal id, cumulativeBri).
+SeriesEntry = Tuple[float, str, Optional[float]]
+
+
+class BriSeries:
+    """A user's journals in createdAt order with their cumulative BRI."""
+
+    def __init__(self, entries: Iterable[SeriesEntry]):
+        ordered = sorted(entries, key=lambda entry: entry[0])
+        self.timestamps: List[float] = [entry[0] for entry in ordered]
+        self.journal_ids: List[str] = [entry[1] for entry in ordered]
+        self.values: List[Optional[float]] = [entry[2] for entry in ordered]
+        self._index: Dict[str, int] = {journal_id: i for i, journal_id in enumerate(self.journal_ids)}
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def previous(self, before: float) -> Optional[float]:
+        """Cumulative BRI of the latest journal created strictly before `before`."""
+        position = bisect_left(self.timestamps, before)
+        return self.values[position - 1] if position else None
+
+    def set_value(self, journal_id: str, cumulative_bri: Optional[float]) -> bool:
+        """Update a known journal's value; False if the journal is not in the series."""
+        position = self._index.get(journal_id)
+        if position is None:
+            return False
+        self.values[position] = cumulative_bri
+        return True
+
+
+class CumulativeBriCache:
+    """
+    Bounded LRU of per-user BriSeries.
+
+    Series are loaded by the caller on a miss and kept for `ttl_seconds`
+    (0 keeps them until evicted), which bounds staleness from writes made
+    by other processes. Values this process computes are recorded as they
+    are produced.
+    """
+
+    def __init__(self, *, max_users: int = 1024, ttl_seconds: float = 300.0):
+        self.max_users = max(1, max_users)
+        self.ttl_seconds = ttl_seconds
+        self._series: "OrderedDict[str, Tuple[float, BriSeries]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, user_id: str) -> Optional[BriSeries]:
+        """Return the user's cached series, or None on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._series.get(user_id)
+            if entry is not None and self.ttl_seconds > 0 and now - entry[0] > self.ttl_seconds:
+                del self._series[user_id]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._series.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user_id: str, series: BriSeries) -> None:
+        """Store a freshly loaded series."""
+        with self._lock:
+            self._series[user_id] = (time.monotonic(), series)
+            self._series.move_to_end(user_id)
+            while len(self._series) > self.max_users:
+                self._series.popitem(last=False)
+                self.evictions += 1
+
+    def record(self, user_id: str, journal_id: str, cumulative_bri: Optional[float]) -> None:
+        """
+        Note a newly computed cumulative BRI.
+
+        A journal the series does not know yet (its createdAt is unknown
+        here) drops the user's series so the next lookup reloads it.
+        """
+        with self._lock:
+            entry = self._series.get(user_id)
+            if entry is not None and not entry[1].set_value(journal_id, cumulative_bri):
+                del self._series[user_id]
+
+    def invalidate(self, user_id: str) -> None:
+        """Forget a user's series, e.g. after rewriting their timeline."""
+        with self._lock:
+            self._series.pop(user_id, None)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "users": len(self._series),
+                "max_users": self.max_users,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
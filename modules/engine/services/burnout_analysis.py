@@ -1,8 +1,14 @@
 """Burnout risk analysis service using LangExtract."""
 from __future__ import annotations
 
-import re
-from typing import List, Dict, Optional, Sequence
+import logging
+import time
+from itertools import accumulate
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from pydantic import TypeAdapter
 
 try:
     import langextract as lx
@@ -11,50 +17,330 @@ except ImportError:
     LANGEXTRACT_AVAILABLE = False
 
 from models.burnout import (
+    CUMULATIVE_BRI_ALPHA,
     BurnoutRiskIndex,
     BurnoutFeature,
     MBIScore,
     MBIDimension,
     EmotionType,
 )
+from services.analysis_cache import AnalysisCache
+from services.single_flight import SingleFlight
+from services.executor import run_blocking
+from services.extraction_backends import ExtractionBackend, LangExtractBackend
+from services.lexicon_matcher import LEXICON_MATCHER, PROTECTIVE
+from services.lexicon_scorer import LexiconScorer
+from services.cascade import CascadePolicy, CascadeStats
+from services.chunking import chunk_text, estimate_tokens
+from services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from services.deadline import (
+    DeadlineExceeded,
+    current_deadline,
+    deadline_scope,
+    earliest,
+    expired,
+    remaining,
+    submit_with_deadline,
+)
 from services.preprocessing import preprocess_text
-
-PROTECTIVE_TERMS = (
-    "rest",
-    "rested",
-    "recover",
-    "recovering",
-    "support",
-    "supported",
-    "therapy",
-    "friend",
-    "family",
-    "break",
-    "vacation",
-    "sleep",
-    "manageable",
-    "better",
-    "hopeful",
-    "proud",
-    "grateful",
-    "calm",
+from services.scheduler import PRIORITY_BULK, priority_scope
+
+logger = logging.getLogger(__name__)
+
+# Serializer for per-sentence feature lists stored by incremental analysis.
+_FEATURE_LIST = TypeAdapter(List[BurnoutFeature])
+
+# Analysis modes: LangExtract only, offline lexicon only, or LangExtract with
+# lexicon fallback.
+MODE_LLM = "llm"
+MODE_LEXICON = "lexicon"
+MODE_AUTO = "auto"
+ANALYSIS_MODES = (MODE_AUTO, MODE_LLM, MODE_LEXICON)
+
+# Gemini model used for feature extraction.
+MODEL_ID = "gemini-3.1-flash-lite-preview"
+# Bump whenever the extraction prompt or examples change so cached analyses
+# produced by an older prompt are no longer reused.
+PROMPT_VERSION = "1"
+# Default LRU size of the per-sentence feature cache used by incremental analysis.
+DEFAULT_SEGMENT_CACHE_ENTRIES = 4096
+# Default size of the pool that runs blocking analyses for `analyze_async`.
+DEFAULT_MAX_WORKERS = 4
+# Default number of parallel model calls for multi-document extraction.
+DEFAULT_BATCH_WORKERS = 4
+# Default size of the pool that runs individual LangExtract calls in parallel.
+# Kept separate from the analysis pool so an analysis never waits on its own pool.
+DEFAULT_EXTRACTION_WORKERS = 8
+# Estimated tokens per LangExtract request before a text is chunked.
+DEFAULT_CHUNK_TOKEN_BUDGET = 1500
+
+EXTRACTION_PROMPT = (
+    "Extract burnout-related signals from a single journal sentence. "
+    "Return: emotion (negative/neutral/positive); "
+    "stress_level as a float 0-1; "
+    "has_cynical_thoughts as boolean; "
+    "burnout_markers as an array of any of "
+    "[emotional_exhaustion, depersonalization, personal_accomplishment]; "
+    "ee_score, dp_score, pa_score as numbers from 0 to 100 "
+    "representing emotional exhaustion, depersonalization, and low personal "
+    "accomplishment respectively (higher means more burnout risk on that "
+    "dimension for this sentence); and is_poor_writer as boolean when the "
+    "writing looks fragmented, grammatically weak, or very sparse but still "
+    "emotionally intense."
 )
 
 
 class BurnoutAnalysisService:
     """Service for analyzing burnout risk from journal text."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[AnalysisCache] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        extraction_workers: int = DEFAULT_EXTRACTION_WORKERS,
+        llm_latency_budget: Optional[float] = None,
+        cascade: Optional[CascadePolicy] = None,
+        incremental: bool = False,
+        backend: Optional[ExtractionBackend] = None,
+        chunk_token_budget: Optional[int] = DEFAULT_CHUNK_TOKEN_BUDGET,
+        breaker: Optional[CircuitBreaker] = None,
+        default_mode: str = MODE_LLM,
+        segment_cache: Optional[AnalysisCache] = None,
+    ):
         """
         Initialize the burnout analysis service.
         
         Args:
             api_key: Optional API key for LangExtract/Gemini. If not provided,
                     analysis will raise because LangExtract is required.
+            cache: Optional result cache; identical inputs skip LangExtract.
+            max_workers: Size of the bounded pool used by the async API.
+            extraction_workers: Size of the pool for concurrent LangExtract calls.
+            llm_latency_budget: Seconds "auto" mode waits for LangExtract before
+                    falling back to lexicon scoring (None waits indefinitely).
+            cascade: Policy deciding when "auto" mode escalates to LangExtract.
+            incremental: Default for `analyze(incremental=...)`; extract per
+                    sentence and reuse cached features for unchanged sentences.
+            backend: Extraction backend (e.g. a ReplayBackend for offline runs).
+                    Defaults to live LangExtract when it is installed and
+                    `api_key` is set.
+            chunk_token_budget: Estimated tokens per LangExtract request; longer
+                    texts are chunked and extracted in parallel (None disables).
+            breaker: Circuit breaker around backend calls; while it is open,
+                    "auto" mode serves degraded lexicon results immediately.
+            default_mode: Mode used when a call passes mode=None; "llm" like
+                    the ANALYSIS_DEFAULT_MODE setting.
+            segment_cache: Cache for per-sentence features of incremental
+                    analyses. Kept apart from `cache` so sentences never evict
+                    whole results; defaults to an in-memory cache when `cache`
+                    is set.
         """
         self.api_key = api_key
-        self.use_langextract = LANGEXTRACT_AVAILABLE and bool(api_key)
+        if backend is None and LANGEXTRACT_AVAILABLE and api_key:
+            backend = LangExtractBackend(
+                api_key=api_key,
+                model_id=MODEL_ID,
+                prompt_description=EXTRACTION_PROMPT,
+                examples=self._build_examples(),
+            )
+        self.backend = backend
+        self.use_langextract = backend is not None
+        self.cache = cache
+        if segment_cache is None and cache is not None:
+            segment_cache = AnalysisCache(
+                max_entries=DEFAULT_SEGMENT_CACHE_ENTRIES,
+                ttl_seconds=cache.ttl_seconds,
+            )
+        self.segment_cache = segment_cache
+        self.llm_latency_budget = llm_latency_budget
+        self.incremental = incremental
+        if default_mode not in ANALYSIS_MODES:
+            raise ValueError(f"Unknown analysis mode: {default_mode}")
+        self.default_mode = default_mode
+        self.chunk_token_budget = chunk_token_budget
+        self.extraction_workers = max(1, extraction_workers)
+        self.lexicon_scorer = LexiconScorer()
+        self.cascade = cascade or CascadePolicy()
+        self.cascade_stats = CascadeStats()
+        self.single_flight: SingleFlight[BurnoutRiskIndex] = SingleFlight()
+        self.breaker = breaker or CircuitBreaker()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers),
+            thread_name_prefix="burnout-analysis",
+        )
+        self.extraction_executor = ThreadPoolExecutor(
+            max_workers=max(1, extraction_workers),
+            thread_name_prefix="burnout-extraction",
+        )
     
+    @staticmethod
+    def _build_examples() -> list:
+        """Few-shot examples that anchor LangExtract's per-sentence scoring."""
+        return [
+            lx.data.ExampleData(
+                text="I'm so exhausted and overwhelmed with work. This is pointless.",
+                extractions=[
+                    lx.data.Extraction(
+                        extraction_class="burnout_analysis",
+                        extraction_text="I'm so exhausted and overwhelmed with work. This is pointless.",
+                        attributes={
+                            "emotion": "negative",
+                            "stress_level": 0.9,
+                            "has_cynical_thoughts": True,
+                            "burnout_markers": [
+                                "emotional_exhaustion",
+                                "depersonalization",
+                            ],
+                            "ee_score": 85,
+                            "dp_score": 70,
+                            "pa_score": 20,
+                            "is_poor_writer": False,
+                        },
+                    )
+                ],
+            ),
+            lx.data.ExampleData(
+                text="Today was great! I accomplished a lot and feel proud of my work.",
+                extractions=[
+                    lx.data.Extraction(
+                        extraction_class="burnout_analysis",
+                        extraction_text="Today was great! I accomplished a lot and feel proud of my work.",
+                        attributes={
+                            "emotion": "positive",
+                            "stress_level": 0.1,
+                            "has_cynical_thoughts": False,
+                            "burnout_markers": ["personal_accomplishment"],
+                            "ee_score": 5,
+                            "dp_score": 5,
+                            "pa_score": 10,
+                            "is_poor_writer": False,
+                        },
+                    )
+                ],
+            ),
+            lx.data.ExampleData(
+                text="I feel like I never get anything meaningful done, no matter how hard I try.",
+                extractions=[
+                    lx.data.Extraction(
+                        extraction_class="burnout_analysis",
+                        extraction_text="I feel like I never get anything meaningful done, no matter how hard I try.",
+                        attributes={
+                            "emotion": "negative",
+                            "stress_level": 0.7,
+                            "has_cynical_thoughts": False,
+                            "burnout_markers": ["personal_accomplishment"],
+                            # High PA risk score: strong sense of low personal accomplishment
+                            "ee_score": 40,
+                            "dp_score": 25,
+                            "pa_score": 85,
+                            "is_poor_writer": False,
+                        },
+                    )
+                ],
+            ),
+        ]
+
+    @staticmethod
+    def _feature_from_attributes(attrs: dict) -> BurnoutFeature:
+        """Convert one LangExtract attribute dict into a validated BurnoutFeature."""
+        emotion_str = (attrs.get("emotion") or "neutral").strip().lower()
+        emotion_type = (
+            EmotionType(emotion_str)
+            if emotion_str in ("negative", "neutral", "positive")
+            else EmotionType.NEUTRAL
+        )
+
+        raw_stress = attrs.get("stress_level", 0)
+        try:
+            stress_level = float(raw_stress)
+        except (TypeError, ValueError):
+            stress_level = 0.0
+        stress_level = max(0.0, min(1.0, stress_level))
+
+        raw_cynical = attrs.get("has_cynical_thoughts", False)
+        cynical = (
+            raw_cynical is True
+            or (isinstance(raw_cynical, str) and raw_cynical.strip().lower() in ("true", "1", "yes"))
+        )
+
+        markers = attrs.get("burnout_markers") or []
+        if isinstance(markers, str):
+            markers = [m.strip() for m in markers.split(",") if m.strip()]
+
+        mbi_dimensions = []
+        if markers:
+            if "emotional_exhaustion" in markers:
+                mbi_dimensions.append(MBIDimension.EMOTIONAL_EXHAUSTION)
+            if "depersonalization" in markers:
+                mbi_dimensions.append(MBIDimension.DEPERSONALIZATION)
+            if "personal_accomplishment" in markers:
+                mbi_dimensions.append(MBIDimension.PERSONAL_ACCOMPLISHMENT)
+
+        # New: per-sentence MBI scores and poor-writer flag
+        def _score_from_attr(key: str, default: float) -> float:
+            raw_val = attrs.get(key, default)
+            try:
+                val = float(raw_val)
+            except (TypeError, ValueError):
+                val = default
+            return max(0.0, min(100.0, val))
+
+        ee_score = _score_from_attr("ee_score", 0.0)
+        dp_score = _score_from_attr("dp_score", 0.0)
+        pa_score = _score_from_attr("pa_score", 0.0)
+
+        # Fallback heuristics if scores are all zero: derive from markers/emotion
+        if ee_score == 0.0 and "emotional_exhaustion" in markers:
+            ee_score = max(ee_score, stress_level * 100.0)
+        if dp_score == 0.0 and "depersonalization" in markers:
+            dp_score = max(dp_score, stress_level * 100.0 * 0.8)
+        if pa_score == 0.0 and "personal_accomplishment" in markers:
+            # Higher PA terms = lower burnout; invert into risk-ish score
+            pa_score = max(pa_score, 100.0 - stress_level * 100.0)
+
+        raw_poor = attrs.get("is_poor_writer", False)
+        is_poor_writer = (
+            raw_poor is True
+            or (isinstance(raw_poor, str) and raw_poor.strip().lower() in ("true", "1", "yes"))
+        )
+
+        return BurnoutFeature(
+            emotion_type=emotion_type,
+            stress_level=stress_level,
+            cynical_thoughts=cynical,
+            mbi_dimension=mbi_dimensions,
+            confidence=0.8,
+            ee_score=ee_score,
+            dp_score=dp_score,
+            pa_score=pa_score,
+            is_poor_writer=is_poor_writer,
+        )
+
+    def _call_backend(self, texts: List[str], *, max_workers: int = 1):
+        """Call the extraction backend through the circuit breaker."""
+        if expired():
+            raise DeadlineExceeded("Request deadline passed before calling LangExtract.")
+        if not self.breaker.allow_request():
+            raise CircuitOpenError("LangExtract circuit is open; not calling the model.")
+        started = time.perf_counter()
+        try:
+            result = self.backend.extract(texts, max_workers=max_workers)
+        except DeadlineExceeded:
+            # Our own time budget ran out; not a sign of an unhealthy model,
+            # but a half-open probe must not stay claimed.
+            self.breaker.release_probe()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success(time.perf_counter() - started)
+        return result
+
+    def _features_from_attribute_lists(self, attribute_lists) -> List[BurnoutFeature]:
+        """Convert a backend's attribute dicts for one text into features."""
+        return [self._feature_from_attributes(attrs) for attrs in attribute_lists]
+
     def _extract_features_with_langextract(self, text: str, sentences: List[str]) -> List[BurnoutFeature]:
         """
         Extract features using LangExtract for each sentence, including
@@ -69,176 +355,41 @@ class BurnoutAnalysisService:
                 continue
 
             try:
-                result = lx.extract(
-                    text_or_documents=sentence,
-                    prompt_description=(
-                        "Extract burnout-related signals from a single journal sentence. "
-                        "Return: emotion (negative/neutral/positive); "
-                        "stress_level as a float 0-1; "
-                        "has_cynical_thoughts as boolean; "
-                        "burnout_markers as an array of any of "
-                        "[emotional_exhaustion, depersonalization, personal_accomplishment]; "
-                        "ee_score, dp_score, pa_score as numbers from 0 to 100 "
-                        "representing emotional exhaustion, depersonalization, and low personal "
-                        "accomplishment respectively (higher means more burnout risk on that "
-                        "dimension for this sentence); and is_poor_writer as boolean when the "
-                        "writing looks fragmented, grammatically weak, or very sparse but still "
-                        "emotionally intense."
-                    ),
-                    examples=[
-                        lx.data.ExampleData(
-                            text="I'm so exhausted and overwhelmed with work. This is pointless.",
-                            extractions=[
-                                lx.data.Extraction(
-                                    extraction_class="burnout_analysis",
-                                    extraction_text="I'm so exhausted and overwhelmed with work. This is pointless.",
-                                    attributes={
-                                        "emotion": "negative",
-                                        "stress_level": 0.9,
-                                        "has_cynical_thoughts": True,
-                                        "burnout_markers": [
-                                            "emotional_exhaustion",
-                                            "depersonalization",
-                                        ],
-                                        "ee_score": 85,
-                                        "dp_score": 70,
-                                        "pa_score": 20,
-                                        "is_poor_writer": False,
-                                    },
-                                )
-                            ],
-                        ),
-                        lx.data.ExampleData(
-                            text="Today was great! I accomplished a lot and feel proud of my work.",
-                            extractions=[
-                                lx.data.Extraction(
-                                    extraction_class="burnout_analysis",
-                                    extraction_text="Today was great! I accomplished a lot and feel proud of my work.",
-                                    attributes={
-                                        "emotion": "positive",
-                                        "stress_level": 0.1,
-                                        "has_cynical_thoughts": False,
-                                        "burnout_markers": ["personal_accomplishment"],
-                                        "ee_score": 5,
-                                        "dp_score": 5,
-                                        "pa_score": 10,
-                                        "is_poor_writer": False,
-                                    },
-                                )
-                            ],
-                        ),
-                        lx.data.ExampleData(
-                            text="I feel like I never get anything meaningful done, no matter how hard I try.",
-                            extractions=[
-                                lx.data.Extraction(
-                                    extraction_class="burnout_analysis",
-                                    extraction_text="I feel like I never get anything meaningful done, no matter how hard I try.",
-                                    attributes={
-                                        "emotion": "negative",
-                                        "stress_level": 0.7,
-                                        "has_cynical_thoughts": False,
-                                        "burnout_markers": ["personal_accomplishment"],
-                                        # High PA risk score: strong sense of low personal accomplishment
-                                        "ee_score": 40,
-                                        "dp_score": 25,
-                                        "pa_score": 85,
-                                        "is_poor_writer": False,
-                                    },
-                                )
-                            ],
-                        ),
-                    ],
-                    model_id="gemini-3.1-flash-lite-preview",
-                    api_key=self.api_key,
-                )
-
-                docs = result if isinstance(result, list) else [result]
-                for doc in docs:
-                    extractions = getattr(doc, "extractions", []) or []
-                    for extraction in extractions:
-                        attrs = getattr(extraction, "attributes", {}) or {}
-                        if not isinstance(attrs, dict):
-                            continue
-
-                        emotion_str = (attrs.get("emotion") or "neutral").strip().lower()
-                        emotion_type = (
-                            EmotionType(emotion_str)
-                            if emotion_str in ("negative", "neutral", "positive")
-                            else EmotionType.NEUTRAL
-                        )
-
-                        raw_stress = attrs.get("stress_level", 0)
-                        try:
-                            stress_level = float(raw_stress)
-                        except (TypeError, ValueError):
-                            stress_level = 0.0
-                        stress_level = max(0.0, min(1.0, stress_level))
-
-                        raw_cynical = attrs.get("has_cynical_thoughts", False)
-                        cynical = (
-                            raw_cynical is True
-                            or (isinstance(raw_cynical, str) and raw_cynical.strip().lower() in ("true", "1", "yes"))
-                        )
-
-                        markers = attrs.get("burnout_markers") or []
-                        if isinstance(markers, str):
-                            markers = [m.strip() for m in markers.split(",") if m.strip()]
-
-                        mbi_dimensions = []
-                        if markers:
-                            if "emotional_exhaustion" in markers:
-                                mbi_dimensions.append(MBIDimension.EMOTIONAL_EXHAUSTION)
-                            if "depersonalization" in markers:
-                                mbi_dimensions.append(MBIDimension.DEPERSONALIZATION)
-                            if "personal_accomplishment" in markers:
-                                mbi_dimensions.append(MBIDimension.PERSONAL_ACCOMPLISHMENT)
-
-                        # New: per-sentence MBI scores and poor-writer flag
-                        def _score_from_attr(key: str, default: float) -> float:
-                            raw_val = attrs.get(key, default)
-                            try:
-                                val = float(raw_val)
-                            except (TypeError, ValueError):
-                                val = default
-                            return max(0.0, min(100.0, val))
-
-                        ee_score = _score_from_attr("ee_score", 0.0)
-                        dp_score = _score_from_attr("dp_score", 0.0)
-                        pa_score = _score_from_attr("pa_score", 0.0)
-
-                        # Fallback heuristics if scores are all zero: derive from markers/emotion
-                        if ee_score == 0.0 and "emotional_exhaustion" in markers:
-                            ee_score = max(ee_score, stress_level * 100.0)
-                        if dp_score == 0.0 and "depersonalization" in markers:
-                            dp_score = max(dp_score, stress_level * 100.0 * 0.8)
-                        if pa_score == 0.0 and "personal_accomplishment" in markers:
-                            # Higher PA terms = lower burnout; invert into risk-ish score
-                            pa_score = max(pa_score, 100.0 - stress_level * 100.0)
-
-                        raw_poor = attrs.get("is_poor_writer", False)
-                        is_poor_writer = (
-                            raw_poor is True
-                            or (isinstance(raw_poor, str) and raw_poor.strip().lower() in ("true", "1", "yes"))
-                        )
-
-                        feature = BurnoutFeature(
-                            emotion_type=emotion_type,
-                            stress_level=stress_level,
-                            cynical_thoughts=cynical,
-                            mbi_dimension=mbi_dimensions,
-                            confidence=0.8,
-                            ee_score=ee_score,
-                            dp_score=dp_score,
-                            pa_score=pa_score,
-                            is_poor_writer=is_poor_writer,
-                        )
-                        features.append(feature)
-
+                [attribute_list] = self._call_backend([sentence])
+                features.extend(self._features_from_attribute_lists(attribute_list))
+            except (CircuitOpenError, DeadlineExceeded):
+                raise
             except Exception as e:
                 # LangExtract is required per product spec; fail fast so callers can surface it.
                 raise RuntimeError(f"LangExtract failed for sentence: {e}") from e
 
         return features
+
+    def _extract_features_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+    ) -> List[List[BurnoutFeature]]:
+        """
+        Extract features for several independent texts in one backend call.
+
+        The LangExtract backend uses multi-document mode so the library
+        batches and parallelizes the model calls (bounded by `max_workers`).
+        Returns one feature list per input text, in input order.
+        """
+        if not texts:
+            return []
+        if len(texts) == 1:
+            return [self._extract_features_with_langextract(texts[0], [texts[0]])]
+
+        try:
+            attribute_lists = self._call_backend(list(texts), max_workers=max(1, max_workers))
+        except (CircuitOpenError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            raise RuntimeError(f"LangExtract failed for batch: {e}") from e
+        return [self._features_from_attribute_lists(attrs) for attrs in attribute_lists]
     
     def _calculate_mbi_scores(self, features: List[BurnoutFeature], text: str, text_length: int) -> Dict[MBIDimension, MBIScore]:
         """
@@ -264,22 +415,30 @@ class BurnoutAnalysisService:
             MBIDimension.PERSONAL_ACCOMPLISHMENT: 0,
         }
 
+        weights: Dict[MBIDimension, float] = {
+            MBIDimension.EMOTIONAL_EXHAUSTION: 0.0,
+            MBIDimension.DEPERSONALIZATION: 0.0,
+            MBIDimension.PERSONAL_ACCOMPLISHMENT: 0.0,
+        }
+
+        # Weighted mean per dimension; every feature weighs 1.0 unless it came
+        # from a chunked extraction, where weights follow chunk length.
         for feature in features:
-            if feature.ee_score > 0.0:
-                sum_scores[MBIDimension.EMOTIONAL_EXHAUSTION] += feature.ee_score
-                counts[MBIDimension.EMOTIONAL_EXHAUSTION] += 1
-            if feature.dp_score > 0.0:
-                sum_scores[MBIDimension.DEPERSONALIZATION] += feature.dp_score
-                counts[MBIDimension.DEPERSONALIZATION] += 1
-            if feature.pa_score > 0.0:
-                sum_scores[MBIDimension.PERSONAL_ACCOMPLISHMENT] += feature.pa_score
-                counts[MBIDimension.PERSONAL_ACCOMPLISHMENT] += 1
+            for dim, score in (
+                (MBIDimension.EMOTIONAL_EXHAUSTION, feature.ee_score),
+                (MBIDimension.DEPERSONALIZATION, feature.dp_score),
+                (MBIDimension.PERSONAL_ACCOMPLISHMENT, feature.pa_score),
+            ):
+                if score > 0.0:
+                    sum_scores[dim] += feature.weight * score
+                    weights[dim] += feature.weight
+                    counts[dim] += 1
 
         mbi_scores: Dict[MBIDimension, MBIScore] = {}
         for dim in MBIDimension:
             count = counts[dim]
-            if count > 0:
-                avg_score = sum_scores[dim] / count
+            if count > 0 and weights[dim] > 0.0:
+                avg_score = sum_scores[dim] / weights[dim]
             else:
                 avg_score = 0.0
 
@@ -341,34 +500,33 @@ class BurnoutAnalysisService:
 
         return "\n".join(user_turns).strip()
 
-    def _compute_coach_modifier(
+    def _prepare_coach_text(
         self,
-        *,
-        base_score: float,
         coach_transcript: Optional[str],
         coach_transcript_embedded: bool,
-    ) -> tuple[float, bool]:
-        """
-        Compute a small optional modifier from the live coach conversation.
-
-        The modifier is intended to refine the BRI when the coach elicits extra
-        burnout-related context that was not captured in the written journal.
-        """
+    ) -> Optional[str]:
+        """Return the cleaned user-authored coach text, or None when there is nothing to score."""
         if coach_transcript_embedded:
-            return 0.0, False
+            return None
 
         if not coach_transcript or not coach_transcript.strip():
-            return 0.0, False
+            return None
 
         user_text = self._extract_user_turns(coach_transcript)
         if not user_text:
-            return 0.0, False
+            return None
 
         cleaned_text, _sentences = preprocess_text(user_text)
-        if not cleaned_text:
-            return 0.0, False
+        return cleaned_text or None
 
-        coach_features = self._extract_features_with_langextract(cleaned_text, [cleaned_text])
+    def _coach_modifier_from_features(
+        self,
+        *,
+        base_score: float,
+        coach_features: List[BurnoutFeature],
+        cleaned_text: str,
+    ) -> tuple[float, bool]:
+        """Combine already-extracted coach features with the journal's base score."""
         if not coach_features:
             return 0.0, False
 
@@ -401,11 +559,7 @@ class BurnoutAnalysisService:
         positive_count = sum(
             1 for feature in coach_features if feature.emotion_type == EmotionType.POSITIVE
         )
-        protective_hits = sum(
-            1
-            for term in PROTECTIVE_TERMS
-            if re.search(rf"\b{re.escape(term)}\b", cleaned_text, flags=re.IGNORECASE)
-        )
+        protective_hits = len(LEXICON_MATCHER.match(cleaned_text).distinct_terms(PROTECTIVE))
         protective_offset = min(5.0, (positive_count * 1.0) + (protective_hits * 0.75))
 
         modifier = disclosure_bonus + consistency_bonus - protective_offset
@@ -417,42 +571,520 @@ class BurnoutAnalysisService:
 
         return float(modifier), True
 
+    def _compute_coach_modifier(
+        self,
+        *,
+        base_score: float,
+        coach_transcript: Optional[str],
+        coach_transcript_embedded: bool,
+    ) -> tuple[float, bool]:
+        """
+        Compute a small optional modifier from the live coach conversation.
+
+        The modifier is intended to refine the BRI when the coach elicits extra
+        burnout-related context that was not captured in the written journal.
+        """
+        cleaned_text = self._prepare_coach_text(coach_transcript, coach_transcript_embedded)
+        if not cleaned_text:
+            return 0.0, False
+
+        coach_features = self._extract_features_with_langextract(cleaned_text, [cleaned_text])
+        return self._coach_modifier_from_features(
+            base_score=base_score,
+            coach_features=coach_features,
+            cleaned_text=cleaned_text,
+        )
+
+    def _extract_chunked(self, text: str, sentences: Optional[List[str]] = None) -> List[BurnoutFeature]:
+        """
+        Extract features for `text`, splitting it into token-budgeted chunks when long.
+
+        Chunks end on sentence boundaries and are extracted together in one
+        multi-document call, so latency stays close to that of one chunk.
+        Each feature is weighted by its chunk's share of the text (divided
+        among the chunk's features) for the length-weighted merge in
+        `_calculate_mbi_scores`.
+        """
+        chunks = self._chunks(text, sentences)
+        if len(chunks) == 1:
+            return self._extract_features_with_langextract(text, [text])
+
+        per_chunk = self._extract_features_batch(
+            chunks,
+            max_workers=min(len(chunks), self.extraction_workers),
+        )
+        return self._weight_chunk_features(chunks, per_chunk)
+
+    def _chunks(self, text: str, sentences: Optional[List[str]] = None) -> List[str]:
+        """Split `text` into token-budgeted chunks, or [text] when it fits one request."""
+        if not self.chunk_token_budget or estimate_tokens(text) <= self.chunk_token_budget:
+            return [text]
+        return chunk_text(text, self.chunk_token_budget, sentences) or [text]
+
+    @staticmethod
+    def _weight_chunk_features(
+        chunks: Sequence[str],
+        per_chunk: Sequence[Optional[List[BurnoutFeature]]],
+    ) -> List[BurnoutFeature]:
+        """Flatten per-chunk features, weighting each by its chunk's share of the text."""
+        total_length = sum(len(chunk) for chunk in chunks) or 1
+        features: List[BurnoutFeature] = []
+        for chunk, chunk_features in zip(chunks, per_chunk):
+            if not chunk_features:
+                continue
+            weight = (len(chunk) / total_length) / len(chunk_features)
+            features.extend(feature.model_copy(update={"weight": weight}) for feature in chunk_features)
+        return features
+
+    def _timed_extract(self, text: str, sentences: Optional[List[str]] = None) -> tuple[List[BurnoutFeature], float]:
+        """Extract features for `text` and return them with the elapsed milliseconds."""
+        started = time.perf_counter()
+        features = self._extract_chunked(text, sentences)
+        return features, (time.perf_counter() - started) * 1000.0
+
+    @staticmethod
+    def _segment_key(segment: str) -> str:
+        """Content key for the features of one sentence."""
+        return AnalysisCache.make_key("segment", segment, MODEL_ID, PROMPT_VERSION)
+
+    def _extract_segments(
+        self,
+        sentences: Sequence[str],
+        segment_stats: Dict[str, int],
+    ) -> List[BurnoutFeature]:
+        """
+        Extract features sentence by sentence, reusing cached sentences.
+
+        Only sentences without stored features are sent to LangExtract, in one
+        multi-document call, so re-analysing an edited entry costs time
+        proportional to the edit. Features are returned in sentence order;
+        `segment_stats` receives the reused and extracted counts.
+        """
+        segments = [sentence.strip() for sentence in sentences if sentence.strip()]
+        features_by_segment: Dict[str, List[BurnoutFeature]] = {}
+        pending: List[str] = []
+        for segment in dict.fromkeys(segments):
+            cached = self.segment_cache.get(self._segment_key(segment)) if self.segment_cache is not None else None
+            if cached is not None:
+                features_by_segment[segment] = _FEATURE_LIST.validate_json(cached)
+            else:
+                pending.append(segment)
+
+        for segment, features in zip(pending, self._extract_features_batch(pending)):
+            features_by_segment[segment] = features
+            if self.segment_cache is not None:
+                self.segment_cache.set(self._segment_key(segment), _FEATURE_LIST.dump_json(features).decode())
+
+        segment_stats["extracted"] = len(pending)
+        segment_stats["reused"] = len(features_by_segment) - len(pending)
+        return [feature for segment in segments for feature in features_by_segment[segment]]
+
+    def _timed_incremental_extract(
+        self,
+        sentences: Sequence[str],
+        segment_stats: Dict[str, int],
+    ) -> tuple[List[BurnoutFeature], float]:
+        """`_extract_segments` with the elapsed milliseconds."""
+        started = time.perf_counter()
+        features = self._extract_segments(sentences, segment_stats)
+        return features, (time.perf_counter() - started) * 1000.0
+
+    def _cache_key(
+        self,
+        cleaned_text: str,
+        coach_transcript: Optional[str],
+        coach_transcript_embedded: bool,
+        incremental: bool,
+    ) -> str:
+        """
+        Content key for an analysis; embedded transcripts never affect the score.
+
+        Incremental results are keyed apart, since they report segment counts
+        and aggregate per-sentence rather than whole-text extractions.
+        """
+        transcript = "" if coach_transcript_embedded else (coach_transcript or "").strip()
+        return AnalysisCache.make_key(
+            "analysis",
+            cleaned_text,
+            transcript,
+            MODEL_ID,
+            PROMPT_VERSION,
+            "incremental" if incremental else "whole",
+        )
+
+    def _timed_lexicon_extract(self, text: str) -> tuple[List[BurnoutFeature], float]:
+        """Score `text` with the offline lexicon scorer and return the elapsed milliseconds."""
+        started = time.perf_counter()
+        features = self.lexicon_scorer.extract_features(text)
+        return features, (time.perf_counter() - started) * 1000.0
+
+    def _base_score(self, features: List[BurnoutFeature], cleaned_text: str) -> float:
+        """Base BRI for a feature list, without coach modifiers."""
+        mbi_scores = self._calculate_mbi_scores(features, cleaned_text, len(cleaned_text))
+        return self._calculate_overall_score(mbi_scores, len(cleaned_text))
+
+    def _shadow_compare(self, cleaned_text: str, local_score: float) -> None:
+        """Score a confidently-local text with LangExtract to measure tier agreement."""
+        try:
+            # Measurement only: never take capacity ahead of user requests.
+            with priority_scope(PRIORITY_BULK, tenant="shadow"):
+                features = self._extract_features_with_langextract(cleaned_text, [cleaned_text])
+        except Exception:
+            logger.warning("Shadow LangExtract comparison failed.", exc_info=True)
+            return
+        self.cascade_stats.record_agreement(
+            tier="shadow",
+            local_score=local_score,
+            llm_score=self._base_score(features, cleaned_text),
+        )
+
+    def metrics(self) -> Dict[str, object]:
+        """Counters for monitoring cache efficiency, cascade routing, coalescing and model calls."""
+        return {
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "segment_cache": self.segment_cache.stats() if self.segment_cache is not None else None,
+            "cascade": self.cascade_stats.snapshot(),
+            "single_flight": self.single_flight.stats(),
+            "backend": self.backend.stats() if self.backend is not None else None,
+            "circuit_breaker": self.breaker.stats(),
+        }
+
+    def _budget_deadline(self, started: float) -> Optional[float]:
+        """Monotonic deadline for auto mode's LLM branches: latency budget or request deadline."""
+        budget_deadline = None
+        if self.llm_latency_budget is not None:
+            budget_deadline = time.monotonic() + self.llm_latency_budget - (time.perf_counter() - started)
+        return earliest(budget_deadline, current_deadline())
+
+    def _await_llm_branch(
+        self,
+        future: Future,
+        *,
+        deadline_at: Optional[float],
+        branch: str,
+    ) -> Optional[tuple[List[BurnoutFeature], float]]:
+        """Wait for an LLM branch in auto mode; None when it failed or overran its budget."""
+        try:
+            return future.result(timeout=remaining(deadline_at) if deadline_at is not None else None)
+        except (FuturesTimeoutError, DeadlineExceeded):
+            future.cancel()
+            logger.warning("LangExtract %s extraction exceeded its latency budget; using lexicon scores.", branch)
+        except CircuitOpenError:
+            logger.debug("LangExtract circuit is open; using lexicon scores for %s.", branch)
+        except Exception:
+            logger.exception("LangExtract %s extraction failed; using lexicon scores.", branch)
+        return None
+
     def analyze(
         self,
         text: str,
         *,
         coach_transcript: Optional[str] = None,
         coach_transcript_embedded: bool = False,
+        mode: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        deadline_at: Optional[float] = None,
     ) -> BurnoutRiskIndex:
         """
         Analyze text for burnout risk.
+
+        When a coach transcript needs scoring, its extraction runs on the
+        extraction pool while the journal is extracted, so the two LLM round
+        trips overlap instead of adding up.
+
+        `mode` selects the scorer: "llm" always uses LangExtract and raises
+        when it fails (an open circuit breaker is the exception: the call is
+        rejected without reaching the model and the lexicon score is served,
+        flagged degraded), "lexicon" uses the offline dictionary scorer,
+        and "auto" cascades: it scores locally first and escalates to
+        LangExtract only when the cascade policy finds the local score
+        ambiguous. An escalated call that is unavailable, fails, exceeds
+        `llm_latency_budget`, or is rejected by the open circuit breaker falls
+        back to the local score (flagged degraded).
+
+        With `incremental`, LangExtract runs per sentence and features of
+        sentences seen before are reused from the cache, so an edited entry
+        only pays for its new or changed sentences.
+
+        Concurrent identical requests (same text, coach transcript, mode) are
+        coalesced: followers wait for the in-flight leader and receive a copy
+        of its result flagged `coalesced`. A leader outcome shaped by its own
+        deadline (DeadlineExceeded, or a partial or degraded result) is not
+        shared; followers re-run the analysis under their own deadline.
+
+        `deadline_at` (a time.monotonic() value) bounds the whole request,
+        including model calls made on worker threads. Stages that cannot
+        finish in time are abandoned: in auto mode the local score is served,
+        in llm mode a late coach extraction is skipped and the base score is
+        returned without the coach modifier (flagged `partial`, with the stage
+        listed in `skipped_stages`). Without a journal score there is nothing
+        to return, so a late journal extraction raises DeadlineExceeded.
         
         Args:
             text: Journal entry text to analyze
+            mode: One of "auto", "llm" or "lexicon"
+            incremental: Reuse per-sentence features (None uses the service default)
+            deadline_at: Absolute time.monotonic() deadline for the request
         
         Returns:
             BurnoutRiskIndex with scores and analysis
+
+        Raises:
+            DeadlineExceeded: The journal extraction could not finish in time (llm mode)
         """
-        if not self.use_langextract:
+        mode = mode or self.default_mode
+        if mode not in ANALYSIS_MODES:
+            raise ValueError(f"Unknown analysis mode: {mode}")
+        if mode == MODE_LLM and not self.use_langextract:
             raise RuntimeError("LangExtract is required (missing dependency or API key).")
+        use_llm = mode != MODE_LEXICON and self.use_langextract
+        if incremental is None:
+            incremental = self.incremental
+
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
 
         # Step 1: Preprocessing
         cleaned_text, sentences = preprocess_text(text)
-        text_length = len(cleaned_text)
+        coach_text = self._prepare_coach_text(coach_transcript, coach_transcript_embedded)
+        timings["preprocess"] = (time.perf_counter() - started) * 1000.0
+
+        cache_key = None
+        if use_llm:
+            content_key = self._cache_key(cleaned_text, coach_transcript, coach_transcript_embedded, incremental)
+            if self.cache is not None:
+                cache_key = content_key
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    timings["total"] = (time.perf_counter() - started) * 1000.0
+                    return BurnoutRiskIndex.model_validate_json(cached).model_copy(
+                        update={"cache_hit": True, "timings_ms": timings}
+                    )
+
+        def run() -> BurnoutRiskIndex:
+            with deadline_scope(deadline_at):
+                return self._analyze_uncached(
+                    cleaned_text=cleaned_text,
+                    sentences=sentences,
+                    coach_text=coach_text,
+                    mode=mode,
+                    use_llm=use_llm,
+                    incremental=incremental,
+                    started=started,
+                    timings=timings,
+                    cache_key=cache_key,
+                )
+
+        if not use_llm:
+            return run()
+
+        # Identical requests already in flight wait for the leader's
+        # LangExtract calls instead of starting their own.
+        flight_key = AnalysisCache.make_key("flight", content_key, mode, str(bool(incremental)))
+        led = False
+
+        def lead() -> BurnoutRiskIndex:
+            nonlocal led
+            led = True
+            return run()
+
+        try:
+            result, shared = self.single_flight.do(
+                flight_key, lead, timeout=remaining(earliest(deadline_at, current_deadline()))
+            )
+        except DeadlineExceeded:
+            if led:
+                raise
+            # The leader ran out of its own deadline; this caller's may be later.
+            return run()
+        except FuturesTimeoutError as e:
+            raise DeadlineExceeded("Identical in-flight analysis did not finish before the deadline.") from e
+        if shared and (result.partial or result.degraded):
+            # Stages the leader skipped or degraded under its deadline are
+            # re-run under this caller's own.
+            return run()
+        if shared:
+            # Callers attach per-request fields (e.g. cumulative_bri), so
+            # followers get their own copy.
+            return result.model_copy(deep=True, update={"coalesced": True})
+        return result
+
+    def _analyze_uncached(
+        self,
+        *,
+        cleaned_text: str,
+        sentences: List[str],
+        coach_text: Optional[str],
+        mode: str,
+        use_llm: bool,
+        incremental: bool,
+        started: float,
+        timings: Dict[str, float],
+        cache_key: Optional[str],
+    ) -> BurnoutRiskIndex:
+        """Extraction and scoring part of `analyze` for a cache miss."""
+        # Step 2: Feature extraction (journal and coach branches in parallel)
+        # By default do not split into multiple sentences for scoring; analyze the
+        # full text as a single unit so the BRI reflects the whole journal input.
+        # Incremental mode extracts per sentence so unchanged sentences are reused.
+        coach_features: List[BurnoutFeature] = []
+        degraded = False
+        escalated = False
+        segment_stats: Dict[str, int] = {}
+        skipped_stages: List[str] = []
+
+        def extract_journal() -> tuple[List[BurnoutFeature], float]:
+            if incremental:
+                return self._timed_incremental_extract(sentences, segment_stats)
+            return self._timed_extract(cleaned_text, sentences)
+
+        if not use_llm:
+            features, timings["journal_extraction"] = self._timed_lexicon_extract(cleaned_text)
+            if coach_text:
+                coach_features, timings["coach_extraction"] = self._timed_lexicon_extract(coach_text)
+            if mode == MODE_AUTO:
+                # LangExtract is unavailable: only ambiguous local scores are degraded.
+                reason = self.cascade.escalation_reason(features, self._base_score(features, cleaned_text))
+                degraded = reason is not None
+        elif mode == MODE_LLM:
+            coach_future = None
+            if coach_text:
+                coach_future = submit_with_deadline(self.extraction_executor, self._timed_extract, coach_text)
+            try:
+                if current_deadline() is None:
+                    features, timings["journal_extraction"] = extract_journal()
+                else:
+                    # Run on the pool so the request can stop waiting at its deadline.
+                    journal_future = submit_with_deadline(self.extraction_executor, extract_journal)
+                    try:
+                        features, timings["journal_extraction"] = journal_future.result(timeout=remaining())
+                    except (FuturesTimeoutError, DeadlineExceeded) as e:
+                        journal_future.cancel()
+                        if coach_future is not None:
+                            coach_future.cancel()
+                        if isinstance(e, DeadlineExceeded):
+                            raise
+                        raise DeadlineExceeded("Journal extraction did not finish before the request deadline.") from e
+            except CircuitOpenError:
+                # The breaker rejected the call without reaching the model:
+                # serve the lexicon score instead of failing the request.
+                logger.debug("LangExtract circuit is open; using lexicon scores for journal.")
+                if coach_future is not None:
+                    coach_future.cancel()
+                    coach_future = None
+                degraded = True
+                features, timings["journal_extraction"] = self._timed_lexicon_extract(cleaned_text)
+                if coach_text:
+                    coach_features, timings["coach_extraction"] = self._timed_lexicon_extract(coach_text)
+            if coach_future is not None:
+                try:
+                    coach_features, timings["coach_extraction"] = coach_future.result(timeout=remaining())
+                except (FuturesTimeoutError, DeadlineExceeded):
+                    # Serve the journal score without the coach modifier.
+                    coach_future.cancel()
+                    logger.warning("Coach extraction missed the request deadline; skipping the coach modifier.")
+                    skipped_stages.append("coach_modifier")
+                    coach_text = None
+                except CircuitOpenError:
+                    logger.debug("LangExtract circuit is open; using lexicon scores for coach.")
+                    degraded = True
+                    coach_features, timings["coach_extraction"] = self._timed_lexicon_extract(coach_text)
+        else:
+            # Cascade: serve the local lexicon score when it is confident and
+            # only pay for LangExtract when it is ambiguous.
+            local_features, local_ms = self._timed_lexicon_extract(cleaned_text)
+            local_score = self._base_score(local_features, cleaned_text)
+            reason = self.cascade.escalation_reason(local_features, local_score)
+            if reason is None:
+                self.cascade_stats.record_local()
+                features, timings["journal_extraction"] = local_features, local_ms
+                if coach_text:
+                    coach_features, timings["coach_extraction"] = self._timed_lexicon_extract(coach_text)
+                if self.cascade.should_shadow():
+                    # Shadow comparisons are off the request path: no deadline.
+                    self.extraction_executor.submit(self._shadow_compare, cleaned_text, local_score)
+            else:
+                self.cascade_stats.record_escalation(reason)
+                escalated = True
+                deadline_at = self._budget_deadline(started)
+                journal_future = submit_with_deadline(self.extraction_executor, extract_journal, deadline_at=deadline_at)
+                coach_future = None
+                if coach_text:
+                    coach_future = submit_with_deadline(
+                        self.extraction_executor, self._timed_extract, coach_text, deadline_at=deadline_at
+                    )
+
+                journal_branch = self._await_llm_branch(journal_future, deadline_at=deadline_at, branch="journal")
+                if journal_branch is None:
+                    degraded = True
+                    journal_branch = (local_features, local_ms)
+                else:
+                    self.cascade_stats.record_agreement(
+                        tier="escalated",
+                        local_score=local_score,
+                        llm_score=self._base_score(journal_branch[0], cleaned_text),
+                    )
+                features, timings["journal_extraction"] = journal_branch
+
+                if coach_future is not None:
+                    coach_branch = self._await_llm_branch(coach_future, deadline_at=deadline_at, branch="coach")
+                    if coach_branch is None:
+                        degraded = True
+                        coach_branch = self._timed_lexicon_extract(coach_text)
+                    coach_features, timings["coach_extraction"] = coach_branch
+
+        result = self._build_result(
+            features=features,
+            cleaned_text=cleaned_text,
+            sentences=sentences,
+            coach_text=coach_text,
+            coach_features=coach_features,
+            started=started,
+            timings=timings,
+            analysis_mode=MODE_LLM if (mode == MODE_LLM or escalated) and not degraded else MODE_LEXICON,
+            degraded=degraded,
+            escalated=escalated,
+            segment_stats=None if degraded else segment_stats,
+            skipped_stages=skipped_stages,
+        )
+
+        # Only full LLM results are cached; local, degraded and partial ones
+        # are cheap to recompute or should be retried.
+        if cache_key is not None and result.analysis_mode == MODE_LLM and not result.partial:
+            self.cache.set(cache_key, result.model_dump_json())
         
-        # Step 2: Feature extraction
-        # Do not split into multiple sentences for scoring; analyze the full text
-        # as a single unit so the BRI reflects the whole journal input.
-        features = self._extract_features_with_langextract(cleaned_text, [cleaned_text])
+        return result
+
+    def _build_result(
+        self,
+        *,
+        features: List[BurnoutFeature],
+        cleaned_text: str,
+        sentences: List[str],
+        coach_text: Optional[str],
+        coach_features: List[BurnoutFeature],
+        started: float,
+        timings: Dict[str, float],
+        analysis_mode: str = MODE_LLM,
+        degraded: bool = False,
+        escalated: bool = False,
+        segment_stats: Optional[Dict[str, int]] = None,
+        skipped_stages: Optional[List[str]] = None,
+    ) -> BurnoutRiskIndex:
+        """Score extracted features into a BurnoutRiskIndex (steps 3-5 of analyze)."""
+        text_length = len(cleaned_text)
+
         # Step 3: Calculate MBI scores using LangExtract-provided dimension scores
         mbi_scores = self._calculate_mbi_scores(features, cleaned_text, text_length)
         # Step 4: Calculate overall BRI from MBI dimension scores
         base_score = self._calculate_overall_score(mbi_scores, text_length)
-        coach_modifier, coach_used = self._compute_coach_modifier(
-            base_score=base_score,
-            coach_transcript=coach_transcript,
-            coach_transcript_embedded=coach_transcript_embedded,
-        )
+        coach_modifier, coach_used = 0.0, False
+        if coach_text:
+            coach_modifier, coach_used = self._coach_modifier_from_features(
+                base_score=base_score,
+                coach_features=coach_features,
+                cleaned_text=coach_text,
+            )
         overall_score = float(max(0.0, min(100.0, base_score + coach_modifier)))
         # Step 5: Determine risk level
         if overall_score < 25:
@@ -464,8 +1096,9 @@ class BurnoutAnalysisService:
         else:
             risk_level = "severe"
         
-        # Create result
-        result = BurnoutRiskIndex(
+        timings["total"] = (time.perf_counter() - started) * 1000.0
+
+        return BurnoutRiskIndex(
             base_score=base_score,
             overall_score=overall_score,
             coach_modifier=coach_modifier,
@@ -476,10 +1109,396 @@ class BurnoutAnalysisService:
             features=features,
             text_length=text_length,
             sentence_count=len(sentences),
-            risk_level=risk_level
+            risk_level=risk_level,
+            timings_ms=timings,
+            analysis_mode=analysis_mode,
+            degraded=degraded,
+            escalated=escalated,
+            segments_reused=(segment_stats or {}).get("reused", 0),
+            segments_extracted=(segment_stats or {}).get("extracted", 0),
+            partial=bool(skipped_stages),
+            skipped_stages=list(skipped_stages or []),
+        )
+
+    def analyze_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+        mode: Optional[str] = None,
+    ) -> List[BurnoutRiskIndex]:
+        """
+        Analyze several independent journal texts in one pass.
+
+        Cached texts are served directly; the remaining texts are sent to
+        LangExtract together in multi-document mode, long texts split into
+        chunks as in `analyze`. Results are returned in input order so
+        callers can fold cumulative BRI chronologically.
+        "lexicon" mode scores every text locally; "auto" cascades per text and
+        sends only ambiguous texts to LangExtract, keeping the local score
+        (flagged degraded) if LangExtract is unavailable or the batch call fails.
+        """
+        mode = mode or self.default_mode
+        if mode not in ANALYSIS_MODES:
+            raise ValueError(f"Unknown analysis mode: {mode}")
+        if mode == MODE_LLM and not self.use_langextract:
+            raise RuntimeError("LangExtract is required (missing dependency or API key).")
+        use_llm = mode != MODE_LEXICON and self.use_langextract
+
+        started = time.perf_counter()
+        prepared = [preprocess_text(text) for text in texts]
+        preprocess_ms = (time.perf_counter() - started) * 1000.0
+
+        results: List[Optional[BurnoutRiskIndex]] = [None] * len(prepared)
+        cache_keys: List[Optional[str]] = [None] * len(prepared)
+        pending: List[int] = []
+        for index, (cleaned_text, _sentences) in enumerate(prepared):
+            if self.cache is not None and use_llm:
+                cache_keys[index] = self._cache_key(cleaned_text, None, False, False)
+                cached = self.cache.get(cache_keys[index])
+                if cached is not None:
+                    results[index] = BurnoutRiskIndex.model_validate_json(cached).model_copy(
+                        update={"cache_hit": True, "timings_ms": {"preprocess": preprocess_ms}}
+                    )
+                    continue
+            pending.append(index)
+
+        extraction_started = time.perf_counter()
+        # Per pending text: features, whether it was escalated, whether it degraded.
+        features_by_index: Dict[int, List[BurnoutFeature]] = {}
+        llm_indexes: List[int] = []
+        escalated_indexes = set()
+        degraded_indexes = set()
+        if mode == MODE_LLM:
+            llm_indexes = list(pending)
+        else:
+            for index in pending:
+                cleaned_text, sentences = prepared[index]
+                local_features = self.lexicon_scorer.extract_features(cleaned_text, sentences)
+                features_by_index[index] = local_features
+                if mode == MODE_LEXICON:
+                    continue
+                reason = self.cascade.escalation_reason(
+                    local_features, self._base_score(local_features, cleaned_text)
+                )
+                if reason is None:
+                    self.cascade_stats.record_local()
+                elif not use_llm:
+                    degraded_indexes.add(index)
+                else:
+                    self.cascade_stats.record_escalation(reason)
+                    escalated_indexes.add(index)
+                    llm_indexes.append(index)
+
+        if llm_indexes:
+            chunk_lists = [self._chunks(*prepared[index]) for index in llm_indexes]
+            try:
+                per_chunk = self._extract_features_batch(
+                    [chunk for chunks in chunk_lists for chunk in chunks],
+                    max_workers=max_workers,
+                )
+            except Exception as e:
+                if mode == MODE_LLM and not isinstance(e, CircuitOpenError):
+                    raise
+                if isinstance(e, CircuitOpenError):
+                    logger.debug("LangExtract circuit is open; using lexicon scores for the batch.")
+                else:
+                    logger.exception("LangExtract batch extraction failed; using lexicon scores.")
+                degraded_indexes.update(llm_indexes)
+                for index in llm_indexes:
+                    if index not in features_by_index:
+                        features_by_index[index] = self.lexicon_scorer.extract_features(*prepared[index])
+            else:
+                extracted: List[List[BurnoutFeature]] = []
+                position = 0
+                for chunks in chunk_lists:
+                    chunk_features = per_chunk[position:position + len(chunks)]
+                    position += len(chunks)
+                    if len(chunks) == 1:
+                        extracted.append(chunk_features[0])
+                    else:
+                        extracted.append(self._weight_chunk_features(chunks, chunk_features))
+                for index, features in zip(llm_indexes, extracted):
+                    if index in escalated_indexes:
+                        cleaned_text = prepared[index][0]
+                        self.cascade_stats.record_agreement(
+                            tier="escalated",
+                            local_score=self._base_score(features_by_index[index], cleaned_text),
+                            llm_score=self._base_score(features, cleaned_text),
+                        )
+                    features_by_index[index] = features
+        extraction_ms = (time.perf_counter() - extraction_started) * 1000.0
+
+        for index in pending:
+            cleaned_text, sentences = prepared[index]
+            degraded = index in degraded_indexes
+            used_llm = (mode == MODE_LLM or index in escalated_indexes) and not degraded
+            result = self._build_result(
+                features=features_by_index[index],
+                cleaned_text=cleaned_text,
+                sentences=sentences,
+                coach_text=None,
+                coach_features=[],
+                started=started,
+                timings={"preprocess": preprocess_ms, "journal_extraction": extraction_ms},
+                analysis_mode=MODE_LLM if used_llm else MODE_LEXICON,
+                degraded=degraded,
+                escalated=index in escalated_indexes,
+            )
+            if cache_keys[index] is not None and used_llm:
+                self.cache.set(cache_keys[index], result.model_dump_json())
+            results[index] = result
+
+        return results
+
+    def _provisional_event(
+        self,
+        features: List[BurnoutFeature],
+        cleaned_text: str,
+        *,
+        source: str,
+        chunks_done: int,
+        chunks_total: int,
+    ) -> Dict[str, Any]:
+        """Stream event with MBI dimension scores from the features seen so far."""
+        mbi_scores = self._calculate_mbi_scores(features, cleaned_text, len(cleaned_text))
+        return {
+            "event": "provisional",
+            "data": {
+                "source": source,
+                "chunks_done": chunks_done,
+                "chunks_total": chunks_total,
+                "base_score": self._calculate_overall_score(mbi_scores, len(cleaned_text)),
+                "emotional_exhaustion": mbi_scores[MBIDimension.EMOTIONAL_EXHAUSTION].normalized_score,
+                "depersonalization": mbi_scores[MBIDimension.DEPERSONALIZATION].normalized_score,
+                "personal_accomplishment": mbi_scores[MBIDimension.PERSONAL_ACCOMPLISHMENT].normalized_score,
+            },
+        }
+
+    def analyze_stream(
+        self,
+        text: str,
+        *,
+        coach_transcript: Optional[str] = None,
+        coach_transcript_embedded: bool = False,
+        mode: Optional[str] = None,
+        deadline_at: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Analyze text and yield progress events as they become available.
+
+        Events are dicts with "event" and "data" keys, in this order:
+        "preprocessed" (text and chunk counts), "provisional" scores from the
+        lexicon scorer, then for LLM analyses one "features" and one
+        "provisional" event per chunk as each chunk's extraction completes,
+        and finally "result" with the BurnoutRiskIndex. Routing, caching and
+        fallbacks match `analyze`, including `deadline_at`; an llm-mode
+        failure raises after the events already yielded.
+        """
+        mode = mode or self.default_mode
+        if mode not in ANALYSIS_MODES:
+            raise ValueError(f"Unknown analysis mode: {mode}")
+        if mode == MODE_LLM and not self.use_langextract:
+            raise RuntimeError("LangExtract is required (missing dependency or API key).")
+        use_llm = mode != MODE_LEXICON and self.use_langextract
+
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+        cleaned_text, sentences = preprocess_text(text)
+        coach_text = self._prepare_coach_text(coach_transcript, coach_transcript_embedded)
+        chunks = [cleaned_text]
+        if self.chunk_token_budget:
+            chunks = chunk_text(cleaned_text, self.chunk_token_budget, sentences) or [cleaned_text]
+        timings["preprocess"] = (time.perf_counter() - started) * 1000.0
+        yield {
+            "event": "preprocessed",
+            "data": {
+                "text_length": len(cleaned_text),
+                "sentence_count": len(sentences),
+                "chunk_count": len(chunks),
+                "coach_transcript": bool(coach_text),
+            },
+        }
+
+        cache_key = None
+        if self.cache is not None and use_llm:
+            cache_key = self._cache_key(cleaned_text, coach_transcript, coach_transcript_embedded, False)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                timings["total"] = (time.perf_counter() - started) * 1000.0
+                result = BurnoutRiskIndex.model_validate_json(cached).model_copy(
+                    update={"cache_hit": True, "timings_ms": timings}
+                )
+                yield {"event": "result", "data": result}
+                return
+
+        local_features, local_ms = self._timed_lexicon_extract(cleaned_text)
+        local_score = self._base_score(local_features, cleaned_text)
+        yield self._provisional_event(
+            local_features, cleaned_text, source=MODE_LEXICON, chunks_done=0, chunks_total=len(chunks)
+        )
+
+        reason = None
+        if mode == MODE_AUTO:
+            reason = self.cascade.escalation_reason(local_features, local_score)
+        use_llm_path = mode == MODE_LLM or (use_llm and reason is not None)
+        if mode == MODE_AUTO and use_llm:
+            if reason is None:
+                self.cascade_stats.record_local()
+            else:
+                self.cascade_stats.record_escalation(reason)
+
+        coach_features: List[BurnoutFeature] = []
+        degraded = mode == MODE_AUTO and not use_llm and reason is not None
+        if not use_llm_path:
+            timings["journal_extraction"] = local_ms
+            if coach_text:
+                coach_features, timings["coach_extraction"] = self._timed_lexicon_extract(coach_text)
+            result = self._build_result(
+                features=local_features,
+                cleaned_text=cleaned_text,
+                sentences=sentences,
+                coach_text=coach_text,
+                coach_features=coach_features,
+                started=started,
+                timings=timings,
+                analysis_mode=MODE_LEXICON,
+                degraded=degraded,
+            )
+            yield {"event": "result", "data": result}
+            return
+
+        # A generator cannot hold a context-local deadline across yields, so
+        # the deadline is passed to the worker threads explicitly.
+        with deadline_scope(deadline_at):
+            branch_deadline = self._budget_deadline(started) if mode == MODE_AUTO else current_deadline()
+        coach_future = None
+        if coach_text:
+            coach_future = submit_with_deadline(
+                self.extraction_executor, self._timed_extract, coach_text, deadline_at=branch_deadline
+            )
+        chunk_futures = {
+            submit_with_deadline(
+                self.extraction_executor,
+                self._extract_features_with_langextract,
+                chunk,
+                [chunk],
+                deadline_at=branch_deadline,
+            ): index
+            for index, chunk in enumerate(chunks)
+        }
+        per_chunk: List[Optional[List[BurnoutFeature]]] = [None] * len(chunks)
+        extraction_started = time.perf_counter()
+        skipped_stages: List[str] = []
+        try:
+            timeout = remaining(branch_deadline) if branch_deadline is not None else None
+            for done, future in enumerate(as_completed(chunk_futures, timeout=timeout), start=1):
+                index = chunk_futures[future]
+                per_chunk[index] = future.result()
+                yield {
+                    "event": "features",
+                    "data": {
+                        "chunk": index,
+                        "features": [feature.model_dump(mode="json") for feature in per_chunk[index]],
+                    },
+                }
+                yield self._provisional_event(
+                    self._weight_chunk_features(chunks, per_chunk) if len(chunks) > 1 else per_chunk[index],
+                    cleaned_text,
+                    source=MODE_LLM,
+                    chunks_done=done,
+                    chunks_total=len(chunks),
+                )
+            features = self._weight_chunk_features(chunks, per_chunk) if len(chunks) > 1 else per_chunk[0]
+        except Exception as e:
+            for future in chunk_futures:
+                future.cancel()
+            if mode == MODE_LLM and not isinstance(e, CircuitOpenError):
+                if coach_future is not None:
+                    coach_future.cancel()
+                if isinstance(e, FuturesTimeoutError) and not isinstance(e, DeadlineExceeded):
+                    raise DeadlineExceeded("Journal extraction did not finish before the request deadline.") from e
+                raise
+            if isinstance(e, FuturesTimeoutError):
+                logger.warning("LangExtract streaming extraction exceeded its latency budget; using lexicon scores.")
+            elif not isinstance(e, CircuitOpenError):
+                logger.exception("LangExtract streaming extraction failed; using lexicon scores.")
+            degraded = True
+            features = local_features
+        else:
+            if mode == MODE_AUTO:
+                self.cascade_stats.record_agreement(
+                    tier="escalated",
+                    local_score=local_score,
+                    llm_score=self._base_score(features, cleaned_text),
+                )
+        timings["journal_extraction"] = (time.perf_counter() - extraction_started) * 1000.0
+
+        if coach_future is not None:
+            if mode == MODE_LLM:
+                try:
+                    coach_features, timings["coach_extraction"] = coach_future.result(
+                        timeout=remaining(branch_deadline) if branch_deadline is not None else None
+                    )
+                except (FuturesTimeoutError, DeadlineExceeded):
+                    coach_future.cancel()
+                    logger.warning("Coach extraction missed the request deadline; skipping the coach modifier.")
+                    skipped_stages.append("coach_modifier")
+                    coach_text = None
+                except CircuitOpenError:
+                    logger.debug("LangExtract circuit is open; using lexicon scores for coach.")
+                    degraded = True
+                    coach_features, timings["coach_extraction"] = self._timed_lexicon_extract(coach_text)
+            else:
+                coach_branch = self._await_llm_branch(coach_future, deadline_at=branch_deadline, branch="coach")
+                if coach_branch is None:
+                    degraded = True
+                    coach_branch = self._timed_lexicon_extract(coach_text)
+                coach_features, timings["coach_extraction"] = coach_branch
+
+        result = self._build_result(
+            features=features,
+            cleaned_text=cleaned_text,
+            sentences=sentences,
+            coach_text=coach_text,
+            coach_features=coach_features,
+            started=started,
+            timings=timings,
+            analysis_mode=MODE_LEXICON if degraded else MODE_LLM,
+            degraded=degraded,
+            escalated=mode == MODE_AUTO,
+            skipped_stages=skipped_stages,
+        )
+        if cache_key is not None and result.analysis_mode == MODE_LLM and not result.partial:
+            self.cache.set(cache_key, result.model_dump_json())
+        yield {"event": "result", "data": result}
+
+    async def analyze_async(
+        self,
+        text: str,
+        *,
+        coach_transcript: Optional[str] = None,
+        coach_transcript_embedded: bool = False,
+        mode: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        deadline_at: Optional[float] = None,
+    ) -> BurnoutRiskIndex:
+        """
+        Awaitable variant of `analyze` for use inside the event loop.
+
+        The blocking preprocessing and LangExtract calls run on the service's
+        bounded executor, so slow extractions do not stall other requests.
+        """
+        return await run_blocking(
+            self.executor,
+            self.analyze,
+            text,
+            coach_transcript=coach_transcript,
+            coach_transcript_embedded=coach_transcript_embedded,
+            mode=mode,
+            incremental=incremental,
+            deadline_at=deadline_at,
         )
-        
-        return result
 
     def analyze_journal_inputs(self, journal_inputs: Sequence[str]) -> BurnoutRiskIndex:
         """
@@ -496,6 +1515,7 @@ class BurnoutAnalysisService:
         *,
         previous_cumulative_bri: Optional[float],
         new_final_bri: float,
+        alpha: float = CUMULATIVE_BRI_ALPHA,
     ) -> float:
         """
         Compute a new cumulative BRI.
@@ -511,11 +1531,43 @@ class BurnoutAnalysisService:
             base = previous_cumulative_bri
 
         # Exponential moving average toward the new final BRI.
-        alpha = 0.35
         ema = (base * (1.0 - alpha)) + (new_final_bri * alpha)
 
         return float(max(0.0, min(100.0, ema)))
 
+    @staticmethod
+    def cumulative_bri_timeline(
+        bri_series: Sequence[float],
+        alphas: Sequence[float] = (CUMULATIVE_BRI_ALPHA,),
+        *,
+        previous_cumulative_bri: Optional[float] = None,
+    ) -> Dict[float, List[float]]:
+        """
+        Recompute a whole cumulative BRI timeline for one or more alphas.
+
+        Equivalent to calling `compute_cumulative_bri` journal by journal,
+        but each alpha's series is folded in a single `accumulate` pass.
+
+        Args:
+            bri_series: Final BRI of each journal, oldest first
+            alphas: Smoothing factors, e.g. a short and a long horizon
+            previous_cumulative_bri: Cumulative BRI before the first journal
+
+        Returns:
+            Cumulative BRI after each journal, per alpha
+        """
+        timelines: Dict[float, List[float]] = {}
+        for alpha in alphas:
+            keep = 1.0 - alpha
+            timelines[alpha] = list(
+                accumulate(
+                    bri_series,
+                    lambda cumulative, bri: float(max(0.0, min(100.0, cumulative * keep + bri * alpha))),
+                    initial=0 if previous_cumulative_bri is None else previous_cumulative_bri,
+                )
+            )[1:]
+        return timelines
+
 #Test run of langextract python -m services.burnout_analysis for testing langextract
 if __name__ == "__main__":
     import os
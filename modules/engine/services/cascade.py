@@ -0,0 +1,106 @@
+"""Cascade routing between the lexicon scorer and LangExtract."""
+from __future__ import annotations
+
+import random
+import threading
+from typing import Dict, List, Optional
+
+from models.burnout import BurnoutFeature, EmotionType
+
+# Escalation reasons reported in metrics.
+REASON_UNCERTAIN = "uncertain_band"
+REASON_MIXED = "mixed_signals"
+REASON_NO_SIGNAL = "no_signal"
+
+
+def risk_level_for(score: float) -> str:
+    """Risk bucket used to compare tiers (same cut-offs as BurnoutRiskIndex)."""
+    if score < 25:
+        return "low"
+    if score < 50:
+        return "moderate"
+    if score < 75:
+        return "high"
+    return "severe"
+
+
+class CascadePolicy:
+    """
+    Decide whether a local lexicon score is confident enough to serve.
+
+    A local score is escalated to LangExtract when it falls inside the
+    [low, high] uncertainty band, when the sentences carry both negative and
+    positive signals, or when the lexicon found nothing to score.
+    """
+
+    def __init__(self, *, low: float = 20.0, high: float = 55.0, shadow_rate: float = 0.0):
+        self.low = low
+        self.high = high
+        # Fraction of confident local decisions also sent to LangExtract in the
+        # background, purely to measure agreement for the non-escalated tier.
+        self.shadow_rate = max(0.0, min(1.0, shadow_rate))
+
+    def escalation_reason(self, features: List[BurnoutFeature], local_score: float) -> Optional[str]:
+        """Return why the local score needs LangExtract, or None to serve it."""
+        if not features:
+            return REASON_NO_SIGNAL
+        emotions = {feature.emotion_type for feature in features}
+        if EmotionType.NEGATIVE in emotions and EmotionType.POSITIVE in emotions:
+            return REASON_MIXED
+        if self.low <= local_score <= self.high:
+            return REASON_UNCERTAIN
+        return None
+
+    def should_shadow(self) -> bool:
+        """Whether a confident local decision should also be scored by LangExtract."""
+        return self.shadow_rate > 0 and random.random() < self.shadow_rate
+
+
+class CascadeStats:
+    """Thread-safe counters for escalation rate and tier agreement."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.local = 0
+        self.escalated = 0
+        self.reasons: Dict[str, int] = {}
+        self.compared: Dict[str, int] = {"escalated": 0, "shadow": 0}
+        self.level_agreements: Dict[str, int] = {"escalated": 0, "shadow": 0}
+        self.abs_diff_sum: Dict[str, float] = {"escalated": 0.0, "shadow": 0.0}
+
+    def record_local(self) -> None:
+        with self._lock:
+            self.local += 1
+
+    def record_escalation(self, reason: str) -> None:
+        with self._lock:
+            self.escalated += 1
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+    def record_agreement(self, *, tier: str, local_score: float, llm_score: float) -> None:
+        """Compare the lexicon and LangExtract base scores for the same text."""
+        with self._lock:
+            self.compared[tier] += 1
+            self.abs_diff_sum[tier] += abs(local_score - llm_score)
+            if risk_level_for(local_score) == risk_level_for(llm_score):
+                self.level_agreements[tier] += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        """Return counters plus derived escalation and agreement rates."""
+        with self._lock:
+            routed = self.local + self.escalated
+            agreement = {}
+            for tier, compared in self.compared.items():
+                agreement[tier] = {
+                    "compared": compared,
+                    "risk_level_agreement": (self.level_agreements[tier] / compared) if compared else None,
+                    "mean_abs_score_diff": (self.abs_diff_sum[tier] / compared) if compared else None,
+                }
+            return {
+                "routed": routed,
+                "local": self.local,
+                "escalated": self.escalated,
+                "escalation_rate": (self.escalated / routed) if routed else 0.0,
+                "escalation_reasons": dict(self.reasons),
+                "agreement": agreement,
+            }
@@ -0,0 +1,99 @@
+"""Split long journal text into token-budgeted chunks on sentence boundaries."""
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+from services.preprocessing import segment_sentences
+
+# Rough English average; good enough to keep requests well inside model limits.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of `text`."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _sentence_starts(text: str, sentences: Sequence[str]) -> List[int]:
+    """Offsets in `text` where each located sentence begins, in order."""
+    starts: List[int] = []
+    cursor = 0
+    for sentence in sentences:
+        index = text.find(sentence, cursor)
+        if index < 0:
+            continue
+        starts.append(index)
+        cursor = index + len(sentence)
+    return starts
+
+
+def _split_oversized(piece: str, max_chars: int) -> List[str]:
+    """Split a single over-budget sentence on whitespace."""
+    chunks: List[str] = []
+    current = ""
+    for word in piece.split():
+        candidate = f"{current} {word}" if current else word
+        if current and len(candidate) > max_chars:
+            chunks.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def chunk_text(
+    text: str,
+    max_tokens: int,
+    sentences: Optional[Sequence[str]] = None,
+) -> List[str]:
+    """
+    Split `text` into chunks of at most `max_tokens` estimated tokens.
+
+    Chunks end on sentence boundaries from segment_sentences and are slices
+    of the original text, so punctuation is preserved. A single sentence
+    longer than the budget is split on whitespace.
+
+    Args:
+        text: Cleaned journal text
+        max_tokens: Token budget per chunk
+        sentences: Sentences of `text` if already segmented
+
+    Returns:
+        Non-empty chunks in text order (a single chunk if `text` fits)
+    """
+    text = text.strip()
+    if not text:
+        return []
+    max_chars = max(1, max_tokens) * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return [text]
+
+    if sentences is None:
+        sentences = segment_sentences(text)
+    starts = _sentence_starts(text, sentences) or [0]
+    if starts[0] != 0:
+        starts.insert(0, 0)
+    pieces = [text[start:end].strip() for start, end in zip(starts, starts[1:] + [len(text)])]
+
+    chunks: List[str] = []
+    current = ""
+    for piece in pieces:
+        if not piece:
+            continue
+        if len(piece) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.extend(_split_oversized(piece, max_chars))
+            continue
+        candidate = f"{current} {piece}" if current else piece
+        if current and len(candidate) > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
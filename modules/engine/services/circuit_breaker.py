@@ -0,0 +1,94 @@
+"""Circuit breaker that stops calling a failing or slow dependency."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Optional
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the dependency while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive failures or slow calls.
+
+    While open, calls are rejected immediately. After `reset_timeout`
+    seconds the next call is let through as a probe (half-open): success
+    closes the circuit, failure re-opens it for another `reset_timeout`.
+    Only one probe is in flight at a time.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        slow_call_seconds: Optional[float] = None,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.slow_call_seconds = slow_call_seconds
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Whether a call may go to the dependency now (may start a probe)."""
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return True
+            if self.state == STATE_OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = STATE_HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == STATE_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self, latency: float) -> None:
+        """Record a completed call; calls slower than `slow_call_seconds` count as failures."""
+        if self.slow_call_seconds is not None and latency > self.slow_call_seconds:
+            self.record_failure()
+            return
+        with self._lock:
+            self.consecutive_failures = 0
+            self.state = STATE_CLOSED
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold or on a failed probe."""
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == STATE_HALF_OPEN or (
+                self.state == STATE_CLOSED and self.consecutive_failures >= self.failure_threshold
+            ):
+                self.state = STATE_OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+                self.trips += 1
+
+    def release_probe(self) -> None:
+        """Record a call that says nothing about the dependency's health (e.g. it ran out of time before being sent)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, object]:
+        """State and counters for monitoring."""
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,86 @@
+"""Per-request deadlines carried through the analysis path."""
+from __future__ import annotations
+
+import contextvars
+import time
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Absolute time.monotonic() deadline of the request being served, if any.
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("analysis_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when work cannot finish (or start) before the request deadline."""
+
+
+def deadline_after_ms(budget_ms: Optional[float]) -> Optional[float]:
+    """Absolute deadline `budget_ms` milliseconds from now (None for no budget)."""
+    if budget_ms is None or budget_ms <= 0:
+        return None
+    return time.monotonic() + budget_ms / 1000.0
+
+
+def earliest(*deadlines: Optional[float]) -> Optional[float]:
+    """The tightest of several optional deadlines."""
+    present = [deadline for deadline in deadlines if deadline is not None]
+    return min(present) if present else None
+
+
+def current_deadline() -> Optional[float]:
+    """Deadline of the request running in this context."""
+    return _DEADLINE.get()
+
+
+def remaining(deadline_at: Optional[float] = None) -> Optional[float]:
+    """Seconds left before `deadline_at` (default: the current deadline), never negative."""
+    if deadline_at is None:
+        deadline_at = _DEADLINE.get()
+    if deadline_at is None:
+        return None
+    return max(0.0, deadline_at - time.monotonic())
+
+
+def expired(deadline_at: Optional[float] = None) -> bool:
+    """Whether the given (or current) deadline has passed."""
+    left = remaining(deadline_at)
+    return left is not None and left <= 0.0
+
+
+@contextmanager
+def deadline_scope(deadline_at: Optional[float]) -> Iterator[Optional[float]]:
+    """Apply `deadline_at` (tightened by any enclosing deadline) within the block."""
+    effective = earliest(deadline_at, _DEADLINE.get())
+    token = _DEADLINE.set(effective)
+    try:
+        yield effective
+    finally:
+        _DEADLINE.reset(token)
+
+
+def _run_with_deadline(deadline_at: Optional[float], func: Callable[..., T], args, kwargs) -> T:
+    with deadline_scope(deadline_at):
+        return func(*args, **kwargs)
+
+
+def submit_with_deadline(
+    executor: Executor,
+    func: Callable[..., T],
+    *args,
+    deadline_at: Optional[float] = None,
+    **kwargs,
+) -> Future:
+    """
+    Submit `func` so it runs under `deadline_at` (default: the caller's deadline).
+
+    The worker runs in a copy of the caller's context, so other request
+    context (e.g. the scheduling priority) follows the work as well.
+    """
+    if deadline_at is None:
+        deadline_at = _DEADLINE.get()
+    context = contextvars.copy_context()
+    return executor.submit(context.run, _run_with_deadline, deadline_at, func, args, kwargs)
@@ -0,0 +1,24 @@
+"""Bounded thread pools for blocking analysis work."""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Executor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+async def run_blocking(executor: Executor, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking callable on `executor` without stalling the event loop.
+
+    The executor's worker count bounds how many blocking calls (LangExtract,
+    Firestore) can be in flight at once; excess calls queue instead of
+    spawning unbounded threads. Like asyncio.to_thread, the call runs in a
+    copy of the caller's context.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, functools.partial(context.run, func, *args, **kwargs))
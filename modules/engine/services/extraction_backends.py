@@ -0,0 +1,298 @@
+"""Pluggable extraction backends: live LangExtract, recorder and replayer."""
+from __future__ import annotations
+
+import json
+import math
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import langextract as lx
+    LANGEXTRACT_AVAILABLE = True
+except ImportError:
+    LANGEXTRACT_AVAILABLE = False
+
+# Backend names accepted by build_backend (ANALYSIS_BACKEND setting).
+BACKEND_LANGEXTRACT = "langextract"
+BACKEND_RECORD = "record"
+BACKEND_REPLAY = "replay"
+BACKENDS = (BACKEND_LANGEXTRACT, BACKEND_RECORD, BACKEND_REPLAY)
+
+# Characters per LangExtract model request; longer texts are split by the
+# library into several requests.
+LANGEXTRACT_MAX_CHAR_BUFFER = 1000
+
+# One extraction's attributes, as returned by LangExtract.
+Attributes = Dict[str, Any]
+
+# Recorded extractions are keyed by (model_id, prompt_version, text), so a
+# model or prompt change never replays attributes produced by the old one.
+RecordKey = Tuple[str, str, str]
+
+
+class ExtractionBackend(ABC):
+    """
+    Turns texts into per-text lists of extraction attribute dicts.
+
+    BurnoutAnalysisService converts the attributes into BurnoutFeature
+    objects, so backends only deal with the model call itself.
+    """
+
+    @abstractmethod
+    def extract(self, texts: Sequence[str], *, max_workers: int = 1) -> List[List[Attributes]]:
+        """
+        Extract attributes for each text.
+
+        Args:
+            texts: Independent texts to extract from
+            max_workers: Parallel model calls the backend may use
+
+        Returns:
+            One list of attribute dicts per input text, in input order
+        """
+
+    def stats(self) -> Optional[Dict[str, Any]]:
+        """Backend counters for monitoring, if the backend keeps any."""
+        return None
+
+
+def _attributes_from_document(doc) -> List[Attributes]:
+    """Collect attribute dicts from one annotated LangExtract document."""
+    attributes: List[Attributes] = []
+    for extraction in getattr(doc, "extractions", []) or []:
+        attrs = getattr(extraction, "attributes", {}) or {}
+        if isinstance(attrs, dict):
+            attributes.append(dict(attrs))
+    return attributes
+
+
+class LangExtractBackend(ExtractionBackend):
+    """Live Gemini extraction through lx.extract."""
+
+    def __init__(
+        self,
+        *,
+        api_key: str,
+        model_id: str,
+        prompt_description: str,
+        examples: list,
+    ):
+        if not LANGEXTRACT_AVAILABLE:
+            raise RuntimeError("LangExtract is not installed.")
+        self.api_key = api_key
+        self.model_id = model_id
+        self.prompt_description = prompt_description
+        self.examples = examples
+
+    def _run(self, text_or_documents, **kwargs):
+        """Single call site for lx.extract with the burnout prompt and examples."""
+        return lx.extract(
+            text_or_documents=text_or_documents,
+            prompt_description=self.prompt_description,
+            examples=self.examples,
+            model_id=self.model_id,
+            api_key=self.api_key,
+            max_char_buffer=LANGEXTRACT_MAX_CHAR_BUFFER,
+            **kwargs,
+        )
+
+    def extract(self, texts: Sequence[str], *, max_workers: int = 1) -> List[List[Attributes]]:
+        if not texts:
+            return []
+        if len(texts) == 1:
+            result = self._run(texts[0])
+            docs = result if isinstance(result, list) else [result]
+            return [[attrs for doc in docs for attrs in _attributes_from_document(doc)]]
+
+        # Multi-document mode lets LangExtract batch and parallelize the calls.
+        documents = [
+            lx.data.Document(text=text, document_id=f"doc-{index}")
+            for index, text in enumerate(texts)
+        ]
+        result = self._run(
+            documents,
+            max_workers=max(1, max_workers),
+            batch_length=max(1, max_workers),
+        )
+        by_id = {getattr(doc, "document_id", ""): _attributes_from_document(doc) for doc in list(result)}
+        return [by_id.get(f"doc-{index}", []) for index in range(len(texts))]
+
+
+def load_fixture(path: str) -> Dict[RecordKey, List[Attributes]]:
+    """
+    Read a fixture file written by RecordingBackend.
+
+    Records written before fixtures stored the model and prompt version get
+    empty ones, so they are kept on re-recording but never replayed.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        (record.get("model_id", ""), record.get("prompt_version", ""), record["text"]): record["attributes"]
+        for record in data.get("records", [])
+    }
+
+
+class RecordingBackend(ExtractionBackend):
+    """
+    Pass calls through to another backend and save the extracted attributes.
+
+    Records are keyed by model_id, prompt_version and text. The fixture is
+    rewritten atomically after every call, so a recording session can be
+    interrupted at any point and still be replayed.
+    """
+
+    def __init__(self, inner: ExtractionBackend, fixture_path: str, *, model_id: str, prompt_version: str):
+        self.inner = inner
+        self.fixture_path = fixture_path
+        self.model_id = model_id
+        self.prompt_version = prompt_version
+        self._lock = threading.Lock()
+        self._records: Dict[RecordKey, List[Attributes]] = {}
+        if os.path.exists(fixture_path):
+            self._records = load_fixture(fixture_path)
+
+    def extract(self, texts: Sequence[str], *, max_workers: int = 1) -> List[List[Attributes]]:
+        results = self.inner.extract(texts, max_workers=max_workers)
+        with self._lock:
+            for text, attributes in zip(texts, results):
+                self._records[(self.model_id, self.prompt_version, text)] = attributes
+            self._save()
+        return results
+
+    def stats(self) -> Optional[Dict[str, Any]]:
+        return self.inner.stats()
+
+    def _save(self) -> None:
+        records = [
+            {"model_id": model_id, "prompt_version": prompt_version, "text": text, "attributes": attrs}
+            for (model_id, prompt_version, text), attrs in sorted(self._records.items())
+        ]
+        directory = os.path.dirname(os.path.abspath(self.fixture_path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.fixture_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"records": records}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.fixture_path)
+
+
+def lognormal_latency(
+    median_seconds: float,
+    sigma: float = 0.5,
+    seed: Optional[int] = None,
+) -> Callable[[], float]:
+    """Latency sampler with a long right tail, like hosted LLM response times."""
+    rng = random.Random(seed)
+    mu = math.log(max(median_seconds, 1e-6))
+    lock = threading.Lock()
+
+    def sample() -> float:
+        with lock:
+            return rng.lognormvariate(mu, sigma)
+
+    return sample
+
+
+class ReplayBackend(ExtractionBackend):
+    """
+    Serve recorded attributes without network access.
+
+    Only records made with `model_id` and `prompt_version` are served.
+    `latency` (seconds, or a zero-argument sampler such as
+    lognormal_latency) is slept once per call to simulate the model round
+    trip. Unknown texts raise KeyError when `strict`, otherwise they
+    return no extractions.
+    """
+
+    def __init__(
+        self,
+        records: Dict[RecordKey, List[Attributes]],
+        *,
+        model_id: str,
+        prompt_version: str,
+        latency: Union[float, Callable[[], float]] = 0.0,
+        strict: bool = True,
+    ):
+        self.records = records
+        self.model_id = model_id
+        self.prompt_version = prompt_version
+        self.latency = latency
+        self.strict = strict
+
+    @classmethod
+    def from_fixture(cls, fixture_path: str, **kwargs) -> "ReplayBackend":
+        """Build a replayer from a fixture file written by RecordingBackend."""
+        return cls(load_fixture(fixture_path), **kwargs)
+
+    def _sleep(self) -> None:
+        delay = self.latency() if callable(self.latency) else self.latency
+        if delay > 0:
+            time.sleep(delay)
+
+    def extract(self, texts: Sequence[str], *, max_workers: int = 1) -> List[List[Attributes]]:
+        self._sleep()
+        results: List[List[Attributes]] = []
+        for text in texts:
+            key = (self.model_id, self.prompt_version, text)
+            if key in self.records:
+                results.append([dict(attrs) for attrs in self.records[key]])
+            elif self.strict:
+                raise KeyError(f"No recorded extraction for text: {text[:60]!r}")
+            else:
+                results.append([])
+        return results
+
+
+def build_backend(
+    name: str,
+    *,
+    api_key: Optional[str],
+    model_id: str,
+    prompt_version: str,
+    prompt_description: str,
+    examples_factory: Callable[[], list],
+    fixture_path: str = "",
+    replay_latency: float = 0.0,
+    wrap_live: Optional[Callable[[ExtractionBackend], ExtractionBackend]] = None,
+) -> Optional[ExtractionBackend]:
+    """
+    Build the backend selected by `name` (see BACKENDS).
+
+    `examples_factory` is only called for live backends, since building
+    LangExtract examples requires the library. `wrap_live` wraps the live
+    LangExtract backend (e.g. with rate limiting) before recording.
+    Fixtures are recorded and replayed under `model_id` and `prompt_version`.
+
+    Returns None for "langextract" when LangExtract or the API key is
+    missing, which leaves the service in lexicon-only operation.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown extraction backend: {name}")
+    if name == BACKEND_REPLAY:
+        if not fixture_path:
+            raise ValueError("The replay backend requires a fixture path.")
+        return ReplayBackend.from_fixture(
+            fixture_path,
+            model_id=model_id,
+            prompt_version=prompt_version,
+            latency=replay_latency,
+        )
+    if not (LANGEXTRACT_AVAILABLE and api_key):
+        return None
+    live = LangExtractBackend(
+        api_key=api_key,
+        model_id=model_id,
+        prompt_description=prompt_description,
+        examples=examples_factory(),
+    )
+    if wrap_live is not None:
+        live = wrap_live(live)
+    if name == BACKEND_RECORD:
+        if not fixture_path:
+            raise ValueError("The record backend requires a fixture path.")
+        return RecordingBackend(live, fixture_path, model_id=model_id, prompt_version=prompt_version)
+    return live
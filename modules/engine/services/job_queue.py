@@ -0,0 +1,295 @@
+"""Durable background job queue backed by SQLite."""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_STATUSES = (JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JOB_FAILED)
+
+# A job row as returned by JobStore: id, kind, payload, status, result,
+# error, attempts, created_at, updated_at (payload/result decoded).
+Job = Dict[str, Any]
+
+_COLUMNS = "id, kind, payload, status, result, error, attempts, created_at, updated_at"
+
+# Queued jobs, and running jobs whose worker stopped renewing its lease.
+_CLAIMABLE = "(status = ? OR (status = ? AND COALESCE(lease_until, 0) < ?))"
+
+
+class JobStore:
+    """
+    SQLite table of jobs, safe to share between threads and processes.
+
+    Payloads and results are stored as JSON. With a file `db_path` jobs
+    survive restarts; ":memory:" keeps them for the process only. A claimed
+    job is leased to its worker for `lease_seconds` and must be renewed with
+    `heartbeat`; once the lease expires any worker may claim it again, up
+    to `max_attempts` claims in total, after which it is marked failed.
+    """
+
+    def __init__(self, db_path: str = ":memory:", *, lease_seconds: float = 60.0, max_attempts: int = 3):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max(1, max_attempts)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30.0)
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, kind TEXT NOT NULL, payload TEXT NOT NULL, "
+            "status TEXT NOT NULL, result TEXT, error TEXT, "
+            "attempts INTEGER NOT NULL DEFAULT 0, "
+            "created_at REAL NOT NULL, updated_at REAL NOT NULL, "
+            "lease_owner TEXT, lease_until REAL)"
+        )
+        # Tables created before leases existed.
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column, kind in (("lease_owner", "TEXT"), ("lease_until", "REAL")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def _row_to_job(row) -> Job:
+        job_id, kind, payload, status, result, error, attempts, created_at, updated_at = row
+        return {
+            "id": job_id,
+            "kind": kind,
+            "payload": json.loads(payload),
+            "status": status,
+            "result": json.loads(result) if result is not None else None,
+            "error": error,
+            "attempts": attempts,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
+
+    def create(self, kind: str, payload: Dict[str, Any]) -> Job:
+        """Insert a queued job and return it."""
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, payload, status, attempts, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, 0, ?, ?)",
+                (job_id, kind, json.dumps(payload), JOB_QUEUED, now, now),
+            )
+            self._conn.commit()
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return the job with `job_id`, or None."""
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def claim_next(self, owner: str) -> Optional[Job]:
+        """
+        Lease the oldest claimable job to `owner` and return it (None when idle).
+
+        The claim is a conditional UPDATE, so when several processes share
+        the database each job goes to exactly one of them.
+        """
+        with self._lock:
+            now = time.time()
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, lease_owner = NULL, updated_at = ? "
+                "WHERE status = ? AND COALESCE(lease_until, 0) < ? AND attempts >= ?",
+                (
+                    JOB_FAILED,
+                    f"Abandoned after {self.max_attempts} attempts without finishing",
+                    now,
+                    JOB_RUNNING,
+                    now,
+                    self.max_attempts,
+                ),
+            )
+            self._conn.commit()
+            while True:
+                row = self._conn.execute(
+                    f"SELECT id FROM jobs WHERE {_CLAIMABLE} ORDER BY created_at LIMIT 1",
+                    (JOB_QUEUED, JOB_RUNNING, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                cursor = self._conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, lease_owner = ?, "
+                    f"lease_until = ?, updated_at = ? WHERE id = ? AND {_CLAIMABLE}",
+                    (JOB_RUNNING, owner, now + self.lease_seconds, now, row[0], JOB_QUEUED, JOB_RUNNING, now),
+                )
+                self._conn.commit()
+                if cursor.rowcount == 1:
+                    break
+                # Another process claimed it first; try the next job.
+            row = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (row[0],)).fetchone()
+        return self._row_to_job(row)
+
+    def heartbeat(self, job_id: str, owner: str) -> bool:
+        """Extend `owner`'s lease on a running job; False if the lease was lost."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (time.time() + self.lease_seconds, job_id, JOB_RUNNING, owner),
+            )
+            self._conn.commit()
+            return cursor.rowcount == 1
+
+    def _finish(
+        self,
+        job_id: str,
+        status: str,
+        *,
+        result: Optional[Any] = None,
+        error: Optional[str] = None,
+        owner: Optional[str] = None,
+    ) -> bool:
+        query = (
+            "UPDATE jobs SET status = ?, result = ?, error = ?, lease_owner = NULL, updated_at = ? "
+            "WHERE id = ?"
+        )
+        params = [status, None if result is None else json.dumps(result), error, time.time(), job_id]
+        if owner is not None:
+            # A worker whose lease expired must not overwrite the new claimant's outcome.
+            query += " AND status = ? AND lease_owner = ?"
+            params += [JOB_RUNNING, owner]
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            self._conn.commit()
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, result: Any, *, owner: Optional[str] = None) -> bool:
+        """Record a job's result; with `owner`, only while that owner holds the lease."""
+        return self._finish(job_id, JOB_SUCCEEDED, result=result, owner=owner)
+
+    def fail(self, job_id: str, error: str, *, owner: Optional[str] = None) -> bool:
+        """Record why a job failed; with `owner`, only while that owner holds the lease."""
+        return self._finish(job_id, JOB_FAILED, error=error, owner=owner)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update(dict(rows))
+        return counts
+
+
+class JobQueue:
+    """
+    Worker threads processing jobs from a JobStore.
+
+    `handler(kind, payload)` does the work and returns a JSON-serializable
+    result; an exception marks the job failed with its message. While a
+    job runs its lease is renewed in the background, so jobs of a stopped
+    or crashed process are picked up again once their lease expires, while
+    jobs of live workers (e.g. sibling server processes) are left alone.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        handler: Callable[[str, Dict[str, Any]], Any],
+        *,
+        workers: int = 2,
+        poll_interval: float = 1.0,
+    ):
+        self.store = store
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.owner = uuid.uuid4().hex
+        self._wakeup = threading.Condition()
+        self._stopping = False
+        self._threads: List[threading.Thread] = []
+        self._stopped = threading.Event()
+        self._active_lock = threading.Lock()
+        self._active: Set[str] = set()
+
+    def start(self) -> None:
+        """Start the workers and the lease heartbeat."""
+        if self._threads:
+            return
+        self._stopping = False
+        self._stopped.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"analysis-job-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        heartbeat = threading.Thread(target=self._heartbeat, name="analysis-job-heartbeat", daemon=True)
+        heartbeat.start()
+        self._threads.append(heartbeat)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the workers after their current job."""
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify_all()
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, kind: str, payload: Dict[str, Any]) -> Job:
+        """Persist a job and wake a worker; returns the queued job."""
+        job = self.store.create(kind, payload)
+        with self._wakeup:
+            self._wakeup.notify()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return the current state of a job."""
+        return self.store.get(job_id)
+
+    def _heartbeat(self) -> None:
+        interval = max(0.01, self.store.lease_seconds / 3)
+        while not self._stopped.wait(interval):
+            with self._active_lock:
+                active = list(self._active)
+            for job_id in active:
+                if not self.store.heartbeat(job_id, self.owner):
+                    logger.warning("Lost the lease on analysis job %s.", job_id)
+
+    def _work(self) -> None:
+        while True:
+            with self._wakeup:
+                if self._stopping:
+                    return
+            job = self.store.claim_next(self.owner)
+            if job is None:
+                with self._wakeup:
+                    if not self._stopping:
+                        self._wakeup.wait(self.poll_interval)
+                continue
+            if job["attempts"] > 1:
+                logger.info("Resuming analysis job %s (attempt %d).", job["id"], job["attempts"])
+            with self._active_lock:
+                self._active.add(job["id"])
+            try:
+                result = self.handler(job["kind"], job["payload"])
+            except Exception as e:
+                logger.exception("Analysis job %s failed.", job["id"])
+                self.store.fail(job["id"], str(e) or type(e).__name__, owner=self.owner)
+            else:
+                self.store.complete(job["id"], result, owner=self.owner)
+            finally:
+                with self._active_lock:
+                    self._active.discard(job["id"])
+
+    def stats(self) -> Dict[str, Any]:
+        """Jobs per status and worker count."""
+        with self._active_lock:
+            running = len(self._active)
+        return {"workers": self.workers if self._threads else 0, "running": running, "jobs": self.store.counts()}
@@ -0,0 +1,144 @@
+"""Compiled matcher over the MBI, stress, cynical and protective lexicons."""
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from services.mbi_dictionary import (
+    MBI_TERMS,
+    STRESS_PATTERNS,
+    CYNICAL_PATTERNS,
+    PROTECTIVE_TERMS,
+)
+
+# Category names for the non-MBI lexicons; MBI categories use MBIDimension values.
+STRESS = "stress"
+CYNICAL = "cynical"
+PROTECTIVE = "protective"
+
+
+def normalize_term(term: str) -> str:
+    """Canonical form used to map a matched span back to its lexicon term."""
+    # Preprocessing strips apostrophes ("don't" -> "dont"), so treat them as optional.
+    return " ".join(term.lower().replace("'", "").split())
+
+
+class LexiconSpan(NamedTuple):
+    """One lexicon hit in the scanned text."""
+    start: int
+    end: int
+    term: str
+    categories: Tuple[str, ...]
+
+
+class LexiconMatch(NamedTuple):
+    """Per-category hit counts and character spans for one text."""
+    counts: Dict[str, int]
+    spans: List[LexiconSpan]
+
+    def distinct_terms(self, category: str) -> set:
+        """Distinct lexicon terms matched for `category`."""
+        return {span.term for span in self.spans if category in span.categories}
+
+
+class _TrieNode:
+    __slots__ = ("children", "terminal")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.terminal = False
+
+
+def _char_pattern(char: str) -> str:
+    if char == " ":
+        return r"\s+"
+    if char == "'":
+        return "'?"
+    return re.escape(char)
+
+
+def _trie_pattern(node: _TrieNode) -> str:
+    """Render a trie as a regex; shared prefixes are matched only once."""
+    branches = [
+        _char_pattern(char) + _trie_pattern(child)
+        for char, child in sorted(node.children.items())
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if node.terminal:
+        # Greedy optional suffix gives leftmost-longest matching.
+        return "(?:" + body + ")?"
+    return body
+
+
+def _compile_terms(terms: Iterable[str]) -> "re.Pattern[str]":
+    """One trie-shaped pattern over `terms`, with word boundaries."""
+    root = _TrieNode()
+    for term in terms:
+        node = root
+        for char in " ".join(term.lower().split()):
+            node = node.children.setdefault(char, _TrieNode())
+        node.terminal = True
+    return re.compile(r"(?<!\w)" + _trie_pattern(root) + r"(?!\w)", flags=re.IGNORECASE)
+
+
+class LexiconMatcher:
+    """
+    Match every lexicon term with one compiled regex per category.
+
+    Each category's terms are compiled into a trie-shaped pattern with word
+    boundaries, so a text is scanned once per category regardless of how
+    many terms there are. Within a category matches are leftmost-longest and
+    non-overlapping ("dont care anymore" is one hit, not also "dont care");
+    categories never hide each other's terms, so "deadline pressure" counts
+    for exhaustion and also contains the stress term "pressure".
+    """
+
+    def __init__(self, lexicons: Dict[str, Iterable[str]]):
+        self.categories = tuple(lexicons.keys())
+        self._patterns: Dict[str, "re.Pattern[str]"] = {}
+        self._terms: Dict[str, set] = {}
+        for category, terms in lexicons.items():
+            terms = [term for term in dict.fromkeys(terms) if normalize_term(term)]
+            self._terms[category] = {normalize_term(term) for term in terms}
+            if terms:
+                self._patterns[category] = _compile_terms(terms)
+
+    def match(self, text: str) -> LexiconMatch:
+        """Return per-category counts and spans for every lexicon hit in `text`."""
+        counts = {category: 0 for category in self.categories}
+        # The same span found by several categories is reported once with all of them.
+        categories_by_span: Dict[Tuple[int, int, str], List[str]] = {}
+        for category, pattern in self._patterns.items():
+            terms = self._terms[category]
+            for found in pattern.finditer(text):
+                term = normalize_term(found.group(0))
+                if term not in terms:
+                    continue
+                counts[category] += 1
+                categories_by_span.setdefault((found.start(), found.end(), term), []).append(category)
+        spans = [
+            LexiconSpan(start, end, term, tuple(categories))
+            for (start, end, term), categories in sorted(categories_by_span.items())
+        ]
+        return LexiconMatch(counts=counts, spans=spans)
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Return only the per-category hit counts for `text`."""
+        return self.match(text).counts
+
+
+def default_lexicons() -> Dict[str, List[str]]:
+    """All lexicons from services.mbi_dictionary keyed by category."""
+    lexicons: Dict[str, List[str]] = {
+        dimension.value: list(terms) for dimension, terms in MBI_TERMS.items()
+    }
+    lexicons[STRESS] = list(STRESS_PATTERNS)
+    lexicons[CYNICAL] = list(CYNICAL_PATTERNS)
+    lexicons[PROTECTIVE] = list(PROTECTIVE_TERMS)
+    return lexicons
+
+
+# Built once at import; matching is thread-safe.
+LEXICON_MATCHER = LexiconMatcher(default_lexicons())
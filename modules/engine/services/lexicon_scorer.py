@@ -0,0 +1,108 @@
+"""Offline lexicon-based burnout feature scorer."""
+from __future__ import annotations
+
+from typing import List, Optional
+
+from models.burnout import BurnoutFeature, EmotionType, MBIDimension
+from services.lexicon_matcher import (
+    LEXICON_MATCHER,
+    LexiconMatcher,
+    CYNICAL,
+    PROTECTIVE,
+    STRESS,
+)
+from services.preprocessing import segment_sentences
+
+EE = MBIDimension.EMOTIONAL_EXHAUSTION.value
+DP = MBIDimension.DEPERSONALIZATION.value
+PA = MBIDimension.PERSONAL_ACCOMPLISHMENT.value
+
+# Confidence reported for lexicon features (LangExtract features report 0.8).
+BASE_CONFIDENCE = 0.4
+MAX_CONFIDENCE = 0.7
+
+
+class LexiconScorer:
+    """
+    Score journal sentences from the MBI dictionaries without calling an LLM.
+
+    Produces the same BurnoutFeature shape as LangExtract (per-sentence EE, DP
+    and PA risk scores on 0-100) so the regular aggregation in
+    BurnoutAnalysisService applies unchanged. Scores are coarser than the LLM
+    path and are meant for degraded mode and bulk recomputation.
+    """
+
+    def __init__(self, matcher: LexiconMatcher = LEXICON_MATCHER):
+        self.matcher = matcher
+
+    def score_sentence(self, sentence: str) -> Optional[BurnoutFeature]:
+        """Return a feature for one sentence, or None when no lexicon term occurs."""
+        counts = self.matcher.counts(sentence)
+        ee_hits = counts[EE]
+        dp_hits = counts[DP]
+        pa_hits = counts[PA]
+        stress_hits = counts[STRESS]
+        cynical_hits = counts[CYNICAL]
+        protective_hits = counts[PROTECTIVE]
+
+        total_hits = ee_hits + dp_hits + pa_hits + stress_hits + cynical_hits + protective_hits
+        if total_hits == 0:
+            return None
+
+        negative_hits = ee_hits + dp_hits + stress_hits + cynical_hits
+        positive_hits = pa_hits + protective_hits
+
+        stress_level = min(1.0, 0.25 * stress_hits + 0.15 * ee_hits)
+
+        ee_score = 0.0
+        if ee_hits or stress_hits:
+            ee_score = 30.0 * ee_hits + 10.0 * stress_hits - 10.0 * protective_hits
+        dp_score = 0.0
+        if dp_hits or cynical_hits:
+            dp_score = 30.0 * dp_hits + 15.0 * cynical_hits
+
+        # PA is a risk score: accomplishment terms mean low risk, while a
+        # negative sentence with no sense of accomplishment means moderate risk.
+        if pa_hits:
+            pa_score = 10.0
+        elif negative_hits:
+            pa_score = 40.0
+        else:
+            pa_score = 0.0
+
+        if negative_hits > positive_hits:
+            emotion = EmotionType.NEGATIVE
+        elif positive_hits > negative_hits:
+            emotion = EmotionType.POSITIVE
+        else:
+            emotion = EmotionType.NEUTRAL
+
+        dimensions: List[MBIDimension] = []
+        if ee_hits:
+            dimensions.append(MBIDimension.EMOTIONAL_EXHAUSTION)
+        if dp_hits:
+            dimensions.append(MBIDimension.DEPERSONALIZATION)
+        if pa_hits:
+            dimensions.append(MBIDimension.PERSONAL_ACCOMPLISHMENT)
+
+        return BurnoutFeature(
+            emotion_type=emotion,
+            stress_level=stress_level,
+            cynical_thoughts=cynical_hits > 0,
+            mbi_dimension=dimensions,
+            confidence=min(MAX_CONFIDENCE, BASE_CONFIDENCE + 0.05 * total_hits),
+            ee_score=max(0.0, min(100.0, ee_score)),
+            dp_score=max(0.0, min(100.0, dp_score)),
+            pa_score=pa_score,
+        )
+
+    def extract_features(self, text: str, sentences: Optional[List[str]] = None) -> List[BurnoutFeature]:
+        """Score every sentence of `text` that contains at least one lexicon term."""
+        if sentences is None:
+            sentences = segment_sentences(text)
+        features: List[BurnoutFeature] = []
+        for sentence in sentences or [text]:
+            feature = self.score_sentence(sentence)
+            if feature is not None:
+                features.append(feature)
+        return features
@@ -115,6 +115,14 @@ CYNICAL_PATTERNS: List[str] = [
     "cynical", "cynicism", "jaded", "disillusioned",
 ]
 
+# Protective / recovery terms (offset burnout signals from the live coach)
+PROTECTIVE_TERMS: List[str] = [
+    "rest", "rested", "recover", "recovering",
+    "support", "supported", "therapy", "friend", "family",
+    "break", "vacation", "sleep", "manageable",
+    "better", "hopeful", "proud", "grateful", "calm",
+]
+
 def get_terms_for_dimension(dimension: MBIDimension) -> List[str]:
     """Get all terms associated with a specific MBI dimension."""
     return MBI_TERMS.get(dimension, [])
@@ -0,0 +1,316 @@
+"""Client-side pacing for model calls: token bucket, AIMD concurrency, retries."""
+from __future__ import annotations
+
+import logging
+import math
+import random
+import re
+import threading
+import time
+from typing import Callable, Dict, Optional, Sequence, TypeVar
+
+from services.deadline import DeadlineExceeded, current_deadline, earliest
+from services.extraction_backends import LANGEXTRACT_MAX_CHAR_BUFFER, ExtractionBackend
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Status codes only count as whole numbers, so e.g. "5000 tokens" is not a 500.
+_THROTTLE_PATTERN = re.compile(r"\b429\b|resource_exhausted|rate limit|quota")
+_TRANSIENT_PATTERN = re.compile(r"\b50[0234]\b|unavailable|timeout|timed out|deadline exceeded")
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    for attr in ("status_code", "code", "status"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """Whether `exc` is a provider rate-limit rejection (HTTP 429 / RESOURCE_EXHAUSTED)."""
+    if _status_code(exc) == 429:
+        return True
+    return _THROTTLE_PATTERN.search(str(exc).lower()) is not None
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Whether retrying `exc` may succeed: throttling, 5xx and timeouts."""
+    if is_throttle_error(exc) or isinstance(exc, TimeoutError):
+        return True
+    code = _status_code(exc)
+    if code is not None and code >= 500:
+        return True
+    return _TRANSIENT_PATTERN.search(str(exc).lower()) is not None
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` calls per second with bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0, *, deadline_at: Optional[float] = None) -> bool:
+        """
+        Block until `tokens` are available; False if that would pass `deadline_at`.
+
+        Costs above `capacity` are charged in capacity-sized installments, so
+        a large call is paced for its full cost rather than one burst.
+        """
+        remaining = float(tokens)
+        if deadline_at is not None:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now + max(0.0, remaining - self._tokens) / self.rate > deadline_at:
+                    return False
+        while remaining > 0:
+            installment = min(remaining, self.capacity)
+            if not self._take(installment, deadline_at=deadline_at):
+                return False
+            remaining -= installment
+        return True
+
+    def _take(self, tokens: float, *, deadline_at: Optional[float]) -> bool:
+        """Wait for at most `capacity` tokens and take them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+            if deadline_at is not None and now + wait > deadline_at:
+                return False
+            time.sleep(wait)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Cap concurrent calls and adapt the cap with AIMD.
+
+    Each successful call under `latency_target` grows the limit additively
+    (about +1 per limit's worth of successes); a throttled or slow call
+    halves it, at most once per `cooldown` seconds so one burst of 429s
+    does not collapse the limit to the minimum.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        latency_target: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.decreases = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self, *, slots: int = 1, deadline_at: Optional[float] = None) -> int:
+        """
+        Wait for `slots` free slots and return how many were taken.
+
+        A call wider than the current limit takes the whole limit. Returns 0
+        if the slots do not free up before `deadline_at`.
+        """
+        with self._condition:
+            while True:
+                taken = max(1, min(slots, int(self.limit)))
+                if self.in_flight + taken <= int(self.limit):
+                    break
+                timeout = None if deadline_at is None else deadline_at - time.monotonic()
+                if timeout is not None and timeout <= 0:
+                    return 0
+                self._condition.wait(timeout)
+            self.in_flight += taken
+            return taken
+
+    def release(self, slots: int = 1, *, latency: float, throttled: bool) -> None:
+        """Free `slots` slots and adapt the limit from the call's outcome."""
+        with self._condition:
+            self.in_flight -= slots
+            slow = self.latency_target is not None and latency > self.latency_target
+            now = time.monotonic()
+            if throttled or slow:
+                if now - self._last_decrease >= self.cooldown:
+                    self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+                    self._last_decrease = now
+                    self.decreases += 1
+            else:
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            self._condition.notify_all()
+
+
+class RetryPolicy:
+    """Jittered exponential backoff ("full jitter") bounded by a deadline."""
+
+    def __init__(self, *, max_attempts: int = 4, base_delay: float = 0.5, max_delay: float = 8.0):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (1-based)."""
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+
+class ExtractionGovernor:
+    """
+    Process-wide pacing for model calls.
+
+    Every call waits for a token-bucket token and an adaptive concurrency
+    slot, and retryable failures are retried with jittered backoff while the
+    call's deadline allows. Throttling and latency feed back into the
+    concurrency limit.
+    """
+
+    def __init__(
+        self,
+        *,
+        bucket: Optional[TokenBucket] = None,
+        concurrency: Optional[AdaptiveConcurrencyLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+    ):
+        self.bucket = bucket
+        self.concurrency = concurrency or AdaptiveConcurrencyLimiter()
+        self.retry = retry or RetryPolicy()
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failures = 0
+
+    def call(
+        self,
+        func: Callable[[], T],
+        *,
+        cost: float = 1.0,
+        slots: int = 1,
+        deadline_at: Optional[float] = None,
+    ) -> T:
+        """
+        Run `func` under the limiter with retries.
+
+        Args:
+            func: The model call
+            cost: Token-bucket tokens the call consumes (e.g. model requests made)
+            slots: Concurrency slots the call occupies (its parallel requests)
+            deadline_at: time.monotonic() value after which no attempt starts
+
+        Returns:
+            The result of `func`
+
+        Raises:
+            DeadlineExceeded: When waiting for capacity would pass the deadline.
+                The call's own error is re-raised when it is not retryable,
+                attempts are exhausted, or the backoff would pass the deadline.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.bucket is not None and not self.bucket.acquire(cost, deadline_at=deadline_at):
+                raise DeadlineExceeded("Rate limit wait would exceed the request deadline.")
+            taken = self.concurrency.acquire(slots=slots, deadline_at=deadline_at)
+            if not taken:
+                raise DeadlineExceeded("No extraction slot freed up before the request deadline.")
+
+            started = time.monotonic()
+            throttled = False
+            try:
+                with self._lock:
+                    self.calls += 1
+                return func()
+            except Exception as e:
+                throttled = is_throttle_error(e)
+                with self._lock:
+                    self.throttled += int(throttled)
+                if not is_retryable_error(e) or attempt >= self.retry.max_attempts:
+                    with self._lock:
+                        self.failures += 1
+                    raise
+                delay = self.retry.backoff(attempt)
+                if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+                    with self._lock:
+                        self.failures += 1
+                    raise
+                logger.warning("Model call failed (attempt %d), retrying in %.2fs: %s", attempt, delay, e)
+                with self._lock:
+                    self.retries += 1
+            finally:
+                self.concurrency.release(taken, latency=time.monotonic() - started, throttled=throttled)
+            time.sleep(delay)
+
+    def stats(self) -> Dict[str, float]:
+        """Counters for monitoring pacing and retry behaviour."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "failures": self.failures,
+                "concurrency_limit": int(self.concurrency.limit),
+                "concurrency_decreases": self.concurrency.decreases,
+                "in_flight": self.concurrency.in_flight,
+            }
+
+
+class RateLimitedBackend(ExtractionBackend):
+    """Extraction backend wrapper that routes every call through an ExtractionGovernor."""
+
+    def __init__(
+        self,
+        inner: ExtractionBackend,
+        governor: ExtractionGovernor,
+        *,
+        call_budget: Optional[float] = None,
+        max_char_buffer: int = LANGEXTRACT_MAX_CHAR_BUFFER,
+    ):
+        self.inner = inner
+        self.governor = governor
+        # Seconds a single extract() may spend waiting and retrying.
+        self.call_budget = call_budget
+        # Characters per model request; a longer text costs several requests.
+        self.max_char_buffer = max_char_buffer
+
+    def model_requests(self, texts: Sequence[str]) -> int:
+        """Model requests an extract() of `texts` makes: one per max_char_buffer characters of each text."""
+        return sum(max(1, math.ceil(len(text) / self.max_char_buffer)) for text in texts)
+
+    def extract(self, texts: Sequence[str], *, max_workers: int = 1):
+        # The request deadline, when one is set, caps waiting and retries too.
+        budget_deadline = None if self.call_budget is None else time.monotonic() + self.call_budget
+        deadline_at = earliest(budget_deadline, current_deadline())
+        # Every model request costs a token; a multi-document call occupies
+        # one slot per parallel request.
+        requests = self.model_requests(texts)
+        slots = max(1, min(max_workers, requests))
+        return self.governor.call(
+            lambda: self.inner.extract(texts, max_workers=max_workers),
+            cost=max(1, requests),
+            slots=slots,
+            deadline_at=deadline_at,
+        )
+
+    def stats(self) -> Optional[Dict[str, float]]:
+        return self.governor.stats()
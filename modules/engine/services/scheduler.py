@@ -0,0 +1,220 @@
+"""Priority scheduling of model calls: interactive first, bulk fair-queued per user."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, Optional, Sequence
+
+from services.deadline import DeadlineExceeded, current_deadline
+from services.extraction_backends import ExtractionBackend
+
+# Priority classes. Interactive requests (a user saving a journal) are always
+# admitted before bulk work (backfills, shadow comparisons).
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BULK = "bulk"
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_BULK)
+
+_PRIORITY: ContextVar[str] = ContextVar("analysis_priority", default=PRIORITY_INTERACTIVE)
+_TENANT: ContextVar[Optional[str]] = ContextVar("analysis_tenant", default=None)
+
+
+def current_priority() -> str:
+    """Priority class of the work running in this context."""
+    return _PRIORITY.get()
+
+
+def current_tenant() -> Optional[str]:
+    """User the work running in this context belongs to, if known."""
+    return _TENANT.get()
+
+
+@contextmanager
+def priority_scope(priority: str, tenant: Optional[str] = None) -> Iterator[None]:
+    """Run the block's model calls in `priority` on behalf of `tenant`."""
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority class: {priority}")
+    priority_token = _PRIORITY.set(priority)
+    tenant_token = _TENANT.set(tenant)
+    try:
+        yield
+    finally:
+        _TENANT.reset(tenant_token)
+        _PRIORITY.reset(priority_token)
+
+
+class _Waiter:
+    __slots__ = ("priority", "tenant", "slots", "enqueued")
+
+    def __init__(self, priority: str, tenant: str, slots: int):
+        self.priority = priority
+        self.tenant = tenant
+        self.slots = slots
+        self.enqueued = time.monotonic()
+
+
+class _ClassStats:
+    __slots__ = ("admitted", "timed_out", "total_wait", "max_wait")
+
+    def __init__(self):
+        self.admitted = 0
+        self.timed_out = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class PriorityScheduler:
+    """
+    Admit model calls into `capacity` slots by priority class.
+
+    Queued interactive calls always go first, and `interactive_reserve`
+    slots are never handed to bulk work, so a backlog cannot occupy all
+    capacity when an interactive call arrives. Bulk calls are queued per
+    tenant and admitted round-robin, so one user's backfill does not
+    starve another's.
+    """
+
+    def __init__(self, capacity: int = 8, *, interactive_reserve: int = 1):
+        self.capacity = max(1, capacity)
+        self.interactive_reserve = min(max(0, interactive_reserve), self.capacity - 1)
+        self.in_use = 0
+        self._interactive: Deque[_Waiter] = deque()
+        # Tenant -> its queued bulk calls; order is the round-robin order.
+        self._bulk: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._stats = {priority: _ClassStats() for priority in PRIORITIES}
+        self._condition = threading.Condition()
+
+    def _head(self) -> Optional[_Waiter]:
+        if self._interactive:
+            return self._interactive[0]
+        if self._bulk:
+            return next(iter(self._bulk.values()))[0]
+        return None
+
+    def _fits(self, waiter: _Waiter) -> bool:
+        limit = self.capacity
+        if waiter.priority == PRIORITY_BULK:
+            limit -= self.interactive_reserve
+        # A call larger than the limit runs alone rather than never.
+        return self.in_use + waiter.slots <= limit or self.in_use == 0
+
+    def _dequeue(self, waiter: _Waiter) -> None:
+        if waiter.priority == PRIORITY_INTERACTIVE:
+            self._interactive.remove(waiter)
+            return
+        queue = self._bulk[waiter.tenant]
+        queue.remove(waiter)
+        if queue:
+            # Next turn goes to the following tenant.
+            self._bulk.move_to_end(waiter.tenant)
+        else:
+            del self._bulk[waiter.tenant]
+
+    def acquire(
+        self,
+        priority: str = PRIORITY_INTERACTIVE,
+        *,
+        tenant: Optional[str] = None,
+        slots: int = 1,
+        deadline_at: Optional[float] = None,
+    ) -> bool:
+        """
+        Wait for `slots` of capacity in `priority`'s turn.
+
+        Args:
+            priority: PRIORITY_INTERACTIVE or PRIORITY_BULK
+            tenant: User the call is for; bulk calls are fair-queued by it
+            slots: Capacity the call occupies (e.g. its parallel model calls)
+            deadline_at: time.monotonic() value after which to stop waiting
+
+        Returns:
+            True once admitted (call `release` with the same `slots`),
+            False if the deadline passed first
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority class: {priority}")
+        waiter = _Waiter(priority, tenant or "", max(1, slots))
+        with self._condition:
+            if priority == PRIORITY_INTERACTIVE:
+                self._interactive.append(waiter)
+            else:
+                self._bulk.setdefault(waiter.tenant, deque()).append(waiter)
+            while self._head() is not waiter or not self._fits(waiter):
+                timeout = None if deadline_at is None else deadline_at - time.monotonic()
+                if timeout is not None and timeout <= 0:
+                    self._dequeue(waiter)
+                    self._stats[priority].timed_out += 1
+                    self._condition.notify_all()
+                    return False
+                self._condition.wait(timeout)
+            self._dequeue(waiter)
+            self.in_use += waiter.slots
+            waited = time.monotonic() - waiter.enqueued
+            stats = self._stats[priority]
+            stats.admitted += 1
+            stats.total_wait += waited
+            stats.max_wait = max(stats.max_wait, waited)
+            # The next head may fit in the remaining capacity too.
+            self._condition.notify_all()
+            return True
+
+    def release(self, slots: int = 1) -> None:
+        """Return capacity taken by `acquire`."""
+        with self._condition:
+            self.in_use -= max(1, slots)
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, admissions and wait times per priority class."""
+        with self._condition:
+            queued = {
+                PRIORITY_INTERACTIVE: len(self._interactive),
+                PRIORITY_BULK: sum(len(queue) for queue in self._bulk.values()),
+            }
+            classes = {
+                priority: {
+                    "queued": queued[priority],
+                    "admitted": stats.admitted,
+                    "timed_out": stats.timed_out,
+                    "avg_wait_ms": (stats.total_wait / stats.admitted * 1000.0) if stats.admitted else 0.0,
+                    "max_wait_ms": stats.max_wait * 1000.0,
+                }
+                for priority, stats in self._stats.items()
+            }
+            return {
+                "capacity": self.capacity,
+                "interactive_reserve": self.interactive_reserve,
+                "in_use": self.in_use,
+                "bulk_tenants_queued": len(self._bulk),
+                "classes": classes,
+            }
+
+
+class ScheduledBackend(ExtractionBackend):
+    """Extraction backend wrapper that admits every call through a PriorityScheduler."""
+
+    def __init__(self, inner: ExtractionBackend, scheduler: PriorityScheduler):
+        self.inner = inner
+        self.scheduler = scheduler
+
+    def extract(self, texts: Sequence[str], *, max_workers: int = 1):
+        # A multi-document call occupies one slot per parallel model call.
+        slots = max(1, min(max_workers, len(texts)))
+        if not self.scheduler.acquire(
+            current_priority(),
+            tenant=current_tenant(),
+            slots=slots,
+            deadline_at=current_deadline(),
+        ):
+            raise DeadlineExceeded("No extraction capacity freed up before the request deadline.")
+        try:
+            return self.inner.extract(texts, max_workers=max_workers)
+        finally:
+            self.scheduler.release(slots)
+
+    def stats(self) -> Optional[Dict[str, Any]]:
+        stats = dict(self.inner.stats() or {})
+        stats["scheduler"] = self.scheduler.stats()
+        return stats
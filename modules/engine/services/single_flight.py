@@ -0,0 +1,76 @@
+"""Coalesce concurrent identical calls into one in-flight execution."""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Run at most one call per key at a time.
+
+    The first caller for a key (the leader) executes the function; callers
+    arriving while it is in flight (followers) wait for the leader's result
+    instead of starting their own. Exceptions are shared the same way. Once
+    the leader finishes the key is released, so later calls run again (a
+    result cache, not this class, is responsible for reuse over time).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key: str, func: Callable[[], T], *, timeout: Optional[float] = None) -> Tuple[T, bool]:
+        """
+        Return `func()` for `key`, sharing an identical in-flight call.
+
+        Args:
+            key: Content key identifying identical calls
+            func: Zero-argument callable executed by the leader
+            timeout: Seconds a follower waits for the leader
+
+        Returns:
+            (result, shared) where shared is True for followers
+
+        Raises:
+            concurrent.futures.TimeoutError: A follower's wait exceeded `timeout`
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            return future.result(timeout=timeout), True
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring how many calls were coalesced."""
+        with self._lock:
+            return {
+                "in_flight": len(self._in_flight),
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+            }
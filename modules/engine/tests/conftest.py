@@ -7,3 +7,4 @@ from pathlib import Path
 os.environ.setdefault("FIREBASE_CREDENTIALS_PATH", "")
 os.environ.setdefault("FIREBASE_PROJECT_ID", "test-project")
 os.environ.setdefault("DEBUG", "True")
+os.environ.setdefault("ANALYSIS_JOB_DB_PATH", "")
@@ -0,0 +1,33 @@
+"""Tests for the per-user cumulative BRI series cache."""
+from services.bri_series_cache import BriSeries, CumulativeBriCache
+
+
+def test_previous_bisects_strictly_before():
+    """Test that the predecessor is the latest journal created strictly before the date."""
+    series = BriSeries([(300.0, "c", 30.0), (100.0, "a", 10.0), (200.0, "b", None)])
+
+    assert series.previous(100.0) is None
+    assert series.previous(150.0) == 10.0
+    assert series.previous(250.0) is None  # "b" is not analyzed: the average restarts
+    assert series.previous(1e9) == 30.0
+
+
+def test_record_updates_known_journals_and_drops_unknown_users_series():
+    """Test write-through of computed values and LRU eviction."""
+    cache = CumulativeBriCache(max_users=2, ttl_seconds=0)
+    cache.put("u1", BriSeries([(100.0, "2024-01-01", 10.0)]))
+
+    cache.record("u1", "2024-01-01", 42.0)
+    assert cache.get("u1").previous(200.0) == 42.0
+
+    # A journal the series has not seen yet forces a reload.
+    cache.record("u1", "2024-01-02", 50.0)
+    assert cache.get("u1") is None
+
+    cache.put("u1", BriSeries([]))
+    cache.put("u2", BriSeries([]))
+    cache.put("u3", BriSeries([]))
+    assert cache.get("u1") is None
+    stats = cache.stats()
+    assert stats["users"] == 2
+    assert stats["evictions"] == 1
@@ -0,0 +1,728 @@
+"""Tests for the burnout analysis service (no Firestore or network required)."""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from models.burnout import BurnoutFeature, EmotionType, MBIDimension
+from services import analysis_cache
+from services.analysis_cache import AnalysisCache
+from services.burnout_analysis import MODEL_ID, PROMPT_VERSION, BurnoutAnalysisService
+from services.chunking import chunk_text
+from services.circuit_breaker import CircuitBreaker
+from services.deadline import DeadlineExceeded, deadline_after_ms
+from services.extraction_backends import (
+    ExtractionBackend,
+    LangExtractBackend,
+    RecordingBackend,
+    ReplayBackend,
+)
+from services.single_flight import SingleFlight
+
+
+def make_feature(ee=60.0, dp=40.0, pa=20.0, emotion=EmotionType.NEGATIVE):
+    """Build a LangExtract-shaped feature for stubbed extraction."""
+    return BurnoutFeature(
+        emotion_type=emotion,
+        stress_level=0.7,
+        cynical_thoughts=False,
+        mbi_dimension=[MBIDimension.EMOTIONAL_EXHAUSTION],
+        confidence=0.8,
+        ee_score=ee,
+        dp_score=dp,
+        pa_score=pa,
+    )
+
+
+@pytest.fixture
+def extract_calls(monkeypatch):
+    """Stub LangExtract and record every text sent to it."""
+    calls = []
+
+    def fake_extract(self, text, sentences):
+        calls.append(text)
+        return [make_feature()]
+
+    monkeypatch.setattr(BurnoutAnalysisService, "_extract_features_with_langextract", fake_extract)
+    return calls
+
+
+class TestAnalysisCache:
+    """Test the two-tier analysis cache."""
+
+    def test_make_key_is_unambiguous(self):
+        """Test that part boundaries are part of the key."""
+        assert AnalysisCache.make_key("ab", "c") != AnalysisCache.make_key("a", "bc")
+        assert AnalysisCache.make_key("a", None) == AnalysisCache.make_key("a", "")
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = AnalysisCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        assert cache.get("a") == "1"
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Test that entries older than the TTL are treated as misses."""
+        now = [1000.0]
+        monkeypatch.setattr(analysis_cache.time, "time", lambda: now[0])
+        cache = AnalysisCache(ttl_seconds=10)
+        cache.set("a", "1")
+
+        now[0] += 5
+        assert cache.get("a") == "1"
+        now[0] += 10
+        assert cache.get("a") is None
+
+    def test_sqlite_tier_survives_restart(self, tmp_path):
+        """Test that a new cache instance reads entries persisted by an old one."""
+        db_path = str(tmp_path / "cache.sqlite3")
+        AnalysisCache(db_path=db_path).set("a", "1")
+
+        restarted = AnalysisCache(db_path=db_path)
+        assert restarted.get("a") == "1"
+        assert restarted.stats()["disk_hits"] == 1
+
+
+class TestBurnoutAnalysisService:
+    """Test BurnoutAnalysisService orchestration with a stubbed extractor."""
+
+    def test_cache_hit_skips_extraction(self, extract_calls):
+        """Test that re-submitting identical text is served from the cache."""
+        service = BurnoutAnalysisService(api_key="test-key", cache=AnalysisCache())
+
+        first = service.analyze("I am exhausted.  ", mode="llm")
+        second = service.analyze("I am exhausted.", mode="llm")
+
+        assert len(extract_calls) == 1
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.overall_score == first.overall_score
+
+    def test_coach_transcript_is_part_of_key(self, extract_calls):
+        """Test that a different coach transcript is not served from the cache."""
+        service = BurnoutAnalysisService(api_key="test-key", cache=AnalysisCache())
+
+        service.analyze("I am exhausted.", mode="llm")
+        result = service.analyze("I am exhausted.", coach_transcript="You: I can't sleep.", mode="llm")
+
+        assert result.cache_hit is False
+
+    async def test_analyze_async_runs_off_event_loop(self, monkeypatch):
+        """Test that analyze_async executes the blocking work on the worker pool."""
+        threads = []
+
+        def fake_extract(self, text, sentences):
+            threads.append(threading.current_thread().name)
+            return [make_feature()]
+
+        monkeypatch.setattr(BurnoutAnalysisService, "_extract_features_with_langextract", fake_extract)
+        service = BurnoutAnalysisService(api_key="test-key", max_workers=1)
+
+        result = await service.analyze_async("I am exhausted.", mode="llm")
+
+        assert result.overall_score > 0
+        assert threads and threads[0].startswith("burnout-analysis")
+        assert threads[0] != threading.current_thread().name
+
+    def test_coach_extraction_runs_in_parallel(self, monkeypatch):
+        """Test that journal and coach extractions overlap and report branch timings."""
+        def slow_extract(self, text, sentences):
+            time.sleep(0.2)
+            return [make_feature()]
+
+        monkeypatch.setattr(BurnoutAnalysisService, "_extract_features_with_langextract", slow_extract)
+        service = BurnoutAnalysisService(api_key="test-key")
+
+        started = time.perf_counter()
+        result = service.analyze("I am exhausted.", coach_transcript="You: I can't sleep.", mode="llm")
+        elapsed = time.perf_counter() - started
+
+        assert result.coach_used is True
+        assert elapsed < 0.35
+        assert result.timings_ms["journal_extraction"] >= 200
+        assert result.timings_ms["coach_extraction"] >= 200
+
+    def test_analyze_batch_uses_one_multi_document_call(self, monkeypatch):
+        """Test that batch analysis sends uncached texts together and keeps input order."""
+        calls = []
+
+        def fake_run(self, text_or_documents, **kwargs):
+            calls.append(text_or_documents)
+            return [
+                SimpleNamespace(
+                    document_id=doc.document_id,
+                    extractions=[SimpleNamespace(attributes={"ee_score": 20 * (index + 1)})],
+                )
+                for index, doc in enumerate(text_or_documents)
+            ]
+
+        monkeypatch.setattr(LangExtractBackend, "_run", fake_run)
+        service = BurnoutAnalysisService(api_key="test-key", cache=AnalysisCache())
+
+        results = service.analyze_batch(["Day one.", "Day two.", "Day three."], mode="llm")
+
+        assert len(calls) == 1
+        assert [r.emotional_exhaustion.normalized_score for r in results] == [20, 40, 60]
+
+        again = service.analyze_batch(["Day one.", "Day two.", "Day three."], mode="llm")
+        assert len(calls) == 1
+        assert all(r.cache_hit for r in again)
+
+    def test_lexicon_mode_scores_offline(self, extract_calls):
+        """Test that lexicon mode never calls LangExtract and still scores."""
+        service = BurnoutAnalysisService(api_key=None)
+
+        result = service.analyze("I'm exhausted and overwhelmed. It all feels pointless.", mode="lexicon")
+
+        assert extract_calls == []
+        assert result.analysis_mode == "lexicon"
+        assert result.degraded is False
+        assert result.emotional_exhaustion.normalized_score > 0
+        assert result.depersonalization.normalized_score > 0
+
+    def test_llm_mode_requires_langextract(self):
+        """Test that llm mode still fails fast without an API key."""
+        service = BurnoutAnalysisService(api_key=None)
+
+        with pytest.raises(RuntimeError):
+            service.analyze("I am exhausted.", mode="llm")
+
+    def test_auto_mode_falls_back_when_over_budget(self, monkeypatch):
+        """Test that auto mode serves a degraded lexicon result when LangExtract is slow."""
+        def slow_extract(self, text, sentences):
+            time.sleep(0.5)
+            return [make_feature()]
+
+        monkeypatch.setattr(BurnoutAnalysisService, "_extract_features_with_langextract", slow_extract)
+        service = BurnoutAnalysisService(
+            api_key="test-key", cache=AnalysisCache(), llm_latency_budget=0.05, default_mode="auto"
+        )
+
+        started = time.perf_counter()
+        # "I am exhausted." scores inside the uncertainty band, so auto mode escalates it.
+        result = service.analyze("I am exhausted.")
+
+        assert time.perf_counter() - started < 0.4
+        assert result.escalated is True
+        assert result.analysis_mode == "lexicon"
+        assert result.degraded is True
+        assert service.cache.stats()["size"] == 0
+
+    def test_cascade_serves_confident_local_score(self, extract_calls):
+        """Test that auto mode serves a clear-cut lexicon score without LangExtract."""
+        service = BurnoutAnalysisService(api_key="test-key", default_mode="auto")
+
+        result = service.analyze("I feel accomplished and proud today. I finished my project.")
+
+        assert extract_calls == []
+        assert result.analysis_mode == "lexicon"
+        assert result.escalated is False
+        assert result.degraded is False
+        assert service.metrics()["cascade"]["local"] == 1
+
+    def test_default_mode_applies_when_no_mode_is_given(self, extract_calls):
+        """Test that calls without a mode use llm by default, and the cascade only when configured."""
+        text = "I feel accomplished and proud today. I finished my project."
+
+        assert BurnoutAnalysisService(api_key="test-key").analyze(text).analysis_mode == "llm"
+        assert extract_calls == [text]
+        assert BurnoutAnalysisService(api_key="test-key", default_mode="auto").analyze(text).analysis_mode == "lexicon"
+        assert extract_calls == [text]
+
+    def test_cascade_escalates_ambiguous_score(self, extract_calls):
+        """Test that auto mode escalates uncertain scores and records tier agreement."""
+        service = BurnoutAnalysisService(api_key="test-key", default_mode="auto")
+
+        result = service.analyze("I am exhausted.")
+
+        assert extract_calls == ["I am exhausted."]
+        assert result.analysis_mode == "llm"
+        assert result.escalated is True
+        cascade = service.metrics()["cascade"]
+        assert cascade["escalation_rate"] == 1.0
+        assert cascade["escalation_reasons"] == {"uncertain_band": 1}
+        assert cascade["agreement"]["escalated"]["compared"] == 1
+
+    def test_batch_cascade_only_sends_escalated_texts(self, monkeypatch):
+        """Test that batch auto mode sends only ambiguous texts to LangExtract."""
+        calls = []
+
+        def fake_batch(self, texts, *, max_workers):
+            calls.append(list(texts))
+            return [[make_feature()] for _ in texts]
+
+        monkeypatch.setattr(BurnoutAnalysisService, "_extract_features_batch", fake_batch)
+        service = BurnoutAnalysisService(api_key="test-key", default_mode="auto")
+
+        results = service.analyze_batch(
+            ["I feel accomplished and proud today. I finished my project.", "I am exhausted."]
+        )
+
+        assert calls == [["I am exhausted."]]
+        assert [r.analysis_mode for r in results] == ["lexicon", "llm"]
+        assert [r.escalated for r in results] == [False, True]
+
+    def test_incremental_reextracts_only_edited_sentences(self, monkeypatch):
+        """Test that an edit re-extracts only the changed sentence and re-aggregates."""
+        calls = []
+
+        def fake_batch(self, texts, *, max_workers=4):
+            calls.append(list(texts))
+            return [[make_feature(ee=float(len(text)))] for text in texts]
+
+        monkeypatch.setattr(BurnoutAnalysisService, "_extract_features_batch", fake_batch)
+        service = BurnoutAnalysisService(api_key="test-key", cache=AnalysisCache(), incremental=True)
+
+        first = service.analyze("I am tired. Work was long. I slept badly.", mode="llm")
+        edited = service.analyze("I am tired. Work was very long. I slept badly.", mode="llm")
+
+        assert len(calls[0]) == 3
+        assert len(calls[1]) == 1 and "very long" in calls[1][0]
+        assert (first.segments_extracted, first.segments_reused) == (3, 0)
+        assert (edited.segments_extracted, edited.segments_reused) == (1, 2)
+        assert len(edited.features) == 3
+        assert edited.emotional_exhaustion.normalized_score > first.emotional_exhaustion.normalized_score
+
+    def test_incremental_and_whole_text_results_are_cached_apart(self, monkeypatch):
+        """Test that a whole-text result is not served to an incremental request, or vice versa."""
+        def fake_batch(self, texts, *, max_workers=4):
+            return [[make_feature()] for _ in texts]
+
+        monkeypatch.setattr(BurnoutAnalysisService, "_extract_features_batch", fake_batch)
+        monkeypatch.setattr(
+            BurnoutAnalysisService, "_extract_features_with_langextract", lambda self, text, sentences: [make_feature()]
+        )
+        service = BurnoutAnalysisService(api_key="test-key", cache=AnalysisCache())
+        text = "I am tired. Work was long."
+
+        whole = service.analyze(text, mode="llm")
+        incremental = service.analyze(text, mode="llm", incremental=True)
+
+        assert not whole.cache_hit and not incremental.cache_hit
+        assert incremental.segments_extracted == 2
+        assert service.analyze(text, mode="llm", incremental=True).cache_hit
+        assert service.analyze(text, mode="llm").cache_hit
+
+    def test_segments_do_not_evict_whole_results(self, monkeypatch):
+        """Test that per-sentence features are stored outside the analysis LRU."""
+        def fake_batch(self, texts, *, max_workers=4):
+            return [[make_feature()] for _ in texts]
+
+        monkeypatch.setattr(BurnoutAnalysisService, "_extract_features_batch", fake_batch)
+        service = BurnoutAnalysisService(api_key="test-key", cache=AnalysisCache(max_entries=1), incremental=True)
+        text = "I am tired. Work was long. I slept badly."
+
+        service.analyze(text, mode="llm")
+
+        assert service.analyze(text, mode="llm").cache_hit
+        assert service.cache.stats()["evictions"] == 0
+        assert service.segment_cache.stats()["size"] == 3
+
+    def test_concurrent_identical_requests_are_coalesced(self, monkeypatch):
+        """Test that identical in-flight requests share one LangExtract call."""
+        calls = []
+        release = threading.Event()
+
+        def slow_extract(self, text, sentences):
+            calls.append(text)
+            release.wait(1.0)
+            return [make_feature()]
+
+        monkeypatch.setattr(BurnoutAnalysisService, "_extract_features_with_langextract", slow_extract)
+        service = BurnoutAnalysisService(api_key="test-key")
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(service.analyze("I am exhausted.", mode="llm")))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        while service.single_flight.stats()["coalesced"] < 2:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert sorted(r.coalesced for r in results) == [False, True, True]
+        assert len({id(r) for r in results}) == 3
+        assert service.metrics()["single_flight"]["coalesced"] == 2
+
+
+    def test_open_circuit_serves_degraded_results_without_calling_model(self):
+        """Test that the breaker trips, serves lexicon scores in every mode, and closes after a probe."""
+        class FlakyBackend(ExtractionBackend):
+            def __init__(self):
+                self.calls = 0
+                self.healthy = False
+
+            def extract(self, texts, *, max_workers=1):
+                self.calls += 1
+                if not self.healthy:
+                    raise ConnectionError("503 unavailable")
+                return [[{"ee_score": 60}] for _ in texts]
+
+        backend = FlakyBackend()
+        service = BurnoutAnalysisService(
+            backend=backend,
+            breaker=CircuitBreaker(failure_threshold=2, reset_timeout=0.1),
+            default_mode="auto",
+        )
+
+        # "I am exhausted." is ambiguous locally, so auto mode escalates it.
+        for _ in range(2):
+            assert service.analyze("I am exhausted.").degraded is True
+        assert service.breaker.stats()["state"] == "open"
+
+        result = service.analyze("I am exhausted.")
+        assert result.degraded is True
+        assert backend.calls == 2
+        for llm_result in (
+            service.analyze("I am exhausted.", mode="llm"),
+            service.analyze_batch(["I am exhausted.", "I feel drained."], mode="llm")[0],
+            [event["data"] for event in service.analyze_stream("I am exhausted.", mode="llm")][-1],
+        ):
+            assert llm_result.degraded is True
+            assert llm_result.analysis_mode == "lexicon"
+        assert backend.calls == 2
+
+        backend.healthy = True
+        time.sleep(0.15)
+        probe = service.analyze("I am exhausted.")
+        assert probe.degraded is False
+        assert probe.analysis_mode == "llm"
+        assert service.metrics()["circuit_breaker"]["state"] == "closed"
+
+    def test_analyze_stream_emits_progress_then_matching_result(self):
+        """Test that streaming yields per-chunk progress and the same result as analyze."""
+        class ChunkBackend(ExtractionBackend):
+            def extract(self, texts, *, max_workers=1):
+                return [[{"ee_score": 30 + len(text) % 50, "dp_score": 20}] for text in texts]
+
+        text = " ".join(f"I am exhausted by meeting number {i}." for i in range(20))
+        service = BurnoutAnalysisService(backend=ChunkBackend(), chunk_token_budget=50)
+
+        events = list(service.analyze_stream(text, mode="llm"))
+        names = [event["event"] for event in events]
+        chunk_count = events[0]["data"]["chunk_count"]
+
+        assert chunk_count > 1
+        assert names == ["preprocessed", "provisional"] + ["features", "provisional"] * chunk_count + ["result"]
+        assert events[1]["data"]["source"] == "lexicon"
+        assert events[-2]["data"]["chunks_done"] == chunk_count
+        result = events[-1]["data"]
+        assert result.analysis_mode == "llm"
+        assert result.overall_score == pytest.approx(service.analyze(text, mode="llm").overall_score)
+
+class TestSingleFlight:
+    """Test the in-flight call coalescer."""
+
+    def test_followers_share_leader_exception(self):
+        """Test that a failing leader call fails its followers and releases the key."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def failing():
+            started.set()
+            release.wait(1.0)
+            raise RuntimeError("boom")
+
+        def call():
+            try:
+                flight.do("key", failing)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(1.0)
+        follower = threading.Thread(target=call)
+        follower.start()
+        while flight.stats()["coalesced"] < 1:
+            time.sleep(0.01)
+        release.set()
+        leader.join()
+        follower.join()
+
+        assert errors == ["boom", "boom"]
+        assert flight.stats()["in_flight"] == 0
+        assert flight.do("key", lambda: 1) == (1, False)
+
+
+class TestExtractionBackends:
+    """Test the record/replay extraction backends."""
+
+    def test_record_then_replay_offline(self, tmp_path):
+        """Test that recorded extractions replay identically without LangExtract."""
+        class FakeLiveBackend(ExtractionBackend):
+            def extract(self, texts, *, max_workers=1):
+                return [[{"ee_score": 70, "dp_score": 30, "emotion_type": "negative"}] for _ in texts]
+
+        fixture = tmp_path / "extractions.json"
+        recorder = BurnoutAnalysisService(
+            backend=RecordingBackend(FakeLiveBackend(), str(fixture), model_id=MODEL_ID, prompt_version=PROMPT_VERSION)
+        )
+        recorded = recorder.analyze("I am exhausted.", mode="llm")
+
+        replayer = BurnoutAnalysisService(
+            backend=ReplayBackend.from_fixture(
+                str(fixture), model_id=MODEL_ID, prompt_version=PROMPT_VERSION, latency=0.05
+            )
+        )
+        started = time.perf_counter()
+        replayed = replayer.analyze("I am exhausted.", mode="llm")
+
+        assert time.perf_counter() - started >= 0.05
+        assert replayed.overall_score == recorded.overall_score
+        assert replayed.emotional_exhaustion.normalized_score == 70
+
+    def test_replay_unknown_text_fails_in_llm_mode(self):
+        """Test that a strict replayer surfaces unrecorded texts as extraction failures."""
+        service = BurnoutAnalysisService(
+            backend=ReplayBackend({}, model_id=MODEL_ID, prompt_version=PROMPT_VERSION)
+        )
+
+        with pytest.raises(RuntimeError):
+            service.analyze("Never recorded.", mode="llm")
+
+    def test_replay_ignores_records_from_another_prompt_or_model(self, tmp_path):
+        """Test that a fixture never replays attributes recorded under an old prompt or model."""
+        class FakeLiveBackend(ExtractionBackend):
+            def extract(self, texts, *, max_workers=1):
+                return [[{"ee_score": 70}] for _ in texts]
+
+        fixture = tmp_path / "extractions.json"
+        RecordingBackend(FakeLiveBackend(), str(fixture), model_id="model-a", prompt_version="1").extract(["Tired."])
+
+        assert ReplayBackend.from_fixture(str(fixture), model_id="model-a", prompt_version="1").extract(["Tired."]) == [
+            [{"ee_score": 70}]
+        ]
+        for model_id, prompt_version in (("model-a", "2"), ("model-b", "1")):
+            replayer = ReplayBackend.from_fixture(str(fixture), model_id=model_id, prompt_version=prompt_version)
+            with pytest.raises(KeyError):
+                replayer.extract(["Tired."])
+
+    def test_backends_must_implement_extract(self):
+        """Test that ExtractionBackend is abstract over extract."""
+        class IncompleteBackend(ExtractionBackend):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteBackend()
+
+
+class TestChunking:
+    """Test token-budget chunking of long texts."""
+
+    def test_chunks_end_on_sentence_boundaries(self):
+        """Test that chunks respect the budget and keep every sentence intact."""
+        text = " ".join(f"Sentence number {i} is here." for i in range(40))
+        sentences = [f"Sentence number {i} is here." for i in range(40)]
+
+        chunks = chunk_text(text, max_tokens=30, sentences=sentences)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 30 * 4 for chunk in chunks)
+        assert " ".join(chunks) == text
+
+    def test_long_text_is_extracted_in_one_fan_out_and_length_weighted(self):
+        """Test that chunk features are merged with weights proportional to chunk length."""
+        calls = []
+
+        class ChunkBackend(ExtractionBackend):
+            def extract(self, texts, *, max_workers=1):
+                calls.append(list(texts))
+                return [[{"ee_score": 80 if "long" in text else 20}] for text in texts]
+
+        long_part = "This part is long. " * 32
+        short_part = "Short bit here."
+        text = long_part + short_part
+        sentences = ["This part is long."] * 32 + [short_part]
+        service = BurnoutAnalysisService(backend=ChunkBackend(), chunk_token_budget=40)
+
+        features = service._extract_chunked(text.strip(), sentences)
+        mbi = service._calculate_mbi_scores(features, text, len(text))
+
+        assert len(calls) == 1 and calls[0][-1] == short_part
+        ee = mbi[MBIDimension.EMOTIONAL_EXHAUSTION].normalized_score
+        # Unweighted, the short chunk would count as much as each long one (68).
+        lengths = [len(chunk) for chunk in calls[0]]
+        expected = (sum(lengths[:-1]) * 80 + lengths[-1] * 20) / sum(lengths)
+        assert ee == pytest.approx(expected)
+        assert ee > 75
+
+    def test_batch_chunks_long_texts_like_analyze(self):
+        """Test that a long text in a batch is chunked and scored as on the single-entry path."""
+        class ChunkBackend(ExtractionBackend):
+            def extract(self, texts, *, max_workers=1):
+                return [[{"ee_score": 80 if "long" in text else 20}] for text in texts]
+
+        text = "This part is long. " * 32 + "Short bit here."
+        service = BurnoutAnalysisService(backend=ChunkBackend(), chunk_token_budget=40)
+
+        single = service.analyze(text, mode="llm")
+        batch = service.analyze_batch([text, "Short bit here."], mode="llm")
+
+        assert batch[0].overall_score == pytest.approx(single.overall_score)
+        assert batch[0].emotional_exhaustion.normalized_score == pytest.approx(
+            single.emotional_exhaustion.normalized_score
+        )
+        assert batch[1].emotional_exhaustion.normalized_score == 20
+
+
+class TestDeadlines:
+    """Test per-request deadlines and partial results."""
+
+    class SlowCoachBackend(ExtractionBackend):
+        def extract(self, texts, *, max_workers=1):
+            # Coach turns reach the backend preprocessed, without their "You:" prefix.
+            if any("sleep" in text for text in texts):
+                time.sleep(0.5)
+            return [[{"ee_score": 60}] for _ in texts]
+
+    def test_late_coach_extraction_is_skipped(self):
+        """Test that llm mode returns the base score without the coach modifier at the deadline."""
+        service = BurnoutAnalysisService(backend=self.SlowCoachBackend(), cache=AnalysisCache())
+
+        started = time.perf_counter()
+        result = service.analyze(
+            "I am exhausted.",
+            coach_transcript="You: I can't sleep.",
+            mode="llm",
+            deadline_at=deadline_after_ms(150),
+        )
+
+        assert time.perf_counter() - started < 0.4
+        assert result.emotional_exhaustion.normalized_score == 60
+        assert result.coach_used is False
+        assert result.partial is True
+        assert result.skipped_stages == ["coach_modifier"]
+        assert service.cache.stats()["size"] == 0
+
+    def test_followers_do_not_inherit_the_leaders_deadline(self):
+        """Test that a coalesced caller with a later deadline gets a full result."""
+        service = BurnoutAnalysisService(backend=self.SlowCoachBackend())
+        leader = {}
+
+        def analyze_with_short_deadline():
+            leader["result"] = service.analyze(
+                "I am exhausted.",
+                coach_transcript="You: I can't sleep.",
+                mode="llm",
+                deadline_at=deadline_after_ms(150),
+            )
+
+        thread = threading.Thread(target=analyze_with_short_deadline)
+        thread.start()
+        time.sleep(0.05)
+        follower = service.analyze(
+            "I am exhausted.",
+            coach_transcript="You: I can't sleep.",
+            mode="llm",
+            deadline_at=deadline_after_ms(2000),
+        )
+        thread.join()
+
+        assert leader["result"].skipped_stages == ["coach_modifier"]
+        assert service.single_flight.stats()["coalesced"] == 1
+        assert follower.partial is False
+        assert follower.coach_used is True
+
+    def test_followers_retry_a_leader_that_ran_out_of_time(self):
+        """Test that a leader's DeadlineExceeded is not shared with a follower that has time left."""
+        service = BurnoutAnalysisService(
+            backend=ReplayBackend(
+                {(MODEL_ID, PROMPT_VERSION, "I am exhausted."): [{"ee_score": 70}]},
+                model_id=MODEL_ID,
+                prompt_version=PROMPT_VERSION,
+                latency=0.2,
+            )
+        )
+        errors = []
+
+        def analyze_with_short_deadline():
+            try:
+                service.analyze("I am exhausted.", mode="llm", deadline_at=deadline_after_ms(100))
+            except DeadlineExceeded as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=analyze_with_short_deadline)
+        thread.start()
+        time.sleep(0.02)
+        follower = service.analyze("I am exhausted.", mode="llm", deadline_at=deadline_after_ms(2000))
+        thread.join()
+
+        assert len(errors) == 1
+        assert service.single_flight.stats()["coalesced"] == 1
+        assert follower.emotional_exhaustion.normalized_score == 70
+
+    def test_late_journal_extraction_raises(self):
+        """Test that llm mode raises DeadlineExceeded when the journal score cannot finish."""
+        service = BurnoutAnalysisService(
+            backend=ReplayBackend({}, model_id=MODEL_ID, prompt_version=PROMPT_VERSION, latency=0.5)
+        )
+
+        started = time.perf_counter()
+        with pytest.raises(DeadlineExceeded):
+            service.analyze("I am exhausted.", mode="llm", deadline_at=deadline_after_ms(50))
+        assert time.perf_counter() - started < 0.4
+
+    def test_deadline_expired_probe_does_not_wedge_the_breaker(self):
+        """Test that a half-open probe that runs out of time frees the probe slot."""
+        class DeadlineBackend(ExtractionBackend):
+            def __init__(self):
+                self.expire = True
+
+            def extract(self, texts, *, max_workers=1):
+                if self.expire:
+                    raise DeadlineExceeded("No capacity before the deadline.")
+                return [[{"ee_score": 60}] for _ in texts]
+
+        backend = DeadlineBackend()
+        service = BurnoutAnalysisService(
+            backend=backend,
+            breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.0),
+        )
+        service.breaker.record_failure()
+
+        with pytest.raises(DeadlineExceeded):
+            service._call_backend(["I am exhausted."])
+        assert service.breaker.stats()["state"] == "half_open"
+
+        backend.expire = False
+        service._call_backend(["I am exhausted."])
+        assert service.breaker.stats()["state"] == "closed"
+        assert service.breaker.stats()["rejected"] == 0
+
+
+class TestCumulativeBri:
+    """Test cumulative BRI timelines."""
+
+    def test_timeline_matches_sequential_updates_for_each_alpha(self):
+        """Test that the bulk timeline equals folding compute_cumulative_bri journal by journal."""
+        bri_series = [80.0, 20.0, 55.5, 100.0, 0.0, 42.0]
+
+        timelines = BurnoutAnalysisService.cumulative_bri_timeline(bri_series, (0.35, 0.1))
+
+        for alpha in (0.35, 0.1):
+            expected, cumulative = [], None
+            for bri in bri_series:
+                cumulative = BurnoutAnalysisService.compute_cumulative_bri(
+                    previous_cumulative_bri=cumulative,
+                    new_final_bri=bri,
+                    alpha=alpha,
+                )
+                expected.append(cumulative)
+            assert timelines[alpha] == expected
+        # The long horizon moves away from the zero starting point more slowly.
+        assert timelines[0.1][-1] < timelines[0.35][-1]
@@ -0,0 +1,86 @@
+"""Tests for the durable background job queue."""
+import time
+
+from services.job_queue import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JobQueue, JobStore
+
+
+def _wait_until_finished(queue, job_id):
+    while queue.get(job_id)["status"] in (JOB_QUEUED, JOB_RUNNING):
+        time.sleep(0.01)
+    return queue.get(job_id)
+
+
+def test_workers_record_results_and_failures():
+    """Test that handler results and exceptions end up on the job."""
+    def handler(kind, payload):
+        if payload["journal_id"] == "missing":
+            raise LookupError("Journal with ID missing not found")
+        return {"journal_id": payload["journal_id"], "overall_score": 42.0}
+
+    queue = JobQueue(JobStore(), handler, workers=2, poll_interval=0.05)
+    queue.start()
+    try:
+        ok = queue.submit("analyze_journal", {"journal_id": "j1"})
+        bad = queue.submit("analyze_journal", {"journal_id": "missing"})
+        assert ok["status"] == JOB_QUEUED
+
+        ok = _wait_until_finished(queue, ok["id"])
+        bad = _wait_until_finished(queue, bad["id"])
+    finally:
+        queue.stop(timeout=1.0)
+
+    assert ok["status"] == JOB_SUCCEEDED
+    assert ok["result"] == {"journal_id": "j1", "overall_score": 42.0}
+    assert bad["status"] == JOB_FAILED
+    assert "not found" in bad["error"]
+    assert queue.stats()["jobs"][JOB_SUCCEEDED] == 1
+
+
+def test_jobs_survive_restart(tmp_path):
+    """Test that queued jobs and jobs whose worker died are picked up by a new process."""
+    db_path = str(tmp_path / "jobs.db")
+    store = JobStore(db_path, lease_seconds=0.05)
+    queued = store.create("analyze_journal", {"journal_id": "j1"})
+    interrupted = store.create("analyze_journal", {"journal_id": "j2"})
+    assert store.claim_next("dead")["id"] == queued["id"]
+    assert store.claim_next("dead")["id"] == interrupted["id"]
+    store.complete(queued["id"], {"overall_score": 10.0})
+    time.sleep(0.1)
+
+    restarted = JobQueue(JobStore(db_path), lambda kind, payload: {"ok": True}, poll_interval=0.05)
+    restarted.start()
+    try:
+        job = _wait_until_finished(restarted, interrupted["id"])
+    finally:
+        restarted.stop(timeout=1.0)
+
+    assert job["status"] == JOB_SUCCEEDED
+    assert job["attempts"] == 2
+    assert restarted.get(queued["id"])["result"] == {"overall_score": 10.0}
+
+
+def test_claims_are_exclusive_and_live_leases_are_kept(tmp_path):
+    """Test that two processes never claim the same job and a live lease is not stolen."""
+    db_path = str(tmp_path / "jobs.db")
+    first, second = JobStore(db_path, lease_seconds=60), JobStore(db_path, lease_seconds=60)
+    job = first.create("analyze_journal", {"journal_id": "j1"})
+
+    assert first.claim_next("a")["id"] == job["id"]
+    assert second.claim_next("b") is None
+    assert second.complete(job["id"], {"ok": True}, owner="b") is False
+    assert first.heartbeat(job["id"], "a") is True
+    assert first.complete(job["id"], {"ok": True}, owner="a") is True
+
+
+def test_jobs_that_keep_dying_are_failed(tmp_path):
+    """Test that a job is failed instead of claimed again once it used its attempts."""
+    store = JobStore(str(tmp_path / "jobs.db"), lease_seconds=0.01, max_attempts=2)
+    job = store.create("analyze_journal", {"journal_id": "j1"})
+
+    assert store.claim_next("a")["attempts"] == 1
+    time.sleep(0.02)
+    assert store.claim_next("b")["attempts"] == 2
+    time.sleep(0.02)
+    assert store.claim_next("c") is None
+    assert store.get(job["id"])["status"] == JOB_FAILED
+    assert "2 attempts" in store.get(job["id"])["error"]
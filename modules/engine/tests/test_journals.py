@@ -1,11 +1,21 @@
 """Tests for journal endpoints and controllers."""
+import json
+from datetime import datetime, timezone
+
 import pytest
 from fastapi.testclient import TestClient
+from database import db
 from main import app
+from models.burnout import BatchAnalysisEntry
 from models.journal import JournalCreate, JournalUpdate
 from models.user import UserCreate
+from controllers import journal_controller
 from controllers.journal_controller import JournalController
 from controllers.user_controller import UserController
+from services.bri_series_cache import BriSeries, CumulativeBriCache
+from services.burnout_analysis import MODEL_ID, PROMPT_VERSION, BurnoutAnalysisService
+from services.extraction_backends import ReplayBackend
+from services.preprocessing import preprocess_text
 
 client = TestClient(app)
 
@@ -133,6 +143,65 @@ class TestJournalController:
         journal = JournalController.get_journal(created_journal.id)
         assert journal is None
 
+    def test_update_and_delete_missing_journal(self, test_user):
+        """Test that guarded writes report a missing journal instead of raising."""
+        journal_data = JournalCreate(
+            user_id=test_user.id,
+            title="Missing Test Journal",
+            content="Content"
+        )
+        created_journal = JournalController.create_journal(journal_data)
+        assert JournalController.delete_journal(created_journal.id) is True
+
+        assert JournalController.delete_journal(created_journal.id) is False
+        assert JournalController.update_journal(created_journal.id, JournalUpdate(title="Gone")) is None
+
+    def test_batch_cumulative_bri_chains_through_stored_days(self, monkeypatch):
+        """Test that a stored day between two batch days is part of the cumulative fold."""
+        stored = BriSeries([(datetime(2024, 1, 2, 9, tzinfo=timezone.utc).timestamp(), "2024-01-02", 80.0)])
+        monkeypatch.setattr(journal_controller, "_bri_series_cache", CumulativeBriCache())
+        monkeypatch.setattr(
+            JournalController, "_load_bri_series", staticmethod(lambda user_id, deadline_at=None: stored)
+        )
+        monkeypatch.setattr(journal_controller, "_analysis_service", BurnoutAnalysisService())
+        entries = [
+            BatchAnalysisEntry(journal_date="2024-01-03", texts=["I feel proud of my work."]),
+            BatchAnalysisEntry(journal_date="2024-01-01", texts=["I am exhausted and drained."]),
+        ]
+
+        response = JournalController.analyze_journal_batch(user_id="batch-user", entries=entries, mode="lexicon")
+
+        first, third = (item.result for item in response.results)
+        assert first.cumulative_bri == BurnoutAnalysisService.compute_cumulative_bri(
+            previous_cumulative_bri=None, new_final_bri=first.overall_score
+        )
+        # Sequential analysis of 2024-01-03 chains off the stored 2024-01-02, not 2024-01-01.
+        assert third.cumulative_bri == BurnoutAnalysisService.compute_cumulative_bri(
+            previous_cumulative_bri=80.0, new_final_bri=third.overall_score
+        )
+
+    def test_recompute_dry_run_counts_match_per_user_and_total(self, test_user):
+        """Test that a dry run reports would_update consistently and writes nothing."""
+        journals_col = db.collection("users").document(test_user.id).collection("journals")
+        for day, bri in ((1, 40.0), (2, 70.0)):
+            journals_col.document(f"2024-01-0{day}").set(
+                {"bri": bri, "createdAt": datetime(2024, 1, day, tzinfo=timezone.utc)}
+            )
+
+        response = JournalController.recompute_all_cumulative_bri(user_id=test_user.id, dry_run=True)
+
+        [result] = response.results
+        assert (result.updated, result.would_update) == (0, 2)
+        assert (response.updated, response.would_update) == (0, 2)
+        assert "cumulativeBri" not in journals_col.document("2024-01-02").get().to_dict()
+
+        response = JournalController.recompute_all_cumulative_bri(user_id=test_user.id)
+
+        assert (response.updated, response.would_update) == (2, 0)
+        for doc in journals_col.stream():
+            doc.reference.delete()
+
+
 class TestJournalEndpoints:
     """Test journal API endpoints."""
     
@@ -231,6 +300,62 @@ class TestJournalEndpoints:
         client.delete(f"/api/v1/journals/{journal1_id}")
         client.delete(f"/api/v1/journals/{journal2_id}")
     
+    def test_journals_by_user_endpoint_pages_with_cursor_and_fields(self, test_user_id):
+        """Test keyset pagination and field projection of GET /api/v1/journals/user/{user_id}."""
+        journal_ids = []
+        for i in range(3):
+            response = client.post("/api/v1/journals/", json={
+                "user_id": test_user_id,
+                "title": f"Paged Journal {i}",
+                "content": "A long body the list view does not need."
+            })
+            journal_ids.append(response.json()["id"])
+
+        url = f"/api/v1/journals/user/{test_user_id}"
+        first = client.get(url, params={"page_size": 2, "fields": "title,created_at"})
+        assert first.status_code == 200
+        assert len(first.json()) == 2
+        assert set(first.json()[0]) == {"id", "title", "created_at"}
+
+        second = client.get(url, params={"page_size": 2, "cursor": first.headers["X-Next-Cursor"]})
+        assert second.status_code == 200
+        assert "X-Next-Cursor" not in second.headers
+        paged_ids = [j["id"] for j in first.json() + second.json()]
+        assert sorted(paged_ids) == sorted(journal_ids)
+        # Newest first.
+        assert paged_ids == journal_ids[::-1]
+
+        assert client.get(url, params={"fields": "secret"}).status_code == 400
+        assert client.get(url, params={"cursor": "not-a-cursor"}).status_code == 400
+
+        # Cleanup
+        for journal_id in journal_ids:
+            client.delete(f"/api/v1/journals/{journal_id}")
+    
+    def test_export_journals_endpoint_streams_ndjson(self, test_user_id):
+        """Test GET /api/v1/journals/user/{user_id}/export returns one JSON line per journal."""
+        journal_ids = []
+        for i in range(2):
+            response = client.post("/api/v1/journals/", json={
+                "user_id": test_user_id,
+                "title": f"Export Journal {i}",
+                "content": f"Content {i}"
+            })
+            journal_ids.append(response.json()["id"])
+
+        response = client.get(f"/api/v1/journals/user/{test_user_id}/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["id"] for r in records] == journal_ids
+        assert records[0]["title"] == "Export Journal 0"
+        assert records[0]["burnout_analysis"] is None
+
+        # Cleanup
+        for journal_id in journal_ids:
+            client.delete(f"/api/v1/journals/{journal_id}")
+    
     def test_update_journal_endpoint(self, test_user_id):
         """Test PUT /api/v1/journals/{journal_id} endpoint."""
         # Create a journal first
@@ -271,3 +396,50 @@ class TestJournalEndpoints:
         # Verify journal is deleted
         get_response = client.get(f"/api/v1/journals/{journal_id}")
         assert get_response.status_code == 404
+
+    def test_analyze_text_endpoint_with_replayed_extractions(self, monkeypatch):
+        """Test POST /api/v1/journals/analyze offline using a replay backend."""
+        text = "I am completely exhausted by work."
+        cleaned_text, _ = preprocess_text(text)
+        backend = ReplayBackend(
+            {(MODEL_ID, PROMPT_VERSION, cleaned_text): [{"ee_score": 80, "dp_score": 40, "pa_score": 30}]},
+            model_id=MODEL_ID,
+            prompt_version=PROMPT_VERSION,
+        )
+        monkeypatch.setattr(
+            journal_controller,
+            "_analysis_service",
+            BurnoutAnalysisService(backend=backend),
+        )
+
+        response = client.post("/api/v1/journals/analyze", json={"text": text, "mode": "llm"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["analysis_mode"] == "llm"
+        assert data["emotional_exhaustion"]["normalized_score"] == 80
+        assert response.headers["X-Analysis-Cache"] == "miss"
+
+    def test_analyze_endpoint_returns_504_past_deadline_header(self, monkeypatch):
+        """Test that a journal extraction overrunning X-Request-Deadline-Ms responds 504."""
+        text = "I am completely exhausted by work."
+        cleaned_text, _ = preprocess_text(text)
+        backend = ReplayBackend(
+            {(MODEL_ID, PROMPT_VERSION, cleaned_text): [{"ee_score": 80}]},
+            model_id=MODEL_ID,
+            prompt_version=PROMPT_VERSION,
+            latency=0.5,
+        )
+        monkeypatch.setattr(
+            journal_controller,
+            "_analysis_service",
+            BurnoutAnalysisService(backend=backend),
+        )
+
+        response = client.post(
+            "/api/v1/journals/analyze",
+            json={"text": text, "mode": "llm"},
+            headers={"X-Request-Deadline-Ms": "50"},
+        )
+
+        assert response.status_code == 504
@@ -0,0 +1,54 @@
+"""Tests for the compiled lexicon matcher."""
+from services.lexicon_matcher import (
+    LEXICON_MATCHER,
+    LexiconMatcher,
+    CYNICAL,
+    PROTECTIVE,
+    STRESS,
+)
+
+
+class TestLexiconMatcher:
+    """Test compiled lexicon matching."""
+
+    def test_counts_per_category(self):
+        """Test that one term can count toward several categories."""
+        match = LEXICON_MATCHER.match("I feel stressed and it all seems pointless.")
+
+        assert match.counts["EE"] == 1
+        assert match.counts[STRESS] == 1
+        assert match.counts["DP"] == 1
+        assert match.counts[CYNICAL] == 1
+
+    def test_spans_and_word_boundaries(self):
+        """Test that spans point into the text and partial words do not match."""
+        text = "My family was supportive. I feel calm."
+        match = LEXICON_MATCHER.match(text)
+
+        assert [text[s.start:s.end] for s in match.spans] == ["family", "calm"]
+        assert match.distinct_terms(PROTECTIVE) == {"family", "calm"}
+
+    def test_longest_match_wins_within_a_category(self):
+        """Test that the longest term is matched and apostrophes are optional."""
+        matcher = LexiconMatcher({"a": ["don't care", "don't care anymore", "care"]})
+
+        match = matcher.match("I dont care anymore, I DON'T CARE.")
+
+        assert [s.term for s in match.spans] == ["dont care anymore", "dont care"]
+        assert match.counts == {"a": 2}
+
+    def test_categories_do_not_hide_each_others_terms(self):
+        """Test that a long match in one category leaves overlapping terms of others counted."""
+        cases = {
+            "I am under stress.": ("EE", STRESS),
+            "So much work stress lately.": ("EE", STRESS),
+            "The deadline pressure is real.": ("EE", STRESS),
+            "I am getting better at this.": ("PA", PROTECTIVE),
+        }
+        for text, categories in cases.items():
+            counts = LEXICON_MATCHER.counts(text)
+            for category in categories:
+                assert counts[category] >= 1, (text, category)
+
+        match = LEXICON_MATCHER.match("deadline pressure")
+        assert {"deadline pressure", "pressure"} <= {span.term for span in match.spans}
@@ -0,0 +1,151 @@
+"""Tests for client-side pacing of model calls."""
+import time
+
+import pytest
+from services.extraction_backends import ExtractionBackend
+from services.rate_limiter import (
+    AdaptiveConcurrencyLimiter,
+    DeadlineExceeded,
+    ExtractionGovernor,
+    RateLimitedBackend,
+    RetryPolicy,
+    TokenBucket,
+    is_retryable_error,
+    is_throttle_error,
+)
+
+
+class ThrottledError(Exception):
+    """Mimics a provider 429 response."""
+    status_code = 429
+
+
+class EchoBackend(ExtractionBackend):
+    """Returns a probe's value (e.g. slots in flight) once per text."""
+
+    def __init__(self, probe):
+        self.probe = probe
+
+    def extract(self, texts, *, max_workers=1):
+        value = self.probe()
+        return [[{"in_flight": value}] for _ in texts]
+
+
+def test_retries_throttled_calls_and_shrinks_concurrency():
+    """Test that 429s are retried with backoff and halve the concurrency limit."""
+    attempts = []
+
+    def flaky():
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise ThrottledError("429 RESOURCE_EXHAUSTED")
+        return "ok"
+
+    governor = ExtractionGovernor(
+        concurrency=AdaptiveConcurrencyLimiter(initial=8, cooldown=0.0),
+        retry=RetryPolicy(max_attempts=4, base_delay=0.01, max_delay=0.02),
+    )
+
+    assert governor.call(flaky) == "ok"
+    stats = governor.stats()
+    assert stats["retries"] == 2
+    assert stats["throttled"] == 2
+    assert stats["concurrency_limit"] == 2
+    assert stats["in_flight"] == 0
+
+
+def test_non_retryable_errors_fail_immediately():
+    """Test that application errors are not retried."""
+    calls = []
+
+    def broken():
+        calls.append(1)
+        raise ValueError("bad prompt")
+
+    governor = ExtractionGovernor(retry=RetryPolicy(max_attempts=5, base_delay=0.01))
+
+    with pytest.raises(ValueError):
+        governor.call(broken)
+    assert len(calls) == 1
+
+
+def test_backoff_respects_deadline():
+    """Test that retries stop once the backoff would pass the call deadline."""
+    calls = []
+
+    def always_throttled():
+        calls.append(1)
+        raise ThrottledError("rate limit")
+
+    governor = ExtractionGovernor(retry=RetryPolicy(max_attempts=50, base_delay=0.05, max_delay=0.05))
+    started = time.monotonic()
+
+    with pytest.raises(ThrottledError):
+        governor.call(always_throttled, deadline_at=started + 0.2)
+    assert time.monotonic() - started < 0.3
+    assert len(calls) < 50
+
+
+def test_token_bucket_paces_and_honours_deadline():
+    """Test that the bucket allows a burst, then paces or refuses past the deadline."""
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    assert bucket.acquire()
+    assert bucket.acquire()
+    started = time.monotonic()
+    assert bucket.acquire()
+    assert time.monotonic() - started >= 0.08
+    assert not bucket.acquire(deadline_at=time.monotonic() + 0.01)
+
+    governor = ExtractionGovernor(bucket=TokenBucket(rate=1, capacity=1))
+    governor.call(lambda: None)
+    with pytest.raises(DeadlineExceeded):
+        governor.call(lambda: None, deadline_at=time.monotonic() + 0.05)
+
+
+def test_token_bucket_charges_costs_above_capacity_in_installments():
+    """Test that a cost larger than the burst capacity is paced for its full amount."""
+    bucket = TokenBucket(rate=20, capacity=2)
+    started = time.monotonic()
+
+    assert bucket.acquire(6)
+    assert time.monotonic() - started >= 0.18
+    assert not bucket.acquire(10, deadline_at=time.monotonic() + 0.1)
+
+
+def test_multi_document_calls_take_one_slot_per_worker():
+    """Test that a parallel extract() occupies as many concurrency slots as it runs requests."""
+    limiter = AdaptiveConcurrencyLimiter(initial=4)
+    governor = ExtractionGovernor(concurrency=limiter)
+    backend = RateLimitedBackend(EchoBackend(lambda: limiter.in_flight), governor)
+
+    assert backend.extract(["a", "b", "c"], max_workers=8) == [[{"in_flight": 3}]] * 3
+    assert backend.extract(["a", "b"], max_workers=1) == [[{"in_flight": 1}]] * 2
+    assert limiter.acquire(slots=10) == 4
+    assert limiter.acquire(deadline_at=time.monotonic() + 0.01) == 0
+    assert limiter.in_flight == 4
+
+
+def test_status_code_markers_match_whole_numbers_only():
+    """Test that numbers merely containing a status code are not treated as one."""
+    assert is_retryable_error(RuntimeError("HTTP 503 Service Unavailable"))
+    assert is_retryable_error(RuntimeError("upstream returned 500"))
+    assert not is_retryable_error(ValueError("prompt exceeds 5000 characters"))
+    assert not is_throttle_error(ValueError("request id 14290"))
+
+
+def test_long_texts_cost_one_token_per_model_request():
+    """Test that the bucket is charged for every request LangExtract splits a text into."""
+    charged = []
+
+    class RecordingGovernor(ExtractionGovernor):
+        def call(self, func, *, cost=1.0, slots=1, deadline_at=None):
+            charged.append((cost, slots))
+            return func()
+
+    backend = RateLimitedBackend(EchoBackend(lambda: 0), RecordingGovernor(), max_char_buffer=100)
+
+    backend.extract(["x" * 250], max_workers=1)
+    backend.extract(["x" * 250, "short"], max_workers=8)
+
+    assert charged == [(3, 1), (4, 4)]
@@ -0,0 +1,86 @@
+"""Tests for priority scheduling of model calls."""
+import threading
+import time
+
+import pytest
+from services.deadline import DeadlineExceeded, deadline_after_ms, deadline_scope
+from services.extraction_backends import ExtractionBackend
+from services.scheduler import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    PriorityScheduler,
+    ScheduledBackend,
+    priority_scope,
+)
+
+
+def _admit_in_background(scheduler, order, priority, tenant):
+    def run():
+        assert scheduler.acquire(priority, tenant=tenant)
+        order.append((priority, tenant))
+        scheduler.release()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def _wait_for_queued(scheduler, count):
+    while sum(c["queued"] for c in scheduler.stats()["classes"].values()) < count:
+        time.sleep(0.005)
+
+
+def test_interactive_calls_go_before_queued_bulk_work():
+    """Test that an interactive call overtakes a bulk backlog and bulk tenants alternate."""
+    scheduler = PriorityScheduler(capacity=1, interactive_reserve=0)
+    assert scheduler.acquire(PRIORITY_BULK, tenant="busy")
+    order = []
+    threads = []
+    for tenant in ("busy", "busy", "busy"):
+        threads.append(_admit_in_background(scheduler, order, PRIORITY_BULK, tenant))
+        _wait_for_queued(scheduler, len(threads))
+    threads.append(_admit_in_background(scheduler, order, PRIORITY_BULK, "quiet"))
+    _wait_for_queued(scheduler, 4)
+    threads.append(_admit_in_background(scheduler, order, PRIORITY_INTERACTIVE, "saver"))
+    _wait_for_queued(scheduler, 5)
+
+    scheduler.release()
+    for thread in threads:
+        thread.join()
+
+    assert order[0] == (PRIORITY_INTERACTIVE, "saver")
+    # "quiet" is served after one "busy" call, not after the whole backlog.
+    assert order[1:3] == [(PRIORITY_BULK, "busy"), (PRIORITY_BULK, "quiet")]
+    stats = scheduler.stats()
+    assert stats["in_use"] == 0
+    assert stats["classes"][PRIORITY_BULK]["admitted"] == 5
+    assert stats["classes"][PRIORITY_INTERACTIVE]["max_wait_ms"] > 0
+
+
+def test_bulk_work_never_takes_reserved_slots():
+    """Test that bulk calls queue once only the interactive reserve is left."""
+    scheduler = PriorityScheduler(capacity=2, interactive_reserve=1)
+    assert scheduler.acquire(PRIORITY_BULK, tenant="a")
+
+    assert scheduler.acquire(PRIORITY_BULK, tenant="b", deadline_at=deadline_after_ms(20)) is False
+    assert scheduler.acquire(PRIORITY_INTERACTIVE, deadline_at=deadline_after_ms(20)) is True
+    assert scheduler.stats()["classes"][PRIORITY_BULK]["timed_out"] == 1
+
+
+def test_scheduled_backend_uses_context_priority_and_deadline():
+    """Test that the wrapper admits calls in the caller's class and honours its deadline."""
+    class EchoBackend(ExtractionBackend):
+        def extract(self, texts, *, max_workers=1):
+            return [[{"text": text}] for text in texts]
+
+    scheduler = PriorityScheduler(capacity=2, interactive_reserve=1)
+    backend = ScheduledBackend(EchoBackend(), scheduler)
+
+    with priority_scope(PRIORITY_BULK, tenant="user-1"):
+        assert backend.extract(["a"]) == [[{"text": "a"}]]
+    assert backend.stats()["scheduler"]["classes"][PRIORITY_BULK]["admitted"] == 1
+
+    assert scheduler.acquire(PRIORITY_BULK, tenant="user-2")
+    with priority_scope(PRIORITY_BULK, tenant="user-1"), deadline_scope(deadline_after_ms(20)):
+        with pytest.raises(DeadlineExceeded):
+            backend.extract(["b"])
@@ -1,6 +1,11 @@
 """Tests for user endpoints and controllers."""
+import asyncio
+from datetime import datetime
+from urllib.parse import quote
+
 import pytest
 from fastapi.testclient import TestClient
+from database import db, USERS_COLLECTION, USER_EMAILS_COLLECTION
 from main import app
 from models.user import UserCreate, UserUpdate
 from controllers.user_controller import UserController
@@ -95,6 +100,61 @@ class TestUserController:
         user = UserController.get_user(created_user.id)
         assert user is None
 
+    def test_email_index_follows_updates_and_deletes(self):
+        """Test that an email is looked up via the index and freed when changed or deleted."""
+        user = UserController.create_user(UserCreate(email="indexold@example.com", name="Index"))
+        assert UserController.get_user_by_email("indexold@example.com").id == user.id
+
+        UserController.update_user(user.id, UserUpdate(email="indexnew@example.com"))
+        assert UserController.get_user_by_email("indexold@example.com") is None
+        assert UserController.get_user_by_email("indexnew@example.com").id == user.id
+        other = UserController.create_user(UserCreate(email="indexold@example.com", name="Other"))
+        with pytest.raises(ValueError):
+            UserController.update_user(other.id, UserUpdate(email="indexnew@example.com"))
+
+        UserController.delete_user(user.id)
+        assert UserController.get_user_by_email("indexnew@example.com") is None
+        UserController.delete_user(other.id)
+
+    def test_email_change_keeps_another_users_index_entry(self):
+        """Test that changing an email only removes the old index entry if it belongs to the user."""
+        user = UserController.create_user(UserCreate(email="sharedold@example.com", name="Index"))
+        old_entry = db.collection(USER_EMAILS_COLLECTION).document(quote("sharedold@example.com", safe="@"))
+        old_entry.set({"uid": "someone-else"})
+
+        UserController.update_user(user.id, UserUpdate(email="sharednew@example.com"))
+
+        assert old_entry.get().get("uid") == "someone-else"
+        assert UserController.get_user_by_email("sharednew@example.com").id == user.id
+        old_entry.delete()
+        UserController.delete_user(user.id)
+
+    def test_backfill_indexes_users_written_without_an_entry(self):
+        """Test that users written outside this API become visible to email lookups after a backfill."""
+        now = datetime.utcnow()
+        user_ref = db.collection(USERS_COLLECTION).document()
+        user_ref.set({"email": "nextjs@example.com", "name": "Next", "created_at": now, "updated_at": now})
+        assert UserController.get_user_by_email("nextjs@example.com") is None
+
+        response = client.post("/api/v1/users/email-index/backfill")
+
+        assert response.status_code == 200
+        assert response.json()["created"] >= 1
+        assert UserController.get_user_by_email("nextjs@example.com").id == user_ref.id
+        UserController.delete_user(user_ref.id)
+
+    def test_async_methods_share_data_with_sync_methods(self):
+        """Test that the AsyncClient-backed methods see and change the same documents."""
+        async def scenario():
+            created = await UserController.create_user_async(UserCreate(email="asynctest@example.com", name="Async"))
+            assert UserController.get_user(created.id).email == "asynctest@example.com"
+            updated = await UserController.update_user_async(created.id, UserUpdate(name="Async Updated"))
+            assert updated.name == "Async Updated"
+            assert await UserController.delete_user_async(created.id) is True
+            assert await UserController.get_user_async(created.id) is None
+
+        asyncio.run(scenario())
+
 class TestUserEndpoints:
     """Test user API endpoints."""
     
@@ -146,6 +206,18 @@ class TestUserEndpoints:
         response = client.get("/api/v1/users/")
         assert response.status_code == 200
         assert isinstance(response.json(), list)
+
+    def test_unpaginated_user_list_includes_users_without_created_at(self):
+        """Test that users written with createdAt (as by the Next.js app) are listed without paging."""
+        user_ref = db.collection(USERS_COLLECTION).document()
+        user_ref.set({"email": "camel@example.com", "name": "Camel", "createdAt": datetime.utcnow()})
+
+        response = client.get("/api/v1/users/")
+
+        assert response.status_code == 200
+        assert user_ref.id in [user["id"] for user in response.json()]
+        assert "X-Next-Cursor" not in response.headers
+        user_ref.delete()
     
     def test_update_user_endpoint(self):
         """Test PUT /api/v1/users/{user_id} endpoint."""